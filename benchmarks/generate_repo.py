@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""Generate a deterministic synthetic repository for validator benchmarks.
+
+The generated tree has the layout the validators expect. It starts from a copy of the
+real repository's seed inputs (contracts, docs, evidence, env templates, workflows)
+and adds scale on top:
+
+- MCP fixture packs with several versions each, all declared in `mcp.capabilities.get`
+  and registered as billing providers in `billing-provider-baselines.json`, so the
+  canonical handoff and alias parity validators check them like real tools
+- a `legacy-alias-parity` rows file with one passing row per synthetic tool, cycling
+  through the response_shape, value_equivalence and structural_diff checks
+- markdown docs with dense relative cross-links, anchors, images and fenced examples
+- a feature catalog with thousands of modules and dependency edges
+- QA evidence files following the P07 naming convention
+
+Output depends only on the scale preset, the seed and the seed inputs in this
+repository, so two runs with the same arguments produce byte-identical trees.
+A `benchmark-manifest.json` at the tree root records what was generated.
+
+Usage:
+  python3 benchmarks/generate_repo.py OUT_DIR [--scale small|medium|full] [--seed N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+SOURCE_ROOT = Path(__file__).resolve().parents[1]
+MANIFEST_NAME = "benchmark-manifest.json"
+GENERATOR_VERSION = 2
+
+# Seed inputs copied verbatim from this repository.
+SEED_PATHS = (
+    "README.md",
+    "CONTRIBUTING.md",
+    ".env.example",
+    ".env.live.example",
+    ".github",
+    "docs",
+    "tests/contracts",
+    "tests/e2e",
+    "tests/evidence/p05",
+    "tests/evidence/p07",
+)
+
+# Directories scanned by validate-doc-links.py besides the root README/CONTRIBUTING.
+DOC_LINK_SCOPES = ("docs", ".github", "tests/evidence")
+
+PARITY_ROWS_PATH = (
+    Path("tests") / "contracts" / "fixtures" / "mcp" / "legacy-alias-parity" / "1.0" / "parity.rows.json"
+)
+BASELINES_PATH = Path("tests") / "contracts" / "live-smoke" / "billing-provider-baselines.json"
+PARITY_CHECKS = ("response_shape", "value_equivalence", "structural_diff")
+# Per-row tolerances of the value_equivalence rows; the legacy responses stay inside them.
+VALUE_TOLERANCES = {"canonical.infraTotal": {"abs": 0.01}, "canonical.cudPct": {"pct": 0.5}}
+
+BILLING_TOOLS = (
+    "billing.openops.ingest",
+    "billing.aws.ingest",
+    "billing.azure.ingest",
+    "billing.gcp.ingest",
+)
+
+
+@dataclass(frozen=True)
+class Scale:
+    mcp_packs: int
+    versions_per_pack: int
+    parity_rows: int  # canonicalTool is unique per row: at most one row per synthetic tool
+    docs: int
+    links_per_doc: int
+    modules: int
+    evidence_files: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(
+        mcp_packs=100,
+        versions_per_pack=3,
+        parity_rows=100,
+        docs=50,
+        links_per_doc=25,
+        modules=50,
+        evidence_files=20,
+    ),
+    "medium": Scale(
+        mcp_packs=1_000,
+        versions_per_pack=3,
+        parity_rows=1_000,
+        docs=500,
+        links_per_doc=25,
+        modules=500,
+        evidence_files=200,
+    ),
+    "full": Scale(
+        mcp_packs=10_000,
+        versions_per_pack=3,
+        parity_rows=10_000,
+        docs=5_000,
+        links_per_doc=25,
+        modules=5_000,
+        evidence_files=2_000,
+    ),
+}
+
+
+def write_json(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def copy_seed(out: Path) -> None:
+    for rel in SEED_PATHS:
+        source = SOURCE_ROOT / rel
+        target = out / rel
+        if source.is_dir():
+            shutil.copytree(source, target, ignore=shutil.ignore_patterns("artifacts"))
+        elif source.is_file():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, target)
+
+
+def synthetic_tool(index: int) -> str:
+    return f"synthetic.tool-{index:05d}"
+
+
+def pack_versions(scale: Scale) -> list[str]:
+    return [f"1.{minor}" for minor in range(scale.versions_per_pack)]
+
+
+def generate_mcp_packs(out: Path, scale: Scale, rng: random.Random) -> None:
+    mcp_root = out / "tests" / "contracts" / "fixtures" / "mcp"
+    for index in range(scale.mcp_packs):
+        tool = synthetic_tool(index)
+        for version in pack_versions(scale):
+            version_root = mcp_root / tool / version
+            version_root.mkdir(parents=True, exist_ok=True)
+            run_id = f"00000000-0000-4000-8000-{index:06d}{version.replace('.', ''):0>6}"
+            request = {
+                "integrationRunId": run_id,
+                "startDate": "2026-01-01",
+                "endDate": "2026-01-31",
+                "currency": "USD",
+                "mappingProfile": f"synthetic-{index:05d}",
+                "authMode": "read-only",
+            }
+            write_json(version_root / "request.valid.json", request)
+            write_json(version_root / "request.invalid.json", {**request, "startDate": "2026-02-31"})
+            write_json(
+                version_root / "response.expected.json",
+                {
+                    "integrationRunId": run_id,
+                    "providerAdapterId": f"synthetic-{index:05d}",
+                    "scope": {"startDate": "2026-01-01", "endDate": "2026-01-31", "currency": "USD"},
+                    "canonical": {
+                        "infraTotal": rng.randint(100, 100_000),
+                        "cudPct": rng.randint(0, 100),
+                        "budgetCap": round(rng.uniform(100, 200_000), 2),
+                        "nRef": rng.randint(1, 12),
+                    },
+                    "provenance": {
+                        "sourceVersion": f"synthetic-readonly-v{version}",
+                        "coveragePct": round(rng.uniform(50, 100), 1),
+                        "mappingConfidence": rng.choice(("low", "medium", "high")),
+                        "warnings": [],
+                    },
+                },
+            )
+            notes = f"# {tool} {version}\n\nSynthetic benchmark pack.\n"
+            (version_root / "notes.md").write_text(notes, encoding="utf-8")
+
+    baselines_path = out / BASELINES_PATH
+    baselines = json.loads(baselines_path.read_text(encoding="utf-8"))
+    baselines["providers"].extend(
+        {
+            "fixtureToolName": synthetic_tool(index),
+            "adapterId": f"synthetic-{index:05d}",
+            "providerLabel": f"Synthetic {index:05d}",
+            "providerScopeKey": "workspaceScope",
+            "sourceVersionPrefix": "synthetic-readonly-",
+            "requiredWarnings": [],
+        }
+        for index in range(scale.mcp_packs)
+    )
+    write_json(baselines_path, baselines)
+
+    capabilities_path = mcp_root / "mcp.capabilities.get" / "2.0" / "response.expected.json"
+    capabilities = json.loads(capabilities_path.read_text(encoding="utf-8"))
+    capabilities["toolNamespaces"].append(
+        {
+            "namespace": "synthetic",
+            "version": "1.0",
+            "tools": [synthetic_tool(index) for index in range(scale.mcp_packs)],
+            "ownerTeam": "benchmarks",
+            "stability": "synthetic",
+        }
+    )
+    write_json(capabilities_path, capabilities)
+
+
+def legacy_response(expected: dict[str, Any], parity_check: str) -> dict[str, Any]:
+    """The response recorded through the alias: equal within tolerance, or same-shaped."""
+    legacy = json.loads(json.dumps(expected))
+    canonical = legacy["canonical"]
+    if parity_check == "value_equivalence":
+        canonical["infraTotal"] = round(canonical["infraTotal"] + 0.004, 3)
+        canonical["cudPct"] = canonical["cudPct"] * 1.002
+    else:
+        for key in canonical:
+            canonical[key] = canonical[key] + 1
+        legacy["provenance"]["mappingConfidence"] = "low"
+        legacy["provenance"]["sourceVersion"] += "-legacy"
+    return legacy
+
+
+def generate_parity_rows(out: Path, scale: Scale) -> int:
+    """Append one row per synthetic tool; return how many legacy responses were written."""
+    mcp_root = out / "tests" / "contracts" / "fixtures" / "mcp"
+    parity_path = out / PARITY_ROWS_PATH
+    payload = json.loads(parity_path.read_text(encoding="utf-8"))
+    rows: list[dict[str, Any]] = list(payload["rows"])
+    versions = pack_versions(scale)
+    legacy_files = 0
+    for index in range(min(scale.parity_rows, scale.mcp_packs)):
+        # Each row names its own synthetic tool (canonicalTool must be unique) and passes,
+        # so fixture loading, shape checks and the comparisons are what gets timed.
+        tool = synthetic_tool(index)
+        version = versions[index % len(versions)]
+        parity_check = PARITY_CHECKS[index % len(PARITY_CHECKS)]
+        row: dict[str, Any] = {
+            "legacyAlias": f"finops.{tool}",
+            "canonicalTool": tool,
+            "requestFixture": f"../../{tool}/{version}/request.valid.json",
+            "expectedResponseFixture": f"../../{tool}/{version}/response.expected.json",
+            "parityCheck": parity_check,
+        }
+        if parity_check != "response_shape":
+            version_root = mcp_root / tool / version
+            expected = json.loads((version_root / "response.expected.json").read_text(encoding="utf-8"))
+            write_json(version_root / "response.legacy.json", legacy_response(expected, parity_check))
+            row["legacyResponseFixture"] = f"../../{tool}/{version}/response.legacy.json"
+            legacy_files += 1
+            if parity_check == "value_equivalence":
+                row["tolerances"] = VALUE_TOLERANCES
+        rows.append(row)
+    payload["rows"] = rows
+    write_json(parity_path, payload)
+    return legacy_files
+
+
+def doc_path(index: int) -> str:
+    return f"docs/synthetic/area-{index % 50:02d}/doc-{index:05d}.md"
+
+
+def relative_link(source: str, target: str) -> str:
+    source_parts = source.split("/")[:-1]
+    target_parts = target.split("/")
+    common = 0
+    limit = min(len(source_parts), len(target_parts) - 1)
+    while common < limit and source_parts[common] == target_parts[common]:
+        common += 1
+    return "/".join([".."] * (len(source_parts) - common) + target_parts[common:])
+
+
+def generate_docs(out: Path, scale: Scale, rng: random.Random) -> int:
+    asset = out / "docs" / "synthetic" / "assets" / "diagram.svg"
+    asset.parent.mkdir(parents=True, exist_ok=True)
+    asset.write_text('<svg xmlns="http://www.w3.org/2000/svg"/>\n', encoding="utf-8")
+
+    links = 0
+    for index in range(scale.docs):
+        source = doc_path(index)
+        lines = [f"# Synthetic doc {index}", ""]
+        for section in range(5):
+            lines.extend([f"## Section {section}", ""])
+            for _ in range(scale.links_per_doc // 5):
+                target_index = rng.randrange(scale.docs)
+                target = relative_link(source, doc_path(target_index))
+                anchor = f"#section-{rng.randrange(5)}" if rng.random() < 0.3 else ""
+                lines.append(f"- See [doc {target_index}]({target}{anchor}) for details.")
+                links += 1
+            lines.append(f"![diagram]({relative_link(source, 'docs/synthetic/assets/diagram.svg')})")
+            lines.append("External reference: [spec](https://example.com/spec) and [top](#section-0).")
+            lines.append("")
+            links += 1
+        lines.extend(["```markdown", f"[example]({relative_link(source, doc_path(0))})", "```", ""])
+        links += 1
+        (out / source).parent.mkdir(parents=True, exist_ok=True)
+        (out / source).write_text("\n".join(lines), encoding="utf-8")
+    return links
+
+
+def generate_catalog(out: Path, scale: Scale, rng: random.Random) -> None:
+    modules: list[dict[str, Any]] = []
+    for index in range(scale.modules):
+        module_id = f"synthetic-module-{index:05d}"
+        module_path = f"packages/synthetic/{module_id}"
+        (out / module_path).mkdir(parents=True, exist_ok=True)
+        (out / module_path / "README.md").write_text(f"# {module_id}\n", encoding="utf-8")
+        dependencies = sorted({f"synthetic-module-{rng.randrange(index):05d}" for _ in range(min(index, 3))})
+        modules.append(
+            {
+                "id": module_id,
+                "path": module_path,
+                "dependsOn": dependencies,
+                "optional": index % 7 == 0,
+                "status": "active",
+            }
+        )
+    write_json(
+        out / "src" / "features" / "feature-catalog.json",
+        {"version": "0.0.0-synthetic", "updatedAt": "2026-01-01", "modules": modules},
+    )
+
+
+EVIDENCE_TEMPLATE = """# Synthetic evidence {index}
+
+## Scope
+
+Synthetic benchmark evidence file.
+
+## Commands
+
+- `npm run validate`
+
+## Outcome
+
+- Synthetic outcome.
+
+## Proof Artifacts
+
+- log: `[validate] OK: synthetic`
+
+## Evidence Checklist
+
+- [x] Fail evidence captured or not applicable
+- [x] Fix evidence captured or not applicable
+- [x] Retest evidence captured or not applicable
+- [x] Screenshot privacy review completed or no screenshots attached
+- Retention class: routine-30d
+"""
+
+
+def generate_evidence(out: Path, scale: Scale) -> None:
+    evidence_root = out / "tests" / "evidence" / "p07"
+    for index in range(scale.evidence_files):
+        name = f"f2-task-{index % 1000:03d}-synthetic-{index:05d}.md"
+        (evidence_root / name).write_text(EVIDENCE_TEMPLATE.format(index=index), encoding="utf-8")
+
+
+def handoff_files(out: Path, tools: tuple[str, ...]) -> int:
+    """Request and response files the handoff validator reads for the seed billing packs."""
+    mcp_root = out / "tests" / "contracts" / "fixtures" / "mcp"
+    return sum(
+        1
+        for tool in tools
+        for path in (mcp_root / tool).glob("*/*.json")
+        if path.name.startswith("request.") or path.name == "response.expected.json"
+    )
+
+
+def count_files(root: Path) -> int:
+    return sum(1 for path in root.rglob("*") if path.is_file())
+
+
+def generate(out: Path, scale_name: str, seed: int) -> dict[str, Any]:
+    scale = SCALES[scale_name]
+    if out.exists():
+        shutil.rmtree(out)
+    out.mkdir(parents=True)
+
+    copy_seed(out)
+    rng = random.Random(seed)
+    generate_mcp_packs(out, scale, rng)
+    legacy_files = generate_parity_rows(out, scale)
+    links = generate_docs(out, scale, rng)
+    generate_catalog(out, scale, rng)
+    generate_evidence(out, scale)
+
+    fixture_files = count_files(out / "tests" / "contracts" / "fixtures")
+    markdown_files = sum(1 for name in ("README.md", "CONTRIBUTING.md") if (out / name).is_file()) + sum(
+        len(list((out / scope).rglob("*.md"))) for scope in DOC_LINK_SCOPES
+    )
+    evidence_files = len(list((out / "tests" / "evidence").glob("p0[57]/*.md")))
+    parity_rows = len(json.loads((out / PARITY_ROWS_PATH).read_text(encoding="utf-8"))["rows"])
+
+    manifest = {
+        "generatorVersion": GENERATOR_VERSION,
+        "scale": scale_name,
+        "seed": seed,
+        "parameters": asdict(scale),
+        # Files each validator reads, used for files/s in benchmark results.
+        "inputs": {
+            "feature-catalog": {"files": 1, "items": scale.modules},
+            "fixture-coverage": {"files": fixture_files, "items": scale.mcp_packs * scale.versions_per_pack},
+            "legacy-alias-parity": {
+                "files": 1 + 2 * parity_rows + legacy_files,
+                "items": parity_rows,
+            },
+            "billing-canonical-handoff": {
+                "files": handoff_files(out, BILLING_TOOLS) + 3 * scale.mcp_packs * scale.versions_per_pack,
+                "items": len(BILLING_TOOLS) + scale.mcp_packs,
+            },
+            "billing-live-readiness": {"files": 6, "items": 1},
+            "qa-evidence-policy": {"files": evidence_files, "items": evidence_files},
+            "docs-links": {"files": markdown_files, "items": links},
+        },
+    }
+    write_json(out / MANIFEST_NAME, manifest)
+    return manifest
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic repository for validator benchmarks")
+    parser.add_argument("out", help="Output directory (replaced if it exists)")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Size preset (default: small)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    manifest = generate(Path(args.out).resolve(), args.scale, args.seed)
+    print(f"[bench-generate] OK: scale={manifest['scale']} seed={manifest['seed']} -> {args.out}")
+    for name, inputs in manifest["inputs"].items():
+        print(f"- {name}: {inputs['files']} file(s), {inputs['items']} item(s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Adversarial scaling benchmark for the markdown link scanner.
+
+Each case builds one pathological line (or document) at several sizes and times
+`validation.markdown.iter_links` plus the heading-anchor pass `iter_anchors` on it.
+Both must stay linear, so the time per character at the largest size may not exceed
+`--max-growth` times that at the smallest size. The script exits 1 otherwise.
+
+For comparison, the regex the doc-link validator used before the scanner
+(`!?\\[[^\\]]*\\]\\(([^)]+)\\)`) is timed on sizes up to `--legacy-max-size`. Larger
+sizes are skipped because that regex is quadratic on the bracket-heavy inputs.
+
+Usage:
+  python3 benchmarks/markdown_adversarial.py [--sizes 5000,20000,100000,1000000] [--json OUT]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from validation.markdown import iter_anchors, iter_links  # noqa: E402
+
+LEGACY_LINK_PATTERN = re.compile(r"!?\[[^\]]*\]\(([^)]+)\)")
+
+
+def _repeat(unit: str, size: int) -> str:
+    return unit * max(1, size // len(unit))
+
+
+def _backtick_runs(size: int) -> str:
+    # Runs of increasing length with no matching closer: the worst case for code spans.
+    parts: list[str] = []
+    total = 0
+    length = 1
+    while total < size:
+        part = "`" * length + "[x](y)"
+        parts.append(part)
+        total += len(part)
+        length = length % 64 + 1
+    return "".join(parts)
+
+
+def _table(size: int) -> str:
+    header = "| name | link | note |\n| --- | --- | --- |\n"
+    row = "| item | [doc](docs/item.md) | `code` and <b>bold</b> |\n"
+    return header + _repeat(row, size)
+
+
+CASES: dict[str, Callable[[int], str]] = {
+    "open-brackets": lambda size: _repeat("[", size),
+    "unclosed-link-destinations": lambda size: _repeat("[a](", size),
+    "bracket-pairs-without-destination": lambda size: _repeat("[a]", size),
+    "nested-image-openers": lambda size: _repeat("![", size // 2) + "x" + _repeat("](y)", size // 2),
+    "unclosed-html-tags": lambda size: _repeat("<a ", size),
+    "unclosed-attribute-quotes": lambda size: _repeat('<a href="x ', size) + ">",
+    "backtick-runs": _backtick_runs,
+    "escaped-brackets": lambda size: _repeat("\\[a\\](b)", size),
+    "comment-openers": lambda size: _repeat("<!-- [a](b) ", size),
+    "link-table": _table,
+    "heading-padding": lambda size: "# " + " " * size + "x #",
+    "heading-emphasis": lambda size: "# " + _repeat("_a ", size),
+    "heading-closing-hashes": lambda size: "# title" + "#" * size,
+}
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _scan(text: str) -> int:
+    lines = text.splitlines(keepends=True)
+    anchors = sum(1 for _ in iter_anchors(lines))
+    return anchors + sum(1 for _ in iter_links(lines))
+
+
+def _legacy_scan(text: str) -> int:
+    return sum(1 for line in text.splitlines() for _ in LEGACY_LINK_PATTERN.finditer(line))
+
+
+def run(sizes: list[int], repeat: int, legacy_max_size: int, max_growth: float) -> tuple[list[dict], bool]:
+    results: list[dict] = []
+    ok = True
+    for name, build in CASES.items():
+        rows = []
+        for size in sizes:
+            text = build(size)
+            links = _scan(text)
+            seconds = _time(lambda: _scan(text), repeat)
+            legacy = _time(lambda: _legacy_scan(text), 1) if size <= legacy_max_size else None
+            rows.append({"size": len(text), "links": links, "seconds": seconds, "legacySeconds": legacy})
+
+        # Very small timings are dominated by fixed overhead, so floor the baseline.
+        first, last = rows[0], rows[-1]
+        base_rate = max(first["seconds"], 1e-4) / first["size"]
+        growth = (last["seconds"] / last["size"]) / base_rate
+        linear = growth <= max_growth
+        ok = ok and linear
+        results.append({"case": name, "growth": growth, "linear": linear, "sizes": rows})
+
+        status = "ok" if linear else "SUPERLINEAR"
+        print(f"{name} ({status}, per-char growth x{growth:.2f})")
+        for row in rows:
+            legacy = "skipped" if row["legacySeconds"] is None else f"{row['legacySeconds'] * 1e3:10.2f}ms"
+            print(
+                f"  {row['size']:>10,} chars  {row['links']:>8,} found  "
+                f"scanner {row['seconds'] * 1e3:10.2f}ms  legacy regex {legacy}"
+            )
+    return results, ok
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check that the markdown link scanner scales linearly")
+    parser.add_argument("--sizes", default="5000,20000,100000,1000000", help="Comma-separated input sizes in chars")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing for the scanner")
+    parser.add_argument(
+        "--legacy-max-size",
+        type=int,
+        default=20000,
+        help="Largest input on which to time the legacy regex (it is quadratic)",
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=3.0,
+        help="Fail when time per char grows more than this factor from smallest to largest size",
+    )
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    results, ok = run(sizes, args.repeat, args.legacy_max_size, args.max_growth)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"maxGrowth": args.max_growth, "cases": results}, indent=2) + "\n")
+    if not ok:
+        print("markdown scanner: superlinear scaling detected", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Run the validators against a synthetic repository and compare results.
+
+`run` generates (or reuses) a synthetic tree with `generate_repo.py` and runs each
+validator in a fresh child process with `FICECAL_VALIDATE_ROOT` pointing at it. Each
+validator runs with `--no-cache --collect-errors --max-errors 0 --format json`, so the
+whole tree is validated every time. Per validator it records:
+
+- wall time of the child process and the validator's own in-process time (median of
+  `--repeat` runs, from `time.perf_counter_ns`)
+- peak RSS of the child process (VmHWM, falling back to `ru_maxrss`)
+- files/s and items/s, using the input counts in the tree's benchmark manifest
+- the outcome and violation count, so behavior changes show up next to timing changes
+
+`compare` reads two result files and exits 1 when a validator got slower or used more
+memory than the threshold allows, or when its outcome changed.
+
+Usage:
+  python3 benchmarks/run_benchmarks.py run [--scale small|medium|full] [--output FILE]
+  python3 benchmarks/run_benchmarks.py compare BASELINE CURRENT [--threshold 0.15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from generate_repo import GENERATOR_VERSION, MANIFEST_NAME, SCALES, generate
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+VALIDATE_SCRIPT = REPO_ROOT / "scripts" / "validate.py"
+WORK_DIR = REPO_ROOT / ".cache" / "ficecal-bench"
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+RESULT_FORMAT = 1
+
+VALIDATORS = (
+    "feature-catalog",
+    "fixture-coverage",
+    "legacy-alias-parity",
+    "billing-canonical-handoff",
+    "billing-live-readiness",
+    "qa-evidence-policy",
+    "docs-links",
+)
+
+
+def prepare_tree(tree: Path, scale: str, seed: int, regenerate: bool) -> dict[str, Any]:
+    manifest_path = tree / MANIFEST_NAME
+    if not regenerate and manifest_path.is_file():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if (manifest.get("generatorVersion"), manifest.get("scale"), manifest.get("seed")) == (
+            GENERATOR_VERSION,
+            scale,
+            seed,
+        ):
+            return manifest
+    print(f"[bench] generating {scale} tree (seed {seed}) in {tree}", file=sys.stderr)
+    return generate(tree, scale, seed)
+
+
+# Runs scripts/validate.py in the child and records the child's own peak RSS. VmHWM
+# belongs to the process's address space; ru_maxrss would also carry the parent's
+# peak across fork/exec and skew small validators.
+CHILD_WRAPPER = """
+import atexit, os, resource, runpy, sys
+
+def report_peak_rss():
+    peak = None
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    peak = int(line.split()[1])
+    except OSError:
+        pass
+    if peak is None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+    with open(os.environ["FICECAL_BENCH_RSS_FILE"], "w", encoding="ascii") as handle:
+        handle.write(str(peak))
+
+atexit.register(report_peak_rss)
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.path.dirname(sys.argv[0]))
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+def run_once(validator: str, tree: Path) -> dict[str, Any]:
+    command = [
+        sys.executable,
+        "-c",
+        CHILD_WRAPPER,
+        str(VALIDATE_SCRIPT),
+        validator,
+        "--no-cache",
+        "--collect-errors",
+        "--max-errors",
+        "0",
+        "--format",
+        "json",
+    ]
+    with tempfile.TemporaryDirectory() as scratch:
+        rss_file = Path(scratch) / "peak-rss"
+        stdout_file = Path(scratch) / "report.json"
+        env = {**os.environ, "FICECAL_VALIDATE_ROOT": str(tree), "FICECAL_BENCH_RSS_FILE": str(rss_file)}
+        with stdout_file.open("wb") as stdout:
+            started = time.perf_counter_ns()
+            subprocess.run(command, stdout=stdout, stderr=subprocess.DEVNULL, env=env, check=False)
+            wall_ns = time.perf_counter_ns() - started
+        report = json.loads(stdout_file.read_text(encoding="utf-8"))
+        peak_rss_kib = int(rss_file.read_text(encoding="ascii"))
+
+    result = report["validators"][0]
+    return {
+        "wall_ns": wall_ns,
+        "validator_ns": result["elapsedNs"],
+        "peak_rss_kib": peak_rss_kib,
+        "ok": result["ok"],
+        "violations": len(result["violations"]),
+        "checks": len(result["checks"]),
+    }
+
+
+def bench_validator(validator: str, tree: Path, inputs: dict[str, int], repeat: int) -> dict[str, Any]:
+    runs = [run_once(validator, tree) for _ in range(repeat)]
+    wall_seconds = statistics.median(run["wall_ns"] for run in runs) / 1e9
+    validator_seconds = statistics.median(run["validator_ns"] for run in runs) / 1e9
+    per_second = max(validator_seconds, 1e-9)
+    return {
+        "wallSeconds": round(wall_seconds, 6),
+        "validatorSeconds": round(validator_seconds, 6),
+        "validatorSecondsMin": round(min(run["validator_ns"] for run in runs) / 1e9, 6),
+        "peakRssKiB": max(run["peak_rss_kib"] for run in runs),
+        "files": inputs["files"],
+        "filesPerSecond": round(inputs["files"] / per_second, 1),
+        "items": inputs["items"],
+        "itemsPerSecond": round(inputs["items"] / per_second, 1),
+        "ok": runs[-1]["ok"],
+        "violations": runs[-1]["violations"],
+        "checks": runs[-1]["checks"],
+    }
+
+
+def command_run(args: argparse.Namespace) -> int:
+    tree = Path(args.tree).resolve() if args.tree else WORK_DIR / f"{args.scale}-seed{args.seed}"
+    manifest = prepare_tree(tree, args.scale, args.seed, args.regenerate)
+    unknown = [name for name in args.validators if name not in VALIDATORS]
+    if unknown:
+        print(f"[bench] ERROR: Unknown validator(s): {', '.join(unknown)}")
+        return 2
+    validators = args.validators or list(VALIDATORS)
+
+    results: dict[str, Any] = {}
+    for validator in validators:
+        results[validator] = bench_validator(validator, tree, manifest["inputs"][validator], args.repeat)
+        row = results[validator]
+        print(
+            f"[bench] {validator}: {row['validatorSeconds']:.3f}s validator, {row['wallSeconds']:.3f}s wall, "
+            f"{row['peakRssKiB'] / 1024:.1f} MiB peak RSS, {row['filesPerSecond']:.0f} files/s, "
+            f"{'OK' if row['ok'] else 'ERROR'} ({row['violations']} violation(s))"
+        )
+
+    payload = {
+        "format": RESULT_FORMAT,
+        "scale": args.scale,
+        "seed": args.seed,
+        "generatorVersion": GENERATOR_VERSION,
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{args.scale}-seed{args.seed}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"[bench] OK: wrote {output}")
+    return 0
+
+
+def command_compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+
+    for key in ("scale", "seed", "generatorVersion"):
+        if baseline.get(key) != current.get(key):
+            print(
+                f"[bench] ERROR: {key} differs ({baseline.get(key)} vs {current.get(key)}); "
+                "results are not comparable"
+            )
+            return 2
+
+    regressions: list[str] = []
+    for validator, base in sorted(baseline["results"].items()):
+        cur = current["results"].get(validator)
+        if cur is None:
+            continue
+
+        base_s, cur_s = base["validatorSeconds"], cur["validatorSeconds"]
+        delta_s = cur_s - base_s
+        time_change = delta_s / base_s if base_s else 0.0
+        base_rss, cur_rss = base["peakRssKiB"], cur["peakRssKiB"]
+        rss_change = (cur_rss - base_rss) / base_rss if base_rss else 0.0
+
+        notes: list[str] = []
+        if time_change > args.threshold and delta_s * 1000 >= args.min_delta_ms:
+            notes.append(f"time +{time_change:.0%} ({base_s:.3f}s -> {cur_s:.3f}s)")
+        if rss_change > args.threshold:
+            notes.append(f"peak RSS +{rss_change:.0%} ({base_rss} -> {cur_rss} KiB)")
+        if (base["ok"], base["violations"]) != (cur["ok"], cur["violations"]):
+            notes.append(
+                f"outcome changed ({base['violations']} -> {cur['violations']} violation(s), "
+                f"ok {base['ok']} -> {cur['ok']})"
+            )
+
+        if notes:
+            regressions.append(validator)
+            print(f"- {validator}: REGRESSION: {'; '.join(notes)}")
+        else:
+            print(f"- {validator}: ok (time {time_change:+.0%}, peak RSS {rss_change:+.0%})")
+
+    if regressions:
+        print(f"[bench] ERROR: {len(regressions)} validator(s) regressed beyond {args.threshold:.0%}")
+        return 1
+    print(f"[bench] OK: no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark validators against synthetic repositories")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks and write a result file")
+    run.add_argument(
+        "validators",
+        nargs="*",
+        metavar="VALIDATOR",
+        help=f"Validators to run (default: all): {', '.join(VALIDATORS)}",
+    )
+    run.add_argument("--scale", choices=sorted(SCALES), default="small", help="Size preset (default: small)")
+    run.add_argument("--seed", type=int, default=1, help="Generator seed (default: 1)")
+    run.add_argument("--tree", help=f"Synthetic tree directory (default: under {WORK_DIR.relative_to(REPO_ROOT)})")
+    run.add_argument("--regenerate", action="store_true", help="Regenerate the tree even if it is current")
+    run.add_argument("--repeat", type=int, default=3, help="Runs per validator; the median is recorded")
+    run.add_argument(
+        "--output",
+        help=f"Result file (default: {RESULTS_DIR.relative_to(REPO_ROOT)}/SCALE-seedN.json)",
+    )
+    run.set_defaults(handler=command_run)
+
+    compare = commands.add_parser("compare", help="Compare a result file against a baseline")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative increase in validator time or peak RSS (default: 0.15)",
+    )
+    compare.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=5.0,
+        help="Ignore time regressions smaller than this many milliseconds (default: 5)",
+    )
+    compare.set_defaults(handler=command_compare)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,13 @@
 """Run billing live smoke across tier-1 providers.
 
 Modes:
-- dry-run: uses fixture baselines only (no cloud login required)
+- dry-run: uses fixture baselines only (no cloud login required); the latest fixture
+  version (semver order) is the baseline, and `validate()` also checks older versions
 - live: executes provider smoke commands configured via environment variables
 
+`validate()` runs the dry-run checks in memory without writing artifacts; it is what
+`scripts/validate.py billing-live-smoke` calls.
+
 Provider smoke command contract (live mode):
 The command must print one JSON line with:
 {
@@ -27,10 +31,20 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from validation.core import ValidationError, ValidatorResult, collect_errors
+from validation.fixtures import fixture_index
+from validation.paths import REPO_ROOT
+from validation.schema import compile_schema
+from validation.schemas import SMOKE_CONFIG, SMOKE_PROVIDER
+
+VALIDATOR_NAME = "billing-live-smoke"
 DEFAULT_CONFIG_PATH = REPO_ROOT / "tests" / "contracts" / "live-smoke" / "billing-live-smoke.config.json"
 DEFAULT_ARTIFACTS_DIR = REPO_ROOT / "tests" / "evidence" / "artifacts"
-FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures" / "mcp"
+FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures"
+MCP_FIXTURE_ROOT = FIXTURE_ROOT / "mcp"
+
+check_config = compile_schema(SMOKE_CONFIG, VALIDATOR_NAME)
+check_provider = compile_schema(SMOKE_PROVIDER, VALIDATOR_NAME)
 
 
 @dataclass
@@ -63,9 +77,8 @@ class ProviderResult:
         }
 
 
-def fail(message: str) -> None:
-    print(f"[billing-live-smoke] ERROR: {message}")
-    sys.exit(1)
+def fail(message: str, path: Path | None = None, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
 
 
 def parse_args() -> argparse.Namespace:
@@ -152,19 +165,55 @@ def compute_variance_pct(provider_total: float, canonical_total: float) -> float
     return round(abs(provider_total - canonical_total) / provider_total * 100.0, 4)
 
 
-def load_fixture_baseline(tool_name: str) -> tuple[float, str]:
-    response_path = FIXTURE_ROOT / tool_name / "1.0" / "response.expected.json"
-    if not response_path.exists():
-        fail(f"Missing fixture response for dry-run baseline: {response_path.relative_to(REPO_ROOT)}")
+def fixture_versions(tool_name: str) -> list[str]:
+    """Version names of the tool's fixture pack in semver order, latest last."""
+    pack = fixture_index(FIXTURE_ROOT).pack(MCP_FIXTURE_ROOT / tool_name)
+    return [version.name for version in pack.version_index]
 
-    response_payload = load_json_object(response_path, f"{tool_name}/response.expected.json")
+
+def load_fixture_baseline(tool_name: str, version: str | None = None) -> tuple[float, str]:
+    """Return (infraTotal, currency) from the pack's response fixture, latest version by default."""
+    index = fixture_index(FIXTURE_ROOT)
+    if version is None:
+        latest = index.pack(MCP_FIXTURE_ROOT / tool_name).latest()
+        if latest is None:
+            pack_path = MCP_FIXTURE_ROOT / tool_name
+            fail(
+                f"No fixture versions for dry-run baseline: {pack_path.relative_to(REPO_ROOT)}",
+                path=pack_path,
+                rule="fixture-exists",
+            )
+        version = latest.name
+    response_path = MCP_FIXTURE_ROOT / tool_name / version / "response.expected.json"
+    if index.file(response_path) is None:
+        fail(
+            f"Missing fixture response for dry-run baseline: {response_path.relative_to(REPO_ROOT)}",
+            path=response_path,
+            rule="fixture-exists",
+        )
+
+    try:
+        response_payload = index.load_json(response_path)
+    except json.JSONDecodeError as exc:
+        fail(f"{tool_name}/response.expected.json invalid JSON: {exc}", path=response_path, rule="json-syntax")
+    if not isinstance(response_payload, dict):
+        fail(
+            f"{tool_name}/response.expected.json must be a JSON object",
+            path=response_path,
+            rule="json-object",
+        )
     canonical = response_payload.get("canonical")
     if not isinstance(canonical, dict):
-        fail(f"{tool_name}.response.canonical must be an object")
+        fail(
+            f"{tool_name}.response.canonical must be an object",
+            path=response_path,
+            pointer="/canonical",
+            rule="type",
+        )
 
     scope = response_payload.get("scope")
     if not isinstance(scope, dict):
-        fail(f"{tool_name}.response.scope must be an object")
+        fail(f"{tool_name}.response.scope must be an object", path=response_path, pointer="/scope", rule="type")
 
     return require_number(canonical, "infraTotal", tool_name), require_string(scope, "currency", tool_name)
 
@@ -343,38 +392,57 @@ def write_artifacts(
     return report_path, log_path, latest_path
 
 
-def validate_provider_config(provider: dict[str, Any], index: int) -> None:
-    context = f"providers[{index}]"
-    for key in (
-        "providerId",
-        "adapterId",
-        "fixtureToolName",
-        "credentialRefEnv",
-        "smokeCommandEnv",
-    ):
-        value = provider.get(key)
-        if not isinstance(value, str) or not value:
-            fail(f"{context}.{key} must be a non-empty string")
+def load_providers(config_path: Path) -> list[dict[str, Any]]:
+    if not config_path.exists():
+        fail(f"Live smoke config not found: {config_path}", path=config_path, rule="file-exists")
 
+    config = load_json_object(config_path, "live smoke config")
+    check_config(config, "live smoke config", config_path)
+    providers = config["providers"]
+    for index, provider in enumerate(providers):
+        check_provider(provider, f"providers[{index}]", config_path, f"/providers/{index}")
 
+    return providers
 
-def main() -> None:
-    args = parse_args()
-    config_path = Path(args.config)
-    artifacts_dir = Path(args.artifacts_dir)
 
-    if not config_path.exists():
-        fail(f"Live smoke config not found: {config_path}")
+def summarize(provider_results: list[ProviderResult]) -> dict[str, int]:
+    return {
+        "total": len(provider_results),
+        "passed": sum(1 for item in provider_results if item.status == "passed"),
+        "failed": sum(1 for item in provider_results if item.status == "failed"),
+        "skipped": sum(1 for item in provider_results if item.status == "skipped"),
+    }
 
-    config = load_json_object(config_path, "live smoke config")
-    providers = config.get("providers")
-    if not isinstance(providers, list) or not providers:
-        fail("Live smoke config must include non-empty providers list")
 
-    for index, provider in enumerate(providers):
-        if not isinstance(provider, dict):
-            fail(f"providers[{index}] must be an object")
-        validate_provider_config(provider, index)
+def validate() -> str:
+    baselines = 0
+    with collect_errors(VALIDATOR_NAME) as errors:
+        providers = load_providers(DEFAULT_CONFIG_PATH)
+        provider_results: list[ProviderResult] = []
+        for provider in providers:
+            tool_name = provider["fixtureToolName"]
+            with errors.unit(MCP_FIXTURE_ROOT / tool_name, rule="dry-run-provider"):
+                provider_results.append(run_dry_provider_smoke(provider))
+                baselines += 1
+            # The dry run uses the latest version; older versions must still yield a baseline.
+            for version in fixture_versions(tool_name)[:-1]:
+                with errors.unit(MCP_FIXTURE_ROOT / tool_name / version, rule="dry-run-baseline"):
+                    load_fixture_baseline(tool_name, version)
+                    baselines += 1
+    totals = summarize(provider_results)
+    if totals["failed"] > 0:
+        failed = [item.provider_id for item in provider_results if item.status == "failed"]
+        fail(f"dry-run smoke failed for providers: {', '.join(failed)}")
+    return (
+        f"mode=dry-run, providers={totals['total']}, passed={totals['passed']}, skipped={totals['skipped']}, "
+        f"fixture-versions={baselines}"
+    )
+
+
+def run(args: argparse.Namespace) -> None:
+    config_path = Path(args.config)
+    artifacts_dir = Path(args.artifacts_dir)
+    providers = load_providers(config_path)
 
     timestamp = datetime.now(tz=timezone.utc)
     timestamp_token = timestamp.strftime("%Y%m%dT%H%M%SZ")
@@ -392,12 +460,7 @@ def main() -> None:
         else:
             provider_results.append(run_dry_provider_smoke(provider))
 
-    totals = {
-        "total": len(provider_results),
-        "passed": sum(1 for item in provider_results if item.status == "passed"),
-        "failed": sum(1 for item in provider_results if item.status == "failed"),
-        "skipped": sum(1 for item in provider_results if item.status == "skipped"),
-    }
+    totals = summarize(provider_results)
 
     report = {
         "runId": f"billing-live-smoke-{timestamp_token}",
@@ -423,5 +486,13 @@ def main() -> None:
         sys.exit(1)
 
 
+def main() -> None:
+    try:
+        run(parse_args())
+    except ValidationError as exc:
+        print(ValidatorResult(VALIDATOR_NAME, False, exc.message, exc.details).render())
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Self-check for the changed-path planner (`validation/changes.py`).
+
+- a `.gitignore` added, edited, deleted or renamed at any depth re-runs every
+  docs-links unit, since it decides which markdown files the walk visits
+- a file merely named like one (`notes.gitignore`, `.gitignore.bak`) does not
+- an edited markdown file re-runs its own docs-links unit and those of the docs
+  mentioning it, not every unit
+- `mcp.capabilities.get` re-runs all fixture coverage and alias parity
+- editing the shared `validation` package re-runs the whole suite
+
+Exits 1 when any check fails.
+
+Usage:
+  python3 scripts/selfcheck-changes.py
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Callable
+
+from validation.changes import Change, Plan, plan_changes
+from validation.runner import SUITE, VALIDATORS
+
+
+class CheckFailed(Exception):
+    pass
+
+
+def expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise CheckFailed(message)
+
+
+def plan(*changes: Change) -> Plan:
+    return plan_changes(list(changes), VALIDATORS, SUITE)
+
+
+def check_gitignore_any_depth() -> None:
+    for change in (
+        Change("M", ".gitignore"),
+        Change("M", "docs/.gitignore"),
+        Change("A", "docs/playbooks/.gitignore"),
+        Change("D", "tests/.gitignore"),
+        Change("R", "docs/gitignore.txt", "docs/.gitignore"),
+    ):
+        got = plan(change)
+        expect("docs-links" in got and got["docs-links"] is None, f"{change}: docs-links planned as {got}")
+
+
+def check_gitignore_lookalikes() -> None:
+    for path in ("docs/notes.gitignore", "docs/.gitignore.bak"):
+        got = plan(Change("M", path))
+        expect("docs-links" not in got, f"{path}: planned docs-links as {got.get('docs-links')!r}")
+
+
+def check_markdown_edit() -> None:
+    got = plan(Change("M", "docs/qa-evidence-storage-convention.md"))
+    units = got.get("docs-links")
+    expect(units is not None, "edited markdown re-ran every docs-links unit")
+    expect("doc:docs/qa-evidence-storage-convention.md" in units, f"edited markdown not re-checked: {units}")
+    expect("doc:tests/e2e/smoke-journeys.md" in units, f"doc mentioning the edited markdown not re-checked: {units}")
+
+
+def check_capabilities() -> None:
+    got = plan(Change("M", "tests/contracts/fixtures/mcp/mcp.capabilities.get/1.0/response.expected.json"))
+    for name in ("fixture-coverage", "legacy-alias-parity"):
+        expect(name in got and got[name] is None, f"capabilities change planned {name} as {got.get(name)!r}")
+
+
+def check_shared_package() -> None:
+    got = plan(Change("M", "scripts/validation/core.py"))
+    missing = [name for name in SUITE if name not in got or got[name] is not None]
+    expect(not missing, f"shared package change did not re-run {missing}")
+
+
+CHECKS: dict[str, Callable[[], None]] = {
+    "gitignore-any-depth": check_gitignore_any_depth,
+    "gitignore-lookalikes": check_gitignore_lookalikes,
+    "markdown-edit": check_markdown_edit,
+    "capabilities": check_capabilities,
+    "shared-package": check_shared_package,
+}
+
+
+def main() -> int:
+    failed = []
+    for name, check in CHECKS.items():
+        try:
+            check()
+        except CheckFailed as exc:
+            failed.append(name)
+            print(f"FAIL {name}: {exc}")
+        except Exception as exc:  # noqa: BLE001 - a crashing check must not hide the others
+            failed.append(name)
+            print(f"FAIL {name}: crashed: {exc!r}")
+        else:
+            print(f"ok   {name}")
+    if failed:
+        print(f"changes self-check: {len(failed)} of {len(CHECKS)} check(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
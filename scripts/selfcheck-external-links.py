@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Offline self-check for the external link prober (`validation/external.py`).
+
+Starts an `http.server` on 127.0.0.1 and runs `check_urls`, `_probe` and `_request`
+against it, so the HTTP client is exercised without network access:
+
+- `HEAD` answered with an error status is retried as `GET`
+- redirects are followed (relative `Location` included) up to `MAX_REDIRECTS`
+- 404 is broken; 401/403/429 are alive but never cached
+- a request slower than the timeout is reported as timed out
+- keep-alive connections are reused, and a pooled connection the server closed, idle
+  or while the request was in flight, is replaced by a fresh one
+- healthy results are cached, skipped while fresh and probed again once past the TTL
+
+Exits 1 when any check fails.
+
+Usage:
+  python3 scripts/selfcheck-external-links.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from validation.cache import NO_CACHE_ENV
+from validation.external import (
+    MAX_REDIRECTS,
+    ExternalOptions,
+    ExternalResult,
+    _Connections,
+    _Key,
+    _probe,
+    _request,
+    check_urls,
+)
+
+SLOW_SECONDS = 1.0
+TIMEOUT = 0.3
+OPTIONS = ExternalOptions(timeout=2.0, concurrency=4, per_host=2, ttl_hours=1.0)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes by path; the query string only keeps URLs of different checks apart."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def setup(self) -> None:
+        super().setup()
+        self.connection_id = self.server.next_connection_id()
+        self.requests_on_connection = 0
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_HEAD(self) -> None:
+        self._respond("HEAD")
+
+    def do_GET(self) -> None:
+        self._respond("GET")
+
+    def _respond(self, method: str) -> None:
+        self.requests_on_connection += 1
+        self.server.log(self.connection_id, method, self.path)
+        route = urlsplit(self.path).path
+        if route == "/slow":
+            time.sleep(SLOW_SECONDS)
+        if route == "/drop-second" and self.requests_on_connection > 1:
+            # Keep-alive race: the server gives up on the connection as a request arrives.
+            self.close_connection = True
+            return
+        if route.startswith("/redirect/"):
+            remaining = int(route.rsplit("/", 1)[1])
+            if remaining:
+                self._send(302, method, location=f"{remaining - 1}?{urlsplit(self.path).query}")
+            else:
+                self._send(200, method)
+        elif route == "/head-rejected":
+            self._send(405 if method == "HEAD" else 200, method)
+        elif route.startswith("/status/"):
+            self._send(int(route.rsplit("/", 1)[1]), method)
+        elif route in {"/ok", "/slow", "/drop-second"}:
+            self._send(200, method)
+        elif route == "/close-idle":
+            # Answered as keep-alive, then closed: the client pools a dead connection.
+            self._send(200, method)
+            self.close_connection = True
+        else:
+            self._send(404, method)
+
+    def _send(self, status: int, method: str, location: str | None = None) -> None:
+        body = f"{status}\n".encode("ascii")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if location is not None:
+            self.send_header("Location", location)
+        self.end_headers()
+        if method != "HEAD":
+            self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self._lock = threading.Lock()
+        self._connections = 0
+        self.requests: list[tuple[int, str, str]] = []  # (connection id, method, path)
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def next_connection_id(self) -> int:
+        with self._lock:
+            self._connections += 1
+            return self._connections
+
+    def log(self, connection_id: int, method: str, path: str) -> None:
+        with self._lock:
+            self.requests.append((connection_id, method, path))
+
+    def seen(self, path: str) -> list[tuple[int, str]]:
+        """(connection id, method) of every request for `path`, query string included."""
+        with self._lock:
+            return [(connection_id, method) for connection_id, method, seen in self.requests if seen == path]
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        # The timeout check leaves a handler writing to a socket the client closed.
+        pass
+
+
+class CheckFailed(Exception):
+    pass
+
+
+def expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise CheckFailed(message)
+
+
+def probe(server: _Server, path: str, timeout: float = OPTIONS.timeout) -> ExternalResult:
+    async def run() -> ExternalResult:
+        connections = _Connections(OPTIONS.per_host)
+        try:
+            return await _probe(connections, server.base + path, timeout)
+        finally:
+            await connections.close()
+
+    return asyncio.run(run())
+
+
+def check_head_fallback(server: _Server, cache_path: Path) -> None:
+    result = probe(server, "/head-rejected")
+    expect(result.alive and result.status == 200, f"expected alive 200, got {result}")
+    methods = [method for _, method in server.seen("/head-rejected")]
+    expect(methods == ["HEAD", "GET"], f"expected HEAD then GET, got {methods}")
+    result = probe(server, "/ok?case=head")
+    expect([method for _, method in server.seen("/ok?case=head")] == ["HEAD"], "healthy HEAD was retried")
+
+
+def check_redirects(server: _Server, cache_path: Path) -> None:
+    result = probe(server, f"/redirect/{MAX_REDIRECTS}?case=limit")
+    expect(result.alive and result.status == 200, f"{MAX_REDIRECTS} redirects not followed: {result}")
+    hops = [f"/redirect/{hop}?case=limit" for hop in range(MAX_REDIRECTS, -1, -1)]
+    expect(all(server.seen(hop) for hop in hops), "relative Location not resolved against the current URL")
+    result = probe(server, f"/redirect/{MAX_REDIRECTS + 1}?case=over")
+    expect(not result.alive and result.status == 302, f"redirect limit not enforced: {result}")
+    expect(result.detail == f"more than {MAX_REDIRECTS} redirects", f"unexpected detail {result.detail!r}")
+    expect(not server.seen("/redirect/0?case=over"), "client followed more than MAX_REDIRECTS redirects")
+
+
+def check_status_classification(server: _Server, cache_path: Path) -> None:
+    result = probe(server, "/missing")
+    expect(not result.alive and result.status == 404 and result.detail == "HTTP 404", f"404 not broken: {result}")
+    expect([method for _, method in server.seen("/missing")] == ["HEAD", "GET"], "404 HEAD not retried as GET")
+    for status in (401, 403, 429):
+        result = probe(server, f"/status/{status}")
+        expect(result.alive and result.status == status, f"{status} should be alive: {result}")
+    result = probe(server, "/status/500")
+    expect(not result.alive and result.detail == "HTTP 500", f"500 should be broken: {result}")
+
+
+def check_timeout(server: _Server, cache_path: Path) -> None:
+    started = time.perf_counter()
+    result = probe(server, "/slow", timeout=TIMEOUT)
+    elapsed = time.perf_counter() - started
+    expect(not result.alive and result.detail == f"timed out after {TIMEOUT:g}s", f"no timeout: {result}")
+    expect(elapsed < SLOW_SECONDS, f"probe waited {elapsed:.2f}s for a {TIMEOUT:g}s timeout")
+
+
+class _RecordingConnections(_Connections):
+    """Pool that records, for each connection it hands out, whether it was reused."""
+
+    def __init__(self, per_host: int) -> None:
+        super().__init__(per_host)
+        self.reused: list[bool] = []
+
+    async def open(self, key: _Key) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        reader, writer, reused = await super().open(key)
+        self.reused.append(reused)
+        return reader, writer, reused
+
+
+def check_connection_reuse(server: _Server, cache_path: Path) -> None:
+    async def run(path: str, pause: float = 0.0) -> tuple[list[int], list[bool]]:
+        connections = _RecordingConnections(1)
+        try:
+            statuses = []
+            for _ in range(2):
+                status, _ = await asyncio.wait_for(_request(connections, "GET", server.base + path), 2.0)
+                statuses.append(status)
+                await asyncio.sleep(pause)
+            return statuses, connections.reused
+        finally:
+            await connections.close()
+
+    statuses, reused = asyncio.run(run("/ok?case=reuse"))
+    expect(statuses == [200, 200] and reused == [False, True], f"keep-alive connection not reused: {reused}")
+    expect(len({connection_id for connection_id, _ in server.seen("/ok?case=reuse")}) == 1, "second connection")
+
+    # The server drops the second request on a connection without answering.
+    statuses, reused = asyncio.run(run("/drop-second"))
+    expect(statuses == [200, 200], f"request on a stale pooled connection not retried: {statuses}")
+    expect(reused == [False, True, False], f"expected a fresh connection after the stale one, got {reused}")
+
+    # The server closes the connection after answering; the pool must not hand it out.
+    statuses, reused = asyncio.run(run("/close-idle", pause=0.1))
+    expect(statuses == [200, 200] and reused == [False, False], f"closed idle connection reused: {reused}")
+
+
+def check_cache(server: _Server, cache_path: Path) -> None:
+    ok, denied = server.base + "/ok?case=cache", server.base + "/status/403?case=cache"
+    results = check_urls([ok + "#one", ok + "#two", denied], OPTIONS, cache_path)
+    expect(len(server.seen("/ok?case=cache")) == 1, "fragments of one URL were probed separately")
+    expect(not results[ok + "#one"].cached and results[denied].alive, f"unexpected first run {results}")
+    stored = json.loads(cache_path.read_text(encoding="utf-8"))["urls"]
+    expect(set(stored) == {ok}, f"only healthy URLs below 400 may be cached, got {sorted(stored)}")
+
+    results = check_urls([ok, denied], OPTIONS, cache_path)
+    expect(results[ok].cached and len(server.seen("/ok?case=cache")) == 1, "fresh cache entry was re-probed")
+    expect(len(server.seen("/status/403?case=cache")) == 4, "403 answer was taken from the cache")
+
+    # Age every entry past the TTL; an expired entry for an unrelated URL is pruned.
+    expired = time.time() - 2 * 3600 * OPTIONS.ttl_hours
+    stored[ok]["checkedAt"] = expired
+    stored[server.base + "/ok?case=gone"] = {"checkedAt": expired, "status": 200}
+    cache_path.write_text(json.dumps({"format": 1, "urls": stored}), encoding="utf-8")
+    results = check_urls([ok], OPTIONS, cache_path)
+    expect(not results[ok].cached and len(server.seen("/ok?case=cache")) == 2, "expired entry was not re-probed")
+    stored = json.loads(cache_path.read_text(encoding="utf-8"))["urls"]
+    expect(set(stored) == {ok} and stored[ok]["checkedAt"] > time.time() - 60, f"cache not renewed: {stored}")
+
+    os.environ[NO_CACHE_ENV] = "1"
+    try:
+        results = check_urls([ok], OPTIONS, cache_path)
+    finally:
+        del os.environ[NO_CACHE_ENV]
+    expect(not results[ok].cached and len(server.seen("/ok?case=cache")) == 3, "cache read while disabled")
+
+
+CHECKS: dict[str, Callable[[_Server, Path], None]] = {
+    "head-get-fallback": check_head_fallback,
+    "redirects": check_redirects,
+    "status-classification": check_status_classification,
+    "timeout": check_timeout,
+    "connection-reuse": check_connection_reuse,
+    "cache-ttl": check_cache,
+}
+
+
+def main() -> int:
+    os.environ.pop(NO_CACHE_ENV, None)
+    server = _Server()
+    threading.Thread(target=server.serve_forever, name="selfcheck-http", daemon=True).start()
+    failed = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, check in CHECKS.items():
+                try:
+                    check(server, Path(tmp) / f"{name}.json")
+                except CheckFailed as exc:
+                    failed.append(name)
+                    print(f"FAIL {name}: {exc}")
+                except Exception as exc:  # noqa: BLE001 - a crashing check must not hide the others
+                    failed.append(name)
+                    print(f"FAIL {name}: crashed: {exc!r}")
+                else:
+                    print(f"ok   {name}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    if failed:
+        print(f"external links self-check: {len(failed)} of {len(CHECKS)} check(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
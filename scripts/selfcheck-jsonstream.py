@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Self-check for the streaming JSON array reader (`validation/jsonstream.py`).
+
+- every chunk size, down to one character, reads a set of edge-case documents
+  (values and escapes cut at chunk edges, members after the array, non-object
+  documents) exactly as `json.loads` does
+- malformed input raises `json.JSONDecodeError` exactly when `json.loads` does
+- a malformed row fails after reading a bounded amount of the file, not the rest of it
+- a value spanning many chunks is completed in a logarithmic number of reads
+- with `ijson` installed, both backends give the same result, members after the
+  array included
+
+Exits 1 when any check fails.
+
+Usage:
+  python3 scripts/selfcheck-jsonstream.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from validation import jsonstream
+from validation.jsonstream import BACKEND_ENV, JsonArrayReader
+
+KEY = "rows"
+CHUNK_SIZES = (1, 2, 3, 5, 7, 16, 64, 1 << 16)
+ROW = {"legacyAlias": "finops.cost", "canonicalTool": "billing.aws.ingest", "parityCheck": "response_shape"}
+
+DOCUMENTS = (
+    '{"fixtureVersion": "1.0", "rows": [{"a": 1}, {"b": [1, 2.5e-3, -0.0]}]}',
+    '{"rows": [], "fixtureVersion": "1.0"}',
+    '{"rows": [1, 2], "fixtureVersion": "1.0", "notes": {"rows": [3]}}',
+    '  {\n "x" : "\\u00e9\\ud83d\\ude00\\"\\\\" , "rows" : [ "\\u0041" , -7 ] }\n',
+    '{"rows": [true, false, null, -12.5E+3, "]", "}", "[{,"]}',
+    '{"rows": 5, "after": [1]}',
+    '{"header": 1}',
+    "{}",
+    '[{"rows": [1]}]',
+    '"rows"',
+    '{"a": {"rows": [1]}, "rows": [[[]], {"rows": []}]}',
+)
+# yajl rejects integers beyond 64 bits and floats beyond double range, so the ijson
+# backend is not compared on these.
+OUT_OF_RANGE_DOCUMENTS = ('{"rows": [123456789012345678901234567890, 1]}', '{"rows": [1e400]}')
+
+
+def expected(document: str) -> dict[str, Any]:
+    loaded = json.loads(document)
+    if not isinstance(loaded, dict):
+        return {"items": [], "header": {}, "is_object": False, "is_array": False}
+    value = loaded.get(KEY)
+    is_array = isinstance(value, list)
+    header = {name: member for name, member in loaded.items() if name != KEY or not is_array}
+    return {"items": value if is_array else [], "header": header, "is_object": True, "is_array": is_array}
+
+
+def read(path: Path, chunk_size: int = jsonstream.CHUNK_SIZE) -> dict[str, Any]:
+    with JsonArrayReader(path, KEY, chunk_size) as reader:
+        items = list(reader)
+    return {"items": items, "header": reader.header, "is_object": reader.is_object, "is_array": reader.is_array}
+
+
+class CheckFailed(Exception):
+    pass
+
+
+def expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise CheckFailed(message)
+
+
+def _write(tmp: Path, name: str, text: str) -> Path:
+    path = tmp / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class _CountingHandle:
+    """Wraps the reader's file handle to count read calls and characters."""
+
+    def __init__(self, handle: Any) -> None:
+        self.handle = handle
+        self.reads = 0
+        self.chars = 0
+
+    def read(self, size: int) -> str:
+        chunk = self.handle.read(size)
+        self.reads += 1
+        self.chars += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+def _counted(reader: JsonArrayReader) -> _CountingHandle:
+    source = reader._source
+    assert isinstance(source, jsonstream._StdlibSource)
+    source.handle = _CountingHandle(source.handle)
+    return source.handle
+
+
+def check_chunk_sizes(tmp: Path) -> None:
+    for number, document in enumerate(DOCUMENTS + OUT_OF_RANGE_DOCUMENTS):
+        path = _write(tmp, f"doc{number}.json", document)
+        want = expected(document)
+        for chunk_size in CHUNK_SIZES:
+            got = read(path, chunk_size)
+            expect(got == want, f"document {number}, chunk size {chunk_size}: {got} != {want}")
+
+
+def check_malformed(tmp: Path) -> None:
+    base = DOCUMENTS[0]
+    for position in range(len(base)):
+        for mutated in (base[:position] + base[position + 1 :], base[:position] + "x" + base[position:]):
+            try:
+                json.loads(mutated)
+                valid = True
+            except json.JSONDecodeError:
+                valid = False
+            path = _write(tmp, "mutated.json", mutated)
+            for chunk_size in (1, 3, 64):
+                try:
+                    read(path, chunk_size)
+                    raised = False
+                except json.JSONDecodeError:
+                    raised = True
+                expect(raised != valid, f"chunk size {chunk_size}: {mutated!r} raised={raised}, valid={valid}")
+
+
+def check_malformed_row_is_bounded(tmp: Path) -> None:
+    rows = [json.dumps(ROW)] * 50_000
+    rows[1] = rows[1].replace('"parityCheck":', '"parityCheck"')
+    path = _write(tmp, "bad-row.json", '{"fixtureVersion": "1.0", "rows": [\n' + ",\n".join(rows) + "\n]}\n")
+    chunk_size = 4096
+    reader = JsonArrayReader(path, KEY, chunk_size)
+    with reader:
+        handle = _counted(reader)
+        try:
+            for _ in reader:
+                pass
+        except json.JSONDecodeError as exc:
+            expect(exc.lineno == 3, f"error reported at line {exc.lineno}, expected 3")
+        else:
+            raise CheckFailed("malformed row was accepted")
+    size = path.stat().st_size
+    expect(handle.chars <= 2 * chunk_size, f"read {handle.chars} of {size} characters before failing")
+
+
+def check_large_value_reads(tmp: Path) -> None:
+    value = "x" * (1 << 20)
+    path = _write(tmp, "large.json", json.dumps({"rows": [value, 1]}))
+    chunk_size = 1024
+    reader = JsonArrayReader(path, KEY, chunk_size)
+    with reader:
+        handle = _counted(reader)
+        items = list(reader)
+    expect(items == [value, 1], "large value decoded wrongly")
+    # 1 MiB in 1 KiB chunks: about log2(1024) doubling reads, not a thousand.
+    expect(handle.reads <= 16, f"{handle.reads} reads for a value of {len(value)} characters")
+
+
+def check_backends_agree(tmp: Path) -> None:
+    if jsonstream._ijson is None:
+        print("     (ijson not installed: backend comparison skipped)")
+        return
+    previous = os.environ.get(BACKEND_ENV)
+    try:
+        for number, document in enumerate(DOCUMENTS):
+            path = _write(tmp, f"backend{number}.json", document)
+            results = []
+            for backend in ("stdlib", "ijson"):
+                os.environ[BACKEND_ENV] = backend
+                results.append(read(path, 7))
+            expect(results[0] == results[1], f"document {number}: stdlib {results[0]} != ijson {results[1]}")
+    finally:
+        if previous is None:
+            os.environ.pop(BACKEND_ENV, None)
+        else:
+            os.environ[BACKEND_ENV] = previous
+
+
+CHECKS: dict[str, Callable[[Path], None]] = {
+    "chunk-sizes": check_chunk_sizes,
+    "malformed": check_malformed,
+    "malformed-row-bounded": check_malformed_row_is_bounded,
+    "large-value-reads": check_large_value_reads,
+    "backends-agree": check_backends_agree,
+}
+
+
+def main() -> int:
+    os.environ.pop(BACKEND_ENV, None)
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, check in CHECKS.items():
+            try:
+                check(Path(tmp))
+            except CheckFailed as exc:
+                failed.append(name)
+                print(f"FAIL {name}: {exc}")
+            except Exception as exc:  # noqa: BLE001 - a crashing check must not hide the others
+                failed.append(name)
+                print(f"FAIL {name}: crashed: {exc!r}")
+            else:
+                print(f"ok   {name}")
+    if failed:
+        print(f"jsonstream self-check: {len(failed)} of {len(CHECKS)} check(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
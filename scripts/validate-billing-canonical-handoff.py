@@ -1,248 +1,467 @@
 #!/usr/bin/env python3
 """Validate billing canonical handoff fixture checks for phase-1 adapters.
 
+Providers come from the rule table `tests/contracts/live-smoke/billing-provider-baselines.json`
+(adapter id, provider scope field, sourceVersion prefix, required warnings), loaded and
+compiled by `validation/baselines.py`; onboarding a provider is a table entry.
+
 Checks:
-- required billing tool fixture packs exist
-- request.valid and response.expected fixtures parse as JSON objects
-- providerAdapterId aligns with tool namespace adapter mapping
-- integrationRunId and scope fields align between request and response
-- canonical and provenance fields satisfy type and value constraints
+- the rule table matches PROVIDER_BASELINES; tool names are unique and each required
+  warning is either a prefix or an exact string
+- the billing tool fixture pack of every table entry exists; every semantic version of
+  each pack is checked
+- every `request.*.json` of a version is validated, in one pass over the pack:
+  - request.valid with response.expected (and request.<name> with a paired
+    response.<name>) parse as JSON objects and match the shared REQUEST_VALID /
+    RESPONSE_EXPECTED schemas (`validation/schemas.py`); providerAdapterId aligns with
+    the tool namespace adapter mapping; integrationRunId and scope fields align between
+    request and response; the provider baseline (sourceVersion prefix, positive
+    infraTotal, required warnings)
+  - unpaired request.edge-case.<scenario> matches REQUEST_EDGE_CASE and the request
+    scope rules: an ISO date window (start <= end), an ISO 4217 currency and a
+    non-empty, duplicate-free provider scope list; `multi-*` edge cases list at least
+    two entries and the `provider-scope` edge case carries providerScope
+  - request.invalid must break the REQUEST_VALID shape or a request scope rule
 """
 
 from __future__ import annotations
 
 import json
-import sys
+import re
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
 from typing import Any
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-MCP_FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures" / "mcp"
+from validation.baselines import BASELINES_PATH, BaselineRules, ProviderBaseline, load_baseline_rules
+from validation.cache import ValidationCache, validation_cache
+from validation.core import ErrorCollector, ValidationError, collect_errors, run_standalone, unit_selected
+from validation.fixtures import FixtureVersion, fixture_index
+from validation.paths import REPO_ROOT
+from validation.schema import compile_schema
+from validation.schemas import REQUEST_EDGE_CASE, REQUEST_VALID, RESPONSE_EXPECTED, SCOPE_KEYS
+
+VALIDATOR_NAME = "billing-canonical-handoff"
+FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures"
+MCP_FIXTURE_ROOT = FIXTURE_ROOT / "mcp"
 
-PHASE1_BILLING_TOOLS = {
-    "billing.openops.ingest": "openops-billing",
-    "billing.aws.ingest": "aws-billing",
-    "billing.azure.ingest": "azure-billing",
-    "billing.gcp.ingest": "gcp-billing",
-}
+check_request = compile_schema(REQUEST_VALID, VALIDATOR_NAME)
+check_response = compile_schema(RESPONSE_EXPECTED, VALIDATOR_NAME)
+check_edge_case_request = compile_schema(REQUEST_EDGE_CASE, VALIDATOR_NAME)
 
+REQUEST_FILE = re.compile(r"request\.(.+)\.json")
+EDGE_CASE_PREFIX = "edge-case."
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+CURRENCY_CODE = re.compile(r"[A-Z]{3}")
 
-def fail(message: str) -> None:
-    print(f"[billing-canonical-handoff] ERROR: {message}")
-    sys.exit(1)
+
+def fail(message: str, path: Path | None = None, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
 
 
 def load_json(path: Path, context: str) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return fixture_index(FIXTURE_ROOT).load_json(path)
     except json.JSONDecodeError as exc:
-        fail(f"{context} invalid JSON: {exc}")
+        fail(f"{context} invalid JSON: {exc}", path=path, rule="json-syntax")
 
 
 def load_json_object(path: Path, context: str) -> dict[str, Any]:
     payload = load_json(path, context)
     if not isinstance(payload, dict):
-        fail(f"{context} must be a JSON object")
+        fail(f"{context} must be a JSON object", path=path, rule="json-object")
     return payload
 
 
-def require_non_empty_string(container: dict[str, Any], key: str, context: str) -> str:
-    value = container.get(key)
-    if not isinstance(value, str) or not value:
-        fail(f"{context}.{key} must be a non-empty string")
-    return value
-
-
-def require_number(container: dict[str, Any], key: str, context: str) -> float:
-    value = container.get(key)
-    if not isinstance(value, (int, float)):
-        fail(f"{context}.{key} must be a number")
-    return float(value)
-
+@dataclass(frozen=True)
+class RequestVariant:
+    """One `request.<name>.json` of a tool version and the response it is paired with."""
+
+    name: str  # "valid", "invalid", "edge-case.multi-account", ...
+    request_path: Path
+    response_path: Path | None
+
+    @property
+    def edge_case(self) -> str:
+        """The scenario of an unpaired `edge-case.<scenario>` request, else ""."""
+        if self.response_path is None and self.name.startswith(EDGE_CASE_PREFIX):
+            return self.name[len(EDGE_CASE_PREFIX) :]
+        return ""
+
+    def context(self, tool_name: str) -> str:
+        """Message prefix for fields of this request."""
+        return f"{tool_name}.request" if self.name == "valid" else f"{tool_name}.request[{self.name}]"
+
+
+def request_variants(version: FixtureVersion) -> list[RequestVariant]:
+    """Every request fixture of `version`, `request.valid.json` first.
+
+    `valid` pairs with `response.expected.json` and any other variant with a
+    `response.<name>.json` next to it; `invalid` and edge cases usually have none.
+    """
+    variants = []
+    for file_name in sorted(version.files):
+        match = REQUEST_FILE.fullmatch(file_name)
+        if match is None:
+            continue
+        name = match.group(1)
+        response_name = "response.expected.json" if name == "valid" else f"response.{name}.json"
+        response_path = version.path / response_name if response_name in version.files else None
+        if name == "invalid":
+            response_path = None
+        variants.append(RequestVariant(name, version.path / file_name, response_path))
+    variants.sort(key=lambda variant: variant.name != "valid")
+    return variants
+
+
+def validate_phase1_tool(
+    baseline: ProviderBaseline,
+    rules: BaselineRules,
+    cache: ValidationCache,
+    errors: ErrorCollector,
+) -> tuple[int, int]:
+    """Validate every version of the tool's fixture pack; return (versions, requests)."""
+    tool_name = baseline.tool_name
+    index = fixture_index(FIXTURE_ROOT)
+    pack_root = MCP_FIXTURE_ROOT / tool_name
+    if not index.is_dir(pack_root):
+        fail(
+            f"Missing fixture pack directory: {pack_root.relative_to(REPO_ROOT)}",
+            path=pack_root,
+            rule="fixture-exists",
+        )
 
-def validate_phase1_tool(tool_name: str, expected_adapter_id: str) -> None:
-    fixture_version_root = MCP_FIXTURE_ROOT / tool_name / "1.0"
-    if not fixture_version_root.exists():
-        fail(f"Missing fixture pack directory: {fixture_version_root.relative_to(REPO_ROOT)}")
+    pack = index.pack(pack_root)
+    # Directory names that are not semantic versions are reported by fixture-coverage.
+    versions = pack.version_index.versions
+    if not versions:
+        fail(
+            f"Fixture pack has no version directories: {pack_root.relative_to(REPO_ROOT)}",
+            path=pack_root,
+            rule="fixture-exists",
+        )
 
+    # The whole pack is enumerated up front: one (version, variants) batch entry per
+    # version, each validated and cached independently of the others.
+    fixture_versions = [pack.versions[version.name] for version in versions]
+    batch = [(fixture_version, request_variants(fixture_version)) for fixture_version in fixture_versions]
+    for fixture_version, variants in batch:
+        with errors.unit(fixture_version.path):
+            validate_tool_version(baseline, rules, fixture_version, variants, cache, errors)
+    return len(batch), sum(len(variants) for _, variants in batch)
+
+
+def validate_tool_version(
+    baseline: ProviderBaseline,
+    rules: BaselineRules,
+    fixture_version: FixtureVersion,
+    variants: list[RequestVariant],
+    cache: ValidationCache,
+    errors: ErrorCollector,
+) -> None:
+    tool_name = baseline.tool_name
+    version = fixture_version.name
+    unit = f"phase1-tool:{tool_name}/{version}"
+    if not unit_selected(VALIDATOR_NAME, unit):
+        return
+
+    fixture_version_root = fixture_version.path
     request_path = fixture_version_root / "request.valid.json"
     response_path = fixture_version_root / "response.expected.json"
 
-    if not request_path.exists():
-        fail(f"Missing request fixture: {request_path.relative_to(REPO_ROOT)}")
-    if not response_path.exists():
-        fail(f"Missing response fixture: {response_path.relative_to(REPO_ROOT)}")
-
-    request_payload = load_json_object(request_path, f"{tool_name}/request.valid.json")
-    response_payload = load_json_object(response_path, f"{tool_name}/response.expected.json")
-
-    request_run_id = require_non_empty_string(request_payload, "integrationRunId", f"{tool_name}.request")
-    response_run_id = require_non_empty_string(
-        response_payload, "integrationRunId", f"{tool_name}.response"
-    )
-    if response_run_id != request_run_id:
-        fail(f"{tool_name}.response.integrationRunId must match request.integrationRunId")
-
-    provider_adapter_id = require_non_empty_string(
-        response_payload, "providerAdapterId", f"{tool_name}.response"
-    )
-    if provider_adapter_id != expected_adapter_id:
+    if "request.valid.json" not in fixture_version.files:
         fail(
-            f"{tool_name}.response.providerAdapterId expected '{expected_adapter_id}', "
-            f"got '{provider_adapter_id}'"
+            f"Missing request fixture: {request_path.relative_to(REPO_ROOT)}",
+            path=request_path,
+            rule="fixture-exists",
+        )
+    if "response.expected.json" not in fixture_version.files:
+        fail(
+            f"Missing response fixture: {response_path.relative_to(REPO_ROOT)}",
+            path=response_path,
+            rule="fixture-exists",
         )
 
-    response_scope = response_payload.get("scope")
-    if not isinstance(response_scope, dict):
-        fail(f"{tool_name}.response.scope must be an object")
-
-    request_start = require_non_empty_string(request_payload, "startDate", f"{tool_name}.request")
-    request_end = require_non_empty_string(request_payload, "endDate", f"{tool_name}.request")
-    request_currency = require_non_empty_string(request_payload, "currency", f"{tool_name}.request")
-
-    auth_mode = request_payload.get("authMode")
-    if auth_mode is not None and auth_mode != "read-only":
-        fail(f"{tool_name}.request.authMode must be 'read-only' when provided")
-
-    credential_ref = request_payload.get("credentialRef")
-    if credential_ref is not None and not isinstance(credential_ref, str):
-        fail(f"{tool_name}.request.credentialRef must be a string when provided")
-
-    scope_start = require_non_empty_string(response_scope, "startDate", f"{tool_name}.response.scope")
-    scope_end = require_non_empty_string(response_scope, "endDate", f"{tool_name}.response.scope")
-    scope_currency = require_non_empty_string(response_scope, "currency", f"{tool_name}.response.scope")
-
-    if scope_start != request_start:
-        fail(f"{tool_name}.response.scope.startDate must match request.startDate")
-    if scope_end != request_end:
-        fail(f"{tool_name}.response.scope.endDate must match request.endDate")
-    if scope_currency != request_currency:
-        fail(f"{tool_name}.response.scope.currency must match request.currency")
-
-    canonical = response_payload.get("canonical")
-    if not isinstance(canonical, dict):
-        fail(f"{tool_name}.response.canonical must be an object")
-
-    for key in ("infraTotal", "cudPct", "budgetCap", "nRef"):
-        require_number(canonical, key, f"{tool_name}.response.canonical")
-
-    provenance = response_payload.get("provenance")
-    if not isinstance(provenance, dict):
-        fail(f"{tool_name}.response.provenance must be an object")
+    inputs = [variant.request_path for variant in variants]
+    inputs += [variant.response_path for variant in variants if variant.response_path is not None]
+    if cache.lookup(unit, inputs) is not None:
+        errors.cached(fixture_version_root, "phase1-tool")
+        return
+
+    with errors.unit(fixture_version_root, rule="phase1-tool") as outcome:
+        for variant in variants:
+            context = f"{tool_name}/{version}/{variant.request_path.name}"
+            if variant.response_path is not None:
+                with errors.unit(variant.request_path, rule="handoff-pair"):
+                    validate_request_pair(baseline, rules, version, variant, context, errors)
+            elif variant.name == "invalid":
+                with errors.unit(variant.request_path, rule="invalid-request"):
+                    validate_invalid_request(baseline, variant, context)
+            elif variant.edge_case:
+                with errors.unit(variant.request_path, rule="edge-case-request"):
+                    request_payload = load_json_object(variant.request_path, context)
+                    check_edge_case_request(request_payload, variant.context(tool_name), variant.request_path)
+                    validate_request_scope(baseline, variant, request_payload)
+            else:
+                fail(
+                    f"{context} must be request.invalid.json, request.edge-case.<scenario>.json "
+                    f"or have a paired response.{variant.name}.json",
+                    path=variant.request_path,
+                    rule="request-variant",
+                )
+
+    if outcome.ok:
+        cache.record(unit, inputs, dependencies=(BASELINES_PATH,))
+
+
+def validate_request_pair(
+    baseline: ProviderBaseline,
+    rules: BaselineRules,
+    version: str,
+    variant: RequestVariant,
+    context: str,
+    errors: ErrorCollector,
+) -> None:
+    tool_name = baseline.tool_name
+    request_path = variant.request_path
+    response_path = variant.response_path
+    request_payload = load_json_object(request_path, context)
+    response_payload = load_json_object(response_path, f"{tool_name}/{version}/{response_path.name}")
+    check_request(request_payload, variant.context(tool_name), request_path)
+    check_response(response_payload, f"{tool_name}.response", response_path)
+
+    with errors.unit():
+        validate_identity(tool_name, baseline.adapter_id, request_payload, response_path, response_payload)
+    with errors.unit():
+        validate_scope(tool_name, request_payload, response_path, response_payload)
+    with errors.unit():
+        validate_provider_baseline(baseline, rules, response_path, response_payload)
+
+
+def validate_invalid_request(baseline: ProviderBaseline, variant: RequestVariant, context: str) -> None:
+    """request.invalid.json must break the request shape or one of the request scope rules."""
+    request_payload = load_json_object(variant.request_path, context)
+    try:
+        check_request(request_payload, variant.context(baseline.tool_name), variant.request_path)
+        validate_request_scope(baseline, variant, request_payload)
+    except ValidationError:
+        return
+    fail(
+        f"{context} passes every request rule; an invalid request must violate at least one",
+        path=variant.request_path,
+        rule="invalid-request-rejected",
+    )
 
-    require_non_empty_string(provenance, "sourceVersion", f"{tool_name}.response.provenance")
-    require_number(provenance, "coveragePct", f"{tool_name}.response.provenance")
 
-    mapping_confidence = provenance.get("mappingConfidence")
-    if mapping_confidence not in {"low", "medium", "high"}:
+def _iso_date(value: str) -> date | None:
+    if not ISO_DATE.fullmatch(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def validate_request_scope(
+    baseline: ProviderBaseline,
+    variant: RequestVariant,
+    request_payload: dict[str, Any],
+) -> None:
+    """Scope rules of an unpaired edge-case request (its shape is already checked).
+
+    Paired requests are held to their response instead; request.invalid must break
+    these rules or the request shape.
+    """
+    path = variant.request_path
+    context = variant.context(baseline.tool_name)
+
+    start_date = _iso_date(request_payload["startDate"])
+    end_date = _iso_date(request_payload["endDate"])
+    for key, parsed in (("startDate", start_date), ("endDate", end_date)):
+        if parsed is None:
+            fail(
+                f"{context}.{key} must be an ISO date (YYYY-MM-DD)",
+                path=path,
+                pointer=f"/{key}",
+                rule="scope-window",
+            )
+    if start_date > end_date:
         fail(
-            f"{tool_name}.response.provenance.mappingConfidence must be one of: "
-            "low, medium, high"
+            f"{context}.startDate must not be after endDate",
+            path=path,
+            pointer="/startDate",
+            rule="scope-window",
         )
 
-    warnings = provenance.get("warnings")
-    if not isinstance(warnings, list) or not all(isinstance(item, str) for item in warnings):
-        fail(f"{tool_name}.response.provenance.warnings must be an array of strings")
+    if not CURRENCY_CODE.fullmatch(request_payload["currency"]):
+        fail(
+            f"{context}.currency must be a three-letter ISO 4217 code",
+            path=path,
+            pointer="/currency",
+            rule="scope-currency",
+        )
 
-    if tool_name == "billing.openops.ingest":
-        source_version = require_non_empty_string(
-            provenance, "sourceVersion", f"{tool_name}.response.provenance"
+    scope_key = baseline.scope_key
+    entries = request_payload.get(scope_key)
+    if not isinstance(entries, list) or not entries:
+        fail(
+            f"{context}.{scope_key} must be a non-empty array",
+            path=path,
+            pointer=f"/{scope_key}",
+            rule="provider-scope",
         )
-        if not source_version.startswith("openops-readonly-"):
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, str) or not entry:
             fail(
-                f"{tool_name}.response.provenance.sourceVersion must start with "
-                "'openops-readonly-' for P07 baseline"
+                f"{context}.{scope_key}[{position}] must be a non-empty string",
+                path=path,
+                pointer=f"/{scope_key}/{position}",
+                rule="provider-scope",
             )
-
-        infra_total = require_number(canonical, "infraTotal", f"{tool_name}.response.canonical")
-        if infra_total <= 0:
-            fail(f"{tool_name}.response.canonical.infraTotal must be > 0 for OpenOps real ingest baseline")
-
-    if tool_name == "billing.aws.ingest":
-        source_version = require_non_empty_string(
-            provenance, "sourceVersion", f"{tool_name}.response.provenance"
+    if len(set(entries)) != len(entries):
+        fail(
+            f"{context}.{scope_key} must not repeat entries",
+            path=path,
+            pointer=f"/{scope_key}",
+            rule="provider-scope",
         )
-        if not source_version.startswith("aws-readonly-"):
+
+    provider_scope = request_payload.get("providerScope")
+    if provider_scope is not None:
+        if not isinstance(provider_scope, dict) or not provider_scope:
             fail(
-                f"{tool_name}.response.provenance.sourceVersion must start with "
-                "'aws-readonly-' for P07 baseline"
+                f"{context}.providerScope must be a non-empty object when provided",
+                path=path,
+                pointer="/providerScope",
+                rule="provider-scope",
             )
+        for key, value in provider_scope.items():
+            if not isinstance(value, str) or not value:
+                fail(
+                    f"{context}.providerScope.{key} must be a non-empty string",
+                    path=path,
+                    pointer=f"/providerScope/{key}",
+                    rule="provider-scope",
+                )
+
+    # Edge-case scenarios name what they exercise; hold them to it.
+    scenario = variant.edge_case
+    if scenario.startswith("multi-") and len(entries) < 2:
+        fail(
+            f"{context}.{scope_key} must list at least 2 entries for the {scenario} edge case",
+            path=path,
+            pointer=f"/{scope_key}",
+            rule="edge-case-scope",
+        )
+    if scenario == "provider-scope" and provider_scope is None:
+        fail(
+            f"{context}.providerScope is required for the provider-scope edge case",
+            path=path,
+            pointer="/providerScope",
+            rule="edge-case-scope",
+        )
 
-        infra_total = require_number(canonical, "infraTotal", f"{tool_name}.response.canonical")
-        if infra_total <= 0:
-            fail(f"{tool_name}.response.canonical.infraTotal must be > 0 for AWS real ingest baseline")
 
-        retry_warning_prefix = "Retry policy configured: maxAttempts="
-        if not any(isinstance(item, str) and item.startswith(retry_warning_prefix) for item in warnings):
-            fail(
-                f"{tool_name}.response.provenance.warnings must include retry policy baseline entry"
-            )
+def validate_identity(
+    tool_name: str,
+    expected_adapter_id: str,
+    request_payload: dict[str, Any],
+    response_path: Path,
+    response_payload: dict[str, Any],
+) -> None:
+    if response_payload["integrationRunId"] != request_payload["integrationRunId"]:
+        fail(
+            f"{tool_name}.response.integrationRunId must match request.integrationRunId",
+            path=response_path,
+            pointer="/integrationRunId",
+            rule="run-id-match",
+        )
 
-    if tool_name == "billing.azure.ingest":
-        source_version = require_non_empty_string(
-            provenance, "sourceVersion", f"{tool_name}.response.provenance"
+    provider_adapter_id = response_payload["providerAdapterId"]
+    if provider_adapter_id != expected_adapter_id:
+        fail(
+            f"{tool_name}.response.providerAdapterId expected '{expected_adapter_id}', "
+            f"got '{provider_adapter_id}'",
+            path=response_path,
+            pointer="/providerAdapterId",
+            rule="provider-adapter-id",
         )
-        if not source_version.startswith("azure-readonly-"):
-            fail(
-                f"{tool_name}.response.provenance.sourceVersion must start with "
-                "'azure-readonly-' for P07 baseline"
-            )
 
-        infra_total = require_number(canonical, "infraTotal", f"{tool_name}.response.canonical")
-        if infra_total <= 0:
-            fail(f"{tool_name}.response.canonical.infraTotal must be > 0 for Azure real ingest baseline")
 
-        pagination_warning_prefix = "Pagination policy: pageSize="
-        if not any(isinstance(item, str) and item.startswith(pagination_warning_prefix) for item in warnings):
+def validate_scope(
+    tool_name: str,
+    request_payload: dict[str, Any],
+    response_path: Path,
+    response_payload: dict[str, Any],
+) -> None:
+    response_scope = response_payload["scope"]
+    for key in SCOPE_KEYS:
+        if response_scope[key] != request_payload[key]:
             fail(
-                f"{tool_name}.response.provenance.warnings must include pagination policy baseline entry"
+                f"{tool_name}.response.scope.{key} must match request.{key}",
+                path=response_path,
+                pointer=f"/scope/{key}",
+                rule="scope-match",
             )
 
-        incremental_warning = "Incremental sync baseline anchored to requested billing window."
-        if incremental_warning not in warnings:
-            fail(
-                f"{tool_name}.response.provenance.warnings must include incremental sync baseline entry"
-            )
 
-    if tool_name == "billing.gcp.ingest":
-        source_version = require_non_empty_string(
-            provenance, "sourceVersion", f"{tool_name}.response.provenance"
-        )
-        if not source_version.startswith("gcp-readonly-"):
-            fail(
-                f"{tool_name}.response.provenance.sourceVersion must start with "
-                "'gcp-readonly-' for P07 baseline"
-            )
+def validate_provider_baseline(
+    baseline: ProviderBaseline,
+    rules: BaselineRules,
+    response_path: Path,
+    response_payload: dict[str, Any],
+) -> None:
+    tool_name = baseline.tool_name
+    provenance = response_payload["provenance"]
 
-        infra_total = require_number(canonical, "infraTotal", f"{tool_name}.response.canonical")
-        if infra_total <= 0:
-            fail(f"{tool_name}.response.canonical.infraTotal must be > 0 for GCP real ingest baseline")
+    if not rules.source_versions.has(provenance["sourceVersion"], tool_name):
+        fail(
+            f"{tool_name}.response.provenance.sourceVersion must start with "
+            f"'{baseline.source_version_prefix}' for P07 baseline",
+            path=response_path,
+            pointer="/provenance/sourceVersion",
+            rule="source-version-prefix",
+        )
 
-        telemetry_warning = "Telemetry baseline: billing.run and billing.mapping.summary emitted."
-        if telemetry_warning not in warnings:
-            fail(
-                f"{tool_name}.response.provenance.warnings must include telemetry baseline entry"
-            )
+    if response_payload["canonical"]["infraTotal"] <= 0:
+        fail(
+            f"{tool_name}.response.canonical.infraTotal must be > 0 for {baseline.label} real ingest baseline",
+            path=response_path,
+            pointer="/canonical/infraTotal",
+            rule="positive-infra-total",
+        )
 
-        recommender_warning = "Recommender-ready provenance baseline enabled."
-        if recommender_warning not in warnings:
+    if not baseline.warnings:
+        return
+    hits = rules.warnings.hits(provenance["warnings"])
+    for warning in baseline.warnings:
+        if warning.pattern_id not in hits:
             fail(
-                f"{tool_name}.response.provenance.warnings must include recommender-ready baseline entry"
+                f"{tool_name}.response.provenance.warnings must include {warning.label} baseline entry",
+                path=response_path,
+                pointer="/provenance/warnings",
+                rule="required-warning",
             )
 
 
-def validate() -> None:
-    for tool_name, expected_adapter_id in PHASE1_BILLING_TOOLS.items():
-        validate_phase1_tool(tool_name, expected_adapter_id)
+def validate() -> str:
+    rules = load_baseline_rules(VALIDATOR_NAME)
+    version_count = request_count = 0
+    with validation_cache(VALIDATOR_NAME, __file__) as cache, collect_errors(VALIDATOR_NAME) as errors:
+        for baseline in rules.providers.values():
+            with errors.unit(MCP_FIXTURE_ROOT / baseline.tool_name):
+                versions, requests = validate_phase1_tool(baseline, rules, cache, errors)
+                version_count += versions
+                request_count += requests
 
-    print(
-        "[billing-canonical-handoff] OK: validated "
-        f"{len(PHASE1_BILLING_TOOLS)} billing tool fixture packs"
+    return (
+        f"validated {len(rules.providers)} billing tool fixture packs "
+        f"({version_count} versions, {request_count} requests)"
     )
 
 
 def main() -> None:
-    validate()
+    run_standalone(VALIDATOR_NAME, validate)
 
 
 if __name__ == "__main__":
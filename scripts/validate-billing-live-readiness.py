@@ -12,10 +12,14 @@ Checks:
 from __future__ import annotations
 
 import json
-import sys
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from validation.core import ErrorCollector, ValidationError, collect_errors, run_standalone
+from validation.paths import REPO_ROOT
+from validation.schema import compile_schema
+from validation.schemas import SMOKE_CONFIG, SMOKE_PROVIDER
+
+VALIDATOR_NAME = "billing-live-readiness"
 
 READINESS_PLAYBOOK_PATH = REPO_ROOT / "docs" / "playbooks" / "billing-live-integration-readiness.md"
 LIVE_SMOKE_CONFIG_PATH = REPO_ROOT / "tests" / "contracts" / "live-smoke" / "billing-live-smoke.config.json"
@@ -24,6 +28,9 @@ ENV_LIVE_EXAMPLE_PATH = REPO_ROOT / ".env.live.example"
 LIVE_SMOKE_WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "billing-live-smoke.yml"
 RELEASE_WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "release.yml"
 
+check_config = compile_schema(SMOKE_CONFIG, VALIDATOR_NAME)
+check_provider = compile_schema(SMOKE_PROVIDER, VALIDATOR_NAME)
+
 REQUIRED_PROVIDERS = ("openops", "aws", "azure", "gcp")
 
 REQUIRED_ENV_KEYS = (
@@ -38,103 +45,123 @@ REQUIRED_ENV_KEYS = (
 )
 
 
-def fail(message: str) -> None:
-    print(f"[billing-live-readiness] ERROR: {message}")
-    sys.exit(1)
+def fail(message: str, path: Path | None = None, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
 
 
 def assert_exists(path: Path, context: str) -> None:
     if not path.exists():
-        fail(f"Missing {context}: {path.relative_to(REPO_ROOT)}")
+        fail(f"Missing {context}: {path.relative_to(REPO_ROOT)}", path=path, rule="file-exists")
 
 
 def load_json_object(path: Path) -> dict:
     try:
         parsed = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
-        fail(f"Invalid JSON in {path.relative_to(REPO_ROOT)}: {exc}")
+        fail(f"Invalid JSON in {path.relative_to(REPO_ROOT)}: {exc}", path=path, rule="json-syntax")
 
     if not isinstance(parsed, dict):
-        fail(f"Expected JSON object in {path.relative_to(REPO_ROOT)}")
+        fail(f"Expected JSON object in {path.relative_to(REPO_ROOT)}", path=path, rule="json-object")
 
     return parsed
 
 
-def ensure_env_keys(path: Path, key_names: tuple[str, ...]) -> None:
+def ensure_env_keys(path: Path, key_names: tuple[str, ...], errors: ErrorCollector) -> None:
     content = path.read_text(encoding="utf-8")
     for key_name in key_names:
-        if f"{key_name}=" not in content:
-            fail(f"{path.relative_to(REPO_ROOT)} missing required key template: {key_name}")
+        with errors.unit(path, rule="env-key"):
+            if f"{key_name}=" not in content:
+                fail(
+                    f"{path.relative_to(REPO_ROOT)} missing required key template: {key_name}",
+                    path=path,
+                    rule="env-key",
+                )
 
 
-def validate_live_smoke_config(config: dict) -> None:
-    providers = config.get("providers")
-    if not isinstance(providers, list) or not providers:
-        fail("Live smoke config must define non-empty providers list")
+def validate_provider(idx: int, provider: object) -> str:
+    context = f"providers[{idx}]"
+    pointer = f"/providers/{idx}"
+    check_provider(provider, context, LIVE_SMOKE_CONFIG_PATH, pointer)
 
-    provider_ids: set[str] = set()
-    for idx, provider in enumerate(providers):
-        context = f"providers[{idx}]"
-        if not isinstance(provider, dict):
-            fail(f"{context} must be an object")
-
-        for required_key in (
-            "providerId",
-            "adapterId",
-            "fixtureToolName",
-            "credentialRefEnv",
-            "smokeCommandEnv",
-        ):
-            value = provider.get(required_key)
-            if not isinstance(value, str) or not value:
-                fail(f"{context}.{required_key} must be a non-empty string")
-
-        adapter_id = provider["adapterId"]
-        if not adapter_id.endswith("-billing"):
-            fail(f"{context}.adapterId must end with '-billing'")
+    adapter_id = provider["adapterId"]
+    if not adapter_id.endswith("-billing"):
+        fail(
+            f"{context}.adapterId must end with '-billing'",
+            path=LIVE_SMOKE_CONFIG_PATH,
+            pointer=f"{pointer}/adapterId",
+            rule="adapter-id-suffix",
+        )
 
-        threshold = provider.get("varianceThresholdPct")
-        if threshold is not None and not isinstance(threshold, (int, float)):
-            fail(f"{context}.varianceThresholdPct must be numeric when provided")
+    return provider["providerId"]
 
-        provider_ids.add(provider["providerId"])
 
-    missing = sorted(set(REQUIRED_PROVIDERS) - provider_ids)
-    if missing:
-        fail(f"Live smoke config missing required providers: {', '.join(missing)}")
+def validate_live_smoke_config(config: dict, errors: ErrorCollector) -> None:
+    check_config(config, "live smoke config", LIVE_SMOKE_CONFIG_PATH)
+    providers = config["providers"]
 
+    provider_ids: set[str] = set()
+    for idx, provider in enumerate(providers):
+        with errors.unit(LIVE_SMOKE_CONFIG_PATH, rule="live-smoke-provider", pointer=f"/providers/{idx}"):
+            provider_ids.add(validate_provider(idx, provider))
 
-def validate_release_gate() -> None:
-    content = RELEASE_WORKFLOW_PATH.read_text(encoding="utf-8")
-    if "Run billing live smoke gate" not in content:
-        fail("release workflow missing mandatory billing live smoke gate step")
-    if "scripts/validate-billing-live-reconciliation.py" not in content:
-        fail("release workflow missing billing live reconciliation gate step")
-    if "inputs.require_live_smoke" in content:
-        fail("release workflow must not make live smoke gate optional")
+    with errors.unit(LIVE_SMOKE_CONFIG_PATH):
+        missing = sorted(set(REQUIRED_PROVIDERS) - provider_ids)
+        if missing:
+            fail(
+                f"Live smoke config missing required providers: {', '.join(missing)}",
+                path=LIVE_SMOKE_CONFIG_PATH,
+                pointer="/providers",
+                rule="required-provider",
+            )
 
 
-def validate() -> None:
-    assert_exists(READINESS_PLAYBOOK_PATH, "billing live readiness playbook")
-    assert_exists(LIVE_SMOKE_CONFIG_PATH, "billing live smoke config")
-    assert_exists(ENV_EXAMPLE_PATH, "root .env.example")
-    assert_exists(ENV_LIVE_EXAMPLE_PATH, "live .env example")
-    assert_exists(LIVE_SMOKE_WORKFLOW_PATH, "billing live smoke workflow")
-    assert_exists(RELEASE_WORKFLOW_PATH, "release workflow")
+def validate_release_gate(errors: ErrorCollector) -> None:
+    content = RELEASE_WORKFLOW_PATH.read_text(encoding="utf-8")
+    with errors.unit(RELEASE_WORKFLOW_PATH, rule="release-gate"):
+        if "Run billing live smoke gate" not in content:
+            fail("release workflow missing mandatory billing live smoke gate step", rule="release-gate")
+    with errors.unit(RELEASE_WORKFLOW_PATH, rule="release-gate"):
+        if "scripts/validate-billing-live-reconciliation.py" not in content:
+            fail("release workflow missing billing live reconciliation gate step", rule="release-gate")
+    with errors.unit(RELEASE_WORKFLOW_PATH, rule="release-gate"):
+        if "inputs.require_live_smoke" in content:
+            fail("release workflow must not make live smoke gate optional", rule="release-gate")
+
+
+def validate() -> str:
+    with collect_errors(VALIDATOR_NAME) as errors:
+        for path, context in (
+            (READINESS_PLAYBOOK_PATH, "billing live readiness playbook"),
+            (LIVE_SMOKE_CONFIG_PATH, "billing live smoke config"),
+            (ENV_EXAMPLE_PATH, "root .env.example"),
+            (ENV_LIVE_EXAMPLE_PATH, "live .env example"),
+            (LIVE_SMOKE_WORKFLOW_PATH, "billing live smoke workflow"),
+            (RELEASE_WORKFLOW_PATH, "release workflow"),
+        ):
+            with errors.unit(path, rule="file-exists"):
+                assert_exists(path, context)
+        if errors.violations:
+            # Later checks read these files.
+            return ""
 
-    ensure_env_keys(ENV_EXAMPLE_PATH, REQUIRED_ENV_KEYS)
-    ensure_env_keys(ENV_LIVE_EXAMPLE_PATH, REQUIRED_ENV_KEYS)
+        ensure_env_keys(ENV_EXAMPLE_PATH, REQUIRED_ENV_KEYS, errors)
+        ensure_env_keys(ENV_LIVE_EXAMPLE_PATH, REQUIRED_ENV_KEYS, errors)
 
-    config = load_json_object(LIVE_SMOKE_CONFIG_PATH)
-    validate_live_smoke_config(config)
-    validate_release_gate()
+        config = load_json_object(LIVE_SMOKE_CONFIG_PATH)
+        with errors.unit(LIVE_SMOKE_CONFIG_PATH):
+            validate_live_smoke_config(config, errors)
+        validate_release_gate(errors)
 
     provider_count = len(config["providers"])
-    print(
-        "[billing-live-readiness] OK: validated live readiness playbook, env templates, "
+    return (
+        "validated live readiness playbook, env templates, "
         f"{provider_count} provider smoke entries, and release gate wiring"
     )
 
 
+def main() -> None:
+    run_standalone(VALIDATOR_NAME, validate)
+
+
 if __name__ == "__main__":
-    validate()
+    main()
@@ -6,6 +6,10 @@ Checks:
 - all required providers are present
 - no provider has failed status
 - provider variance stays within configured threshold
+
+`validate()` with no arguments is the suite entry used by `scripts/validate.py`: it
+always checks the config thresholds and reconciles the latest report only when one
+has been generated. The CLI keeps requiring the report.
 """
 
 from __future__ import annotations
@@ -13,19 +17,26 @@ from __future__ import annotations
 import argparse
 import json
 import math
-import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from validation.core import (
+    ErrorCollector,
+    ValidationError,
+    add_common_arguments,
+    collect_errors,
+    run_standalone,
+)
+from validation.paths import REPO_ROOT
+
+VALIDATOR_NAME = "billing-live-reconciliation"
 DEFAULT_CONFIG_PATH = REPO_ROOT / "tests" / "contracts" / "live-smoke" / "billing-live-smoke.config.json"
 DEFAULT_REPORT_PATH = REPO_ROOT / "tests" / "evidence" / "artifacts" / "latest-billing-live-smoke-report.json"
 
 
-def fail(message: str) -> None:
-    print(f"[billing-live-reconciliation] ERROR: {message}")
-    sys.exit(1)
+def fail(message: str, path: Path | None = None, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
 
 
 def load_json_object(path: Path, context: str) -> dict[str, Any]:
@@ -66,6 +77,7 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Allow provider status=skipped in validation",
     )
+    add_common_arguments(parser)
     return parser.parse_args()
 
 
@@ -131,14 +143,110 @@ def validate_report_age(report: dict[str, Any], max_age_hours: float) -> None:
         )
 
 
+def validate_provider_entry(
+    idx: int,
+    provider: object,
+    thresholds: dict[str, float],
+    report_path: Path,
+) -> tuple[str, str]:
+    context = f"report.providers[{idx}]"
+    pointer = f"/providers/{idx}"
+    if not isinstance(provider, dict):
+        fail(f"{context} must be an object", report_path, pointer, "type")
+
+    provider_id = provider.get("providerId")
+    if not isinstance(provider_id, str) or not provider_id:
+        fail(
+            f"{context}.providerId must be non-empty string",
+            report_path,
+            f"{pointer}/providerId",
+            "non-empty-string",
+        )
+
+    if provider_id not in thresholds:
+        fail(
+            f"{context}.providerId '{provider_id}' not found in config",
+            report_path,
+            f"{pointer}/providerId",
+            "known-provider",
+        )
+
+    status = provider.get("status")
+    if status not in {"passed", "failed", "skipped"}:
+        fail(
+            f"{context}.status must be one of passed|failed|skipped",
+            report_path,
+            f"{pointer}/status",
+            "status",
+        )
+
+    return provider_id, status
+
+
+def check_provider_outcome(
+    idx: int,
+    provider: dict[str, Any],
+    provider_id: str,
+    status: str,
+    thresholds: dict[str, float],
+    allow_skipped: bool,
+    report_path: Path,
+) -> None:
+    context = f"report.providers[{idx}]"
+    pointer = f"/providers/{idx}"
+
+    if status == "failed":
+        reason = provider.get("reason")
+        fail(
+            f"{provider_id} failed reconciliation: {reason}",
+            report_path,
+            f"{pointer}/status",
+            "provider-failed",
+        )
+
+    if status == "skipped":
+        if not allow_skipped:
+            fail(
+                f"{provider_id} was skipped; pass --allow-skipped only when explicitly intended",
+                report_path,
+                f"{pointer}/status",
+                "provider-skipped",
+            )
+        return
+
+    variance_pct = provider.get("variancePct")
+    if not isinstance(variance_pct, (int, float)):
+        fail(
+            f"{context}.variancePct must be numeric for passed providers",
+            report_path,
+            f"{pointer}/variancePct",
+            "number",
+        )
+
+    threshold = thresholds[provider_id]
+    if math.isfinite(float(variance_pct)) is False:
+        fail(f"{context}.variancePct must be finite", report_path, f"{pointer}/variancePct", "finite")
+
+    if float(variance_pct) > threshold:
+        fail(
+            f"{provider_id} variance {float(variance_pct)}% exceeds threshold {threshold}%",
+            report_path,
+            f"{pointer}/variancePct",
+            "variance-threshold",
+        )
+
+
 def validate_provider_entries(
     report: dict[str, Any],
     thresholds: dict[str, float],
     allow_skipped: bool,
+    report_path: Path = DEFAULT_REPORT_PATH,
+    errors: ErrorCollector | None = None,
 ) -> tuple[int, int, int]:
+    errors = errors or ErrorCollector(VALIDATOR_NAME)
     providers = report.get("providers")
     if not isinstance(providers, list) or not providers:
-        fail("report.providers must be a non-empty list")
+        fail("report.providers must be a non-empty list", report_path, "/providers", "non-empty-array")
 
     seen_provider_ids: set[str] = set()
     passed = 0
@@ -146,81 +254,83 @@ def validate_provider_entries(
     skipped = 0
 
     for idx, provider in enumerate(providers):
-        context = f"report.providers[{idx}]"
-        if not isinstance(provider, dict):
-            fail(f"{context} must be an object")
-
-        provider_id = provider.get("providerId")
-        if not isinstance(provider_id, str) or not provider_id:
-            fail(f"{context}.providerId must be non-empty string")
-
-        if provider_id not in thresholds:
-            fail(f"{context}.providerId '{provider_id}' not found in config")
-
-        seen_provider_ids.add(provider_id)
-
-        status = provider.get("status")
-        if status not in {"passed", "failed", "skipped"}:
-            fail(f"{context}.status must be one of passed|failed|skipped")
-
-        if status == "failed":
-            failed += 1
-            reason = provider.get("reason")
-            fail(f"{provider_id} failed reconciliation: {reason}")
-
-        if status == "skipped":
-            skipped += 1
-            if not allow_skipped:
-                fail(f"{provider_id} was skipped; pass --allow-skipped only when explicitly intended")
-            continue
-
-        variance_pct = provider.get("variancePct")
-        if not isinstance(variance_pct, (int, float)):
-            fail(f"{context}.variancePct must be numeric for passed providers")
-
-        threshold = thresholds[provider_id]
-        if math.isfinite(float(variance_pct)) is False:
-            fail(f"{context}.variancePct must be finite")
-
-        if float(variance_pct) > threshold:
+        with errors.unit(report_path, rule="report-provider", pointer=f"/providers/{idx}"):
+            provider_id, status = validate_provider_entry(idx, provider, thresholds, report_path)
+            seen_provider_ids.add(provider_id)
+            if status == "failed":
+                failed += 1
+            elif status == "skipped":
+                skipped += 1
+            check_provider_outcome(idx, provider, provider_id, status, thresholds, allow_skipped, report_path)
+            if status == "passed":
+                passed += 1
+
+    with errors.unit(report_path):
+        missing_provider_ids = sorted(set(thresholds.keys()) - seen_provider_ids)
+        if missing_provider_ids:
             fail(
-                f"{provider_id} variance {float(variance_pct)}% exceeds threshold {threshold}%"
+                f"Report missing providers: {', '.join(missing_provider_ids)}",
+                report_path,
+                "/providers",
+                "required-provider",
             )
 
-        passed += 1
-
-    missing_provider_ids = sorted(set(thresholds.keys()) - seen_provider_ids)
-    if missing_provider_ids:
-        fail(f"Report missing providers: {', '.join(missing_provider_ids)}")
-
     return passed, failed, skipped
 
 
-def main() -> None:
-    args = parse_args()
+def validate(
+    config_path: Path = DEFAULT_CONFIG_PATH,
+    report_path: Path = DEFAULT_REPORT_PATH,
+    max_age_hours: float | None = None,
+    allow_skipped: bool = False,
+    require_report: bool = False,
+) -> str:
+    config = load_json_object(config_path, "live smoke config")
+    thresholds, default_threshold, max_report_age_hours = to_provider_thresholds(config)
 
-    config = load_json_object(Path(args.config), "live smoke config")
-    report = load_json_object(Path(args.report), "live smoke report")
+    if not require_report and not report_path.exists():
+        return (
+            f"providers={len(thresholds)}, defaultThreshold={default_threshold}%, "
+            "no live smoke report to reconcile"
+        )
 
-    thresholds, default_threshold, max_report_age_hours = to_provider_thresholds(config)
+    report = load_json_object(report_path, "live smoke report")
 
-    if args.max_age_hours is not None:
-        max_report_age_hours = args.max_age_hours
+    if max_age_hours is not None:
+        max_report_age_hours = max_age_hours
 
-    validate_report_age(report, max_report_age_hours)
+    with collect_errors(VALIDATOR_NAME) as errors:
+        with errors.unit(report_path, rule="report-age", pointer="/generatedAt"):
+            validate_report_age(report, max_report_age_hours)
 
-    passed, failed, skipped = validate_provider_entries(
-        report=report,
-        thresholds=thresholds,
-        allow_skipped=args.allow_skipped,
-    )
+        passed, failed, skipped = validate_provider_entries(
+            report=report,
+            thresholds=thresholds,
+            allow_skipped=allow_skipped,
+            report_path=report_path,
+            errors=errors,
+        )
 
-    print(
-        "[billing-live-reconciliation] OK: "
+    return (
         f"providers={len(thresholds)}, passed={passed}, failed={failed}, skipped={skipped}, "
         f"defaultThreshold={default_threshold}%"
     )
 
 
+def main() -> None:
+    args = parse_args()
+    run_standalone(
+        VALIDATOR_NAME,
+        lambda: validate(
+            config_path=Path(args.config),
+            report_path=Path(args.report),
+            max_age_hours=args.max_age_hours,
+            allow_skipped=args.allow_skipped,
+            require_report=True,
+        ),
+        args,
+    )
+
+
 if __name__ == "__main__":
     main()
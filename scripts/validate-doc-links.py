@@ -1,47 +1,100 @@
 #!/usr/bin/env python3
 """Validate local markdown link targets.
 
-Checks markdown links in repository docs and fails when local file targets do not exist.
-External links (http/https/mailto/tel), in-page anchors, and data URIs are ignored.
+Checks markdown links in repository docs and fails when local file targets do not exist
+or when a `#fragment` names no heading (GitHub slug, duplicate suffixes included) or
+HTML id in the target markdown file or, for in-page `#anchor` links, the document
+itself. Inline links, images, reference definitions and HTML `href`/`src` attributes
+are checked; fenced code, code spans and HTML comments are skipped (see
+`validation/markdown.py`). External links (http/https/mailto/tel) and data URIs are
+ignored (unless `--external` is given, see below), as are fragments on non-markdown
+targets.
+
+Markdown files are found in one pruned walk (see `validation/walk.py`) that skips
+`.gitignore`d paths and never descends into directories no include pattern can match.
+Link targets are resolved against the process-wide path index
+(`validation/pathindex.py`), which also holds the file list, so the watch daemon keeps
+both between runs; names must match case exactly.
+
+With `--jobs N` (or `FICECAL_VALIDATE_DOC_LINK_JOBS=N`, which the suite runner also
+honors) files are checked in a pool of N forked workers. Results are merged in file
+order, so the report is byte-identical to a serial run.
+
+The same pass records the link graph (see `validation/linkgraph.py`); cached files
+contribute the targets stored with their cache entry, so no file is read again.
+`--graph OUT` exports it, `--orphans`, `--most-linked N` and `--links-to PATH` print
+reports from it.
+
+`--external` additionally probes http(s) links (see `validation/external.py`). It is
+opt-in, never part of `npm run validate`, and healthy URLs are cached with a TTL.
 """
 
 from __future__ import annotations
 
-import re
+import argparse
+import multiprocessing
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
 from urllib.parse import unquote, urlparse
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-LINK_PATTERN = re.compile(r"!?\[[^\]]*\]\(([^)]+)\)")
-
-INCLUDE_GLOBS = (
-    "README.md",
-    "CONTRIBUTING.md",
-    "docs/**/*.md",
-    ".github/**/*.md",
-    "tests/evidence/**/*.md",
+from validation.cache import validation_cache
+from validation.core import (
+    Check,
+    ValidationError,
+    Violation,
+    add_common_arguments,
+    max_errors,
+    record_check,
+    run_standalone,
+    unit_selected,
+)
+from validation.external import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PER_HOST,
+    DEFAULT_TIMEOUT,
+    DEFAULT_TTL_HOURS,
+    ExternalOptions,
+    check_urls,
+)
+from validation.linkgraph import LinkGraph
+from validation.markdown import iter_anchors, iter_links, scan_file
+from validation.pathindex import PathIndex, Resolved, path_index
+from validation.paths import REPO_ROOT
+from validation.walk import IncludePatterns, walk_files
+
+VALIDATOR_NAME = "docs-links"
+
+INCLUDE_PATTERNS = IncludePatterns(
+    (
+        "README.md",
+        "CONTRIBUTING.md",
+        "docs/**/*.md",
+        ".github/**/*.md",
+        "tests/evidence/**/*.md",
+        "packages/**/README.md",
+        "services/**/*.md",
+    )
 )
 
-EXCLUDE_PARTS = {".git", "node_modules", ".windsurf"}
+EXCLUDE_DIRS = {"node_modules", ".windsurf"}
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+
+JOBS_ENV = "FICECAL_VALIDATE_DOC_LINK_JOBS"
+# Below this many files to check, forking workers costs more than it saves.
+PARALLEL_MIN_DOCS = 64
 
 
 def fail(message: str) -> None:
-    print(f"[docs-links] ERROR: {message}")
-    sys.exit(1)
+    raise ValidationError(VALIDATOR_NAME, message)
 
 
 def iter_markdown_files() -> list[Path]:
-    files: set[Path] = set()
-    for pattern in INCLUDE_GLOBS:
-        files.update(REPO_ROOT.glob(pattern))
-
-    filtered = [
-        path
-        for path in files
-        if path.is_file() and not any(part in EXCLUDE_PARTS for part in path.parts)
-    ]
-    return sorted(filtered)
+    return sorted(REPO_ROOT / rel for rel in walk_files(REPO_ROOT, INCLUDE_PATTERNS, EXCLUDE_DIRS))
 
 
 def normalize_target(raw_target: str) -> str:
@@ -57,70 +110,415 @@ def normalize_target(raw_target: str) -> str:
     return target
 
 
-def is_external_or_anchor(target: str) -> bool:
+def is_external(target: str) -> bool:
     if not target:
         return True
 
-    if target.startswith("#"):
-        return True
+    # Fast path for plain relative paths: no scheme and no host.
+    if ":" not in target and not target.startswith("//"):
+        return False
 
     parsed = urlparse(target)
     if parsed.scheme in {"http", "https", "mailto", "tel", "data"}:
         return True
 
-    return False
-
-
-def resolve_local_target(doc_path: Path, target: str) -> Path:
-    target_no_query = target.split("?", 1)[0]
-    target_no_anchor = target_no_query.split("#", 1)[0]
-    decoded = unquote(target_no_anchor)
+    # Protocol-relative URLs (//host/path), common in HTML src attributes.
+    if parsed.netloc:
+        return True
 
-    if decoded.startswith("/"):
-        return (REPO_ROOT / decoded.lstrip("/")).resolve()
-    return (doc_path.parent / decoded).resolve()
+    return False
 
 
-def validate() -> None:
-    files = iter_markdown_files()
+def split_target(target: str) -> tuple[str, str]:
+    """Split a local target into its URL-decoded path and fragment."""
+    path, _, fragment = target.partition("#")
+    return unquote(path.split("?", 1)[0]), unquote(fragment)
+
+
+def resolve_local_target(index: PathIndex, doc_dir: str, path: str) -> Resolved:
+    return index.resolve(doc_dir, path)
+
+
+@dataclass
+class DocResult:
+    violations: list[Violation]
+    links: int
+    anchors: int
+    presence: dict[Path, bool]
+    anchor_sources: set[str]
+    elapsed_ns: int
+    targets: dict[str, None]  # distinct existing local targets, in link order
+    external: list[tuple[int, str]]  # (line, URL) of http(s) links
+
+
+def check_doc(index: PathIndex, doc_rel: str, links: Iterable[tuple[int, str]]) -> DocResult:
+    """Check the `(line, target)` links of one markdown file."""
+    started = time.perf_counter_ns()
+    rel_doc = Path(doc_rel)
+    doc_dir = rel_doc.parent.as_posix() if rel_doc.parent != Path(".") else ""
+    result = DocResult([], 0, 0, {}, set(), 0, {}, [])
+
+    for line, raw_target in links:
+        target = normalize_target(raw_target)
+
+        if is_external(target):
+            if target[:8].lower().startswith(("http://", "https://")):
+                # Titles are kept on URLs by normalize_target; URLs cannot contain spaces.
+                result.external.append((line, target.split(None, 1)[0]))
+            continue
+
+        path, fragment = split_target(target)
+        anchor_file: str | None = doc_rel
+        if path:
+            resolved = resolve_local_target(index, doc_dir, path)
+            result.links += 1
+            result.presence[resolved.path] = resolved.exists
+
+            if not resolved.exists:
+                shown = (
+                    resolved.path.relative_to(REPO_ROOT)
+                    if resolved.path.is_relative_to(REPO_ROOT)
+                    else resolved.path
+                )
+                message = f"{rel_doc}:{line} -> '{target}' (resolved: {shown})"
+                if resolved.case_hint:
+                    message += f"; case differs from {resolved.case_hint}"
+                result.violations.append(
+                    Violation(
+                        validator=VALIDATOR_NAME,
+                        message=message,
+                        path=doc_rel,
+                        rule="broken-link",
+                    )
+                )
+                continue
+
+            if resolved.rel and resolved.rel != doc_rel:
+                result.targets[resolved.rel] = None
+            markdown_target = resolved.is_file and resolved.rel.lower().endswith(MARKDOWN_SUFFIXES)
+            anchor_file = resolved.rel if markdown_target else None
+
+        if not fragment or anchor_file is None:
+            continue
+        result.anchors += 1
+        if anchor_file != doc_rel:
+            result.anchor_sources.add(anchor_file)
+        anchors = index.anchors(anchor_file)
+        # GitHub matches fragments case-insensitively against its lowercase slugs.
+        if fragment not in anchors and fragment.lower() not in anchors:
+            message = f"{rel_doc}:{line} -> '{target}' (no heading or id '{fragment}' in {anchor_file})"
+            result.violations.append(
+                Violation(
+                    validator=VALIDATOR_NAME,
+                    message=message,
+                    path=doc_rel,
+                    rule="broken-anchor",
+                )
+            )
+
+    result.elapsed_ns = time.perf_counter_ns() - started
+    return result
+
+
+def jobs_from_env() -> int:
+    try:
+        jobs = int(os.environ.get(JOBS_ENV, "1"))
+    except ValueError:
+        return 1
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+# Read-only state for pool workers. It is set before the pool forks, so workers share
+# the parent's index pages instead of each rebuilding it.
+_shared: dict[str, Any] = {}
+
+
+def _scan_doc(doc_rel: str) -> tuple[list[tuple[int, str]], frozenset[str]]:
+    with (REPO_ROOT / doc_rel).open(encoding="utf-8") as handle:
+        lines = handle.readlines()
+    return [(link.line, link.target) for link in iter_links(lines)], frozenset(iter_anchors(lines))
+
+
+def _check_shared_doc(doc_rel: str) -> DocResult:
+    return check_doc(_shared["index"], doc_rel, _shared["links"][doc_rel])
+
+
+def check_docs_parallel(index: PathIndex, docs: list[str], jobs: int) -> list[DocResult]:
+    """Check `docs` in a process pool; results come back in the order of `docs`.
+
+    Workers first scan their share of the files for links and heading anchors. The
+    parent adds the anchors and the docs' directory listings to `index`, then forks a
+    second pool that resolves links against that snapshot. Each file is read once.
+    """
+    context = multiprocessing.get_context("fork")
+    chunksize = max(1, len(docs) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        scanned = list(pool.map(_scan_doc, docs, chunksize=chunksize))
+
+    links: dict[str, list[tuple[int, str]]] = {}
+    for doc_rel, (doc_links, anchors) in zip(docs, scanned):
+        links[doc_rel] = doc_links
+        index.add_anchors(doc_rel, anchors)
+    index.preload(doc_rel.rpartition("/")[0] for doc_rel in docs)
+
+    _shared.update(index=index, links=links)
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            return list(pool.map(_check_shared_doc, docs, chunksize=chunksize))
+    finally:
+        _shared.clear()
+
+
+def external_violations(
+    links: list[tuple[str, int, str]],
+    options: ExternalOptions,
+) -> tuple[list[Violation], str]:
+    """Probe the `(doc, line, URL)` links; return violations and a summary fragment."""
+    results = check_urls((url for _, _, url in links), options)
+    violations = [
+        Violation(
+            validator=VALIDATOR_NAME,
+            message=f"{doc_rel}:{line} -> '{url}' ({results[url].detail})",
+            path=doc_rel,
+            rule="broken-external-link",
+        )
+        for doc_rel, line, url in links
+        if not results[url].alive
+    ]
+    distinct = {result.url: result for result in results.values()}
+    cached = sum(1 for result in distinct.values() if result.cached)
+    return violations, f"{len(distinct)} external URLs ({cached} cached)"
+
+
+def validate(
+    jobs: int | None = None,
+    graph: LinkGraph | None = None,
+    external: ExternalOptions | None = None,
+) -> str:
+    """Check every markdown file in scope.
+
+    Optionally record its links into `graph` and, with `external`, probe http(s) links.
+    """
+    jobs = jobs_from_env() if jobs is None else jobs
+    index = path_index(REPO_ROOT)
+    files: list[Path] = index.derived(VALIDATOR_NAME, iter_markdown_files)
     if not files:
         fail("No markdown files found in configured scope")
+    if graph is not None:
+        for doc_path in files:
+            graph.add_doc(doc_path.relative_to(REPO_ROOT).as_posix())
 
-    missing: list[str] = []
+    missing: list[Violation] = []
     links_checked = 0
-
-    for doc_path in files:
-        rel_doc = doc_path.relative_to(REPO_ROOT)
-        content = doc_path.read_text(encoding="utf-8")
-
-        for line_number, line in enumerate(content.splitlines(), start=1):
-            for match in LINK_PATTERN.finditer(line):
-                raw_target = match.group(1)
-                target = normalize_target(raw_target)
-
-                if is_external_or_anchor(target):
-                    continue
-
-                resolved = resolve_local_target(doc_path, target)
-                links_checked += 1
-
-                if not resolved.exists():
-                    missing.append(
-                        f"{rel_doc}:{line_number} -> '{target}' "
-                        f"(resolved: {resolved.relative_to(REPO_ROOT) if resolved.is_relative_to(REPO_ROOT) else resolved})"
-                    )
+    anchors_checked = 0
+    external_links: list[tuple[str, int, str]] = []
+    # Broken links are always collected, up to the shared --max-errors limit.
+    limit = max_errors()
+    truncated = False
+
+    with validation_cache(VALIDATOR_NAME, __file__) as cache:
+        units: list[tuple[str, dict[str, Any] | None]] = []
+        pending: list[str] = []
+        for doc_path in files:
+            doc_rel = doc_path.relative_to(REPO_ROOT).as_posix()
+            unit = f"doc:{doc_rel}"
+            if not unit_selected(VALIDATOR_NAME, unit):
+                continue
+            cached = cache.lookup(unit, (doc_path,))
+            units.append((doc_rel, cached))
+            if cached is None:
+                pending.append(doc_rel)
+
+        results: Iterator[DocResult]
+        if jobs > 1 and len(pending) >= PARALLEL_MIN_DOCS and "fork" in multiprocessing.get_all_start_methods():
+            results = iter(check_docs_parallel(index, pending, min(jobs, len(pending))))
+        else:
+            results = (
+                check_doc(index, doc_rel, ((link.line, link.target) for link in scan_file(REPO_ROOT / doc_rel)))
+                for doc_rel in pending
+            )
+
+        # Merged in file order, so output does not depend on how work was split.
+        for doc_rel, cached in units:
+            if cached is not None:
+                links_checked += cached.get("links", 0)
+                anchors_checked += cached.get("anchors", 0)
+                if graph is not None:
+                    graph.add_links(doc_rel, cached.get("targets", ()))
+                external_links.extend((doc_rel, line, url) for line, url in cached.get("external", ()))
+                record_check(Check(VALIDATOR_NAME, "markdown-links", doc_rel, "cached"))
+                continue
+
+            result = next(results)
+            links_checked += result.links
+            anchors_checked += result.anchors
+            missing.extend(result.violations)
+            if graph is not None:
+                graph.add_links(doc_rel, result.targets)
+            external_links.extend((doc_rel, line, url) for line, url in result.external)
+            record_check(
+                Check(
+                    VALIDATOR_NAME,
+                    "markdown-links",
+                    doc_rel,
+                    "failed" if result.violations else "passed",
+                    result.elapsed_ns,
+                    result.violations,
+                )
+            )
+            if not result.violations:
+                cache.record(
+                    f"doc:{doc_rel}",
+                    (REPO_ROOT / doc_rel,),
+                    presence=result.presence,
+                    data={
+                        "links": result.links,
+                        "anchors": result.anchors,
+                        "targets": list(result.targets),
+                        "external": result.external,
+                    },
+                    dependencies=[index.path(source) for source in sorted(result.anchor_sources)],
+                )
+            if limit > 0 and len(missing) >= limit:
+                truncated = True
+                break
+
+    summary = f"validated {len(files)} markdown files, {links_checked} local links, {anchors_checked} anchors"
+    header = "Broken local markdown links or anchors detected:"
+    if truncated:
+        del missing[limit:]
+        header = f"Broken local markdown links or anchors detected (stopped at --max-errors {limit}):"
+    elif external is not None:
+        broken_external, external_summary = external_violations(external_links, external)
+        summary += f", {external_summary}"
+        if broken_external:
+            missing.extend(broken_external)
+            header = "Broken markdown links, anchors or external URLs detected:"
 
     if missing:
-        print("[docs-links] ERROR: Broken local markdown links detected:")
-        for entry in missing:
-            print(f"- {entry}")
-        sys.exit(1)
-
-    print(f"[docs-links] OK: validated {len(files)} markdown files, {links_checked} local links")
+        raise ValidationError(
+            VALIDATOR_NAME,
+            header,
+            [violation.message for violation in missing],
+            violations=missing,
+        )
+
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate local markdown link targets")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help=f"Scan markdown files in N worker processes (0 = one per CPU; default ${JOBS_ENV} or 1)",
+    )
+    parser.add_argument("--graph", type=Path, metavar="OUT", help="Write the link graph to OUT")
+    parser.add_argument(
+        "--graph-format",
+        choices=("json", "adjacency"),
+        default="json",
+        help="Link graph format: JSON nodes and edge list (default) or tab-separated adjacency lists",
+    )
+    parser.add_argument("--orphans", action="store_true", help="List documents no other document links to")
+    parser.add_argument(
+        "--most-linked",
+        type=int,
+        metavar="N",
+        help="List the N documents with the most inbound links",
+    )
+    parser.add_argument(
+        "--links-to",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="List documents linking to PATH or anything below it (repeatable)",
+    )
+    parser.add_argument(
+        "--external",
+        action="store_true",
+        help="Also probe http(s) links over the network (never part of the default run)",
+    )
+    parser.add_argument(
+        "--external-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Per-request timeout for --external (default {DEFAULT_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--external-concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        metavar="N",
+        help=f"Requests in flight for --external (default {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--external-per-host",
+        type=int,
+        default=DEFAULT_PER_HOST,
+        metavar="N",
+        help=f"Connections per host for --external (default {DEFAULT_PER_HOST})",
+    )
+    parser.add_argument(
+        "--external-ttl",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        metavar="HOURS",
+        help=f"Re-probe healthy URLs after HOURS (default {DEFAULT_TTL_HOURS:g})",
+    )
+    add_common_arguments(parser)
+    return parser.parse_args()
+
+
+def print_graph_reports(graph: LinkGraph, args: argparse.Namespace, out: TextIO) -> None:
+    if args.graph:
+        args.graph.parent.mkdir(parents=True, exist_ok=True)
+        args.graph.write_text(graph.to_json() if args.graph_format == "json" else graph.to_adjacency())
+        print(f"[{VALIDATOR_NAME}] link graph: {len(graph.paths)} nodes written to {args.graph}", file=out)
+    if args.orphans:
+        orphans = graph.orphans()
+        print(f"[{VALIDATOR_NAME}] orphan documents ({len(orphans)}):", file=out)
+        for path in orphans:
+            print(f"- {path}", file=out)
+    if args.most_linked:
+        print(f"[{VALIDATOR_NAME}] most linked documents:", file=out)
+        for path, count in graph.most_linked(args.most_linked):
+            print(f"- {path} ({count})", file=out)
+    for target in args.links_to:
+        sources = graph.linking_to(target)
+        print(f"[{VALIDATOR_NAME}] documents linking to {target} ({len(sources)}):", file=out)
+        for source, targets in sources:
+            print(f"- {source} -> {', '.join(targets)}", file=out)
 
 
 def main() -> None:
-    validate()
+    args = parse_args()
+    if args.jobs is not None:
+        os.environ[JOBS_ENV] = str(args.jobs)
+    external = None
+    if args.external:
+        external = ExternalOptions(
+            timeout=args.external_timeout,
+            concurrency=args.external_concurrency,
+            per_host=args.external_per_host,
+            ttl_hours=args.external_ttl,
+        )
+    graph = LinkGraph() if args.graph or args.orphans or args.most_linked or args.links_to else None
+    # Reports go to stderr when stdout carries a JSON or JUnit report.
+    out = sys.stdout if args.format == "text" else sys.stderr
+
+    def run() -> str:
+        try:
+            return validate(graph=graph, external=external)
+        finally:
+            # Also printed when links are broken: "who links here" matters most then.
+            if graph is not None:
+                print_graph_reports(graph, args, out)
+
+    run_standalone(VALIDATOR_NAME, run, args)
 
 
 if __name__ == "__main__":
@@ -11,29 +11,33 @@ Checks:
 from __future__ import annotations
 
 import json
-import sys
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from validation.core import ValidationError, collect_errors, run_standalone
+from validation.paths import REPO_ROOT
+
+VALIDATOR_NAME = "feature-catalog"
 CATALOG_PATH = REPO_ROOT / "src" / "features" / "feature-catalog.json"
 
 
-def fail(message: str) -> None:
-    print(f"[feature-catalog] ERROR: {message}")
-    sys.exit(1)
+def fail(message: str, path: Path | None = CATALOG_PATH, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
 
 
 def load_catalog() -> dict:
     if not CATALOG_PATH.exists():
-        fail(f"Catalog file not found: {CATALOG_PATH.relative_to(REPO_ROOT)}")
+        fail(f"Catalog file not found: {CATALOG_PATH.relative_to(REPO_ROOT)}", rule="file-exists")
 
     try:
         return json.loads(CATALOG_PATH.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
-        fail(f"Invalid JSON: {exc}")
+        fail(f"Invalid JSON: {exc}", rule="json-syntax")
+
 
+def validate(catalog: dict | None = None) -> str:
+    if catalog is None:
+        catalog = load_catalog()
 
-def validate(catalog: dict) -> None:
     required_top_level = {
         "version": str,
         "updatedAt": str,
@@ -42,59 +46,76 @@ def validate(catalog: dict) -> None:
 
     for key, expected_type in required_top_level.items():
         if key not in catalog:
-            fail(f"Missing top-level key: {key}")
+            fail(f"Missing top-level key: {key}", pointer=f"/{key}", rule="required-key")
         if not isinstance(catalog[key], expected_type):
-            fail(f"Top-level key '{key}' must be of type {expected_type.__name__}")
-
-    modules = catalog["modules"]
-    seen_ids: set[str] = set()
-
-    for idx, module in enumerate(modules):
-        context = f"modules[{idx}]"
-        if not isinstance(module, dict):
-            fail(f"{context} must be an object")
-
-        for key, expected_type in (
-            ("id", str),
-            ("path", str),
-            ("dependsOn", list),
-            ("optional", bool),
-            ("status", str),
-        ):
-            if key not in module:
-                fail(f"{context} missing required key: {key}")
-            if not isinstance(module[key], expected_type):
-                fail(f"{context}.{key} must be of type {expected_type.__name__}")
-
-        module_id = module["id"]
-        if module_id in seen_ids:
-            fail(f"Duplicate module id: {module_id}")
-        seen_ids.add(module_id)
-
-        module_path = REPO_ROOT / module["path"]
-        if not module_path.exists():
             fail(
-                f"{context}.path does not exist in repository: {module['path']}"
+                f"Top-level key '{key}' must be of type {expected_type.__name__}",
+                pointer=f"/{key}",
+                rule="type",
             )
 
-    for idx, module in enumerate(modules):
-        context = f"modules[{idx}]"
-        module_id = module["id"]
-        for dep in module["dependsOn"]:
-            if not isinstance(dep, str):
-                fail(f"{context}.dependsOn values must be strings")
-            if dep not in seen_ids:
-                fail(f"{module_id} depends on unknown module id: {dep}")
-
-    print(
-        f"[feature-catalog] OK: validated {len(modules)} modules in "
-        f"{CATALOG_PATH.relative_to(REPO_ROOT)}"
-    )
+    modules = catalog["modules"]
+    seen_ids: set[str] = set()
+    well_formed: list[tuple[int, dict]] = []
+
+    with collect_errors(VALIDATOR_NAME) as errors:
+        for idx, module in enumerate(modules):
+            context = f"modules[{idx}]"
+            pointer = f"/modules/{idx}"
+            with errors.unit(CATALOG_PATH, rule="module", pointer=pointer):
+                if not isinstance(module, dict):
+                    fail(f"{context} must be an object", pointer=pointer, rule="type")
+
+                for key, expected_type in (
+                    ("id", str),
+                    ("path", str),
+                    ("dependsOn", list),
+                    ("optional", bool),
+                    ("status", str),
+                ):
+                    if key not in module:
+                        fail(f"{context} missing required key: {key}", pointer=pointer, rule="required-key")
+                    if not isinstance(module[key], expected_type):
+                        fail(
+                            f"{context}.{key} must be of type {expected_type.__name__}",
+                            pointer=f"{pointer}/{key}",
+                            rule="type",
+                        )
+                well_formed.append((idx, module))
+
+                module_id = module["id"]
+                if module_id in seen_ids:
+                    fail(f"Duplicate module id: {module_id}", pointer=f"{pointer}/id", rule="unique-id")
+                seen_ids.add(module_id)
+
+                module_path = REPO_ROOT / module["path"]
+                if not module_path.exists():
+                    fail(
+                        f"{context}.path does not exist in repository: {module['path']}",
+                        pointer=f"{pointer}/path",
+                        rule="path-exists",
+                    )
+
+        for idx, module in well_formed:
+            context = f"modules[{idx}]"
+            module_id = module["id"]
+            for dep_idx, dep in enumerate(module["dependsOn"]):
+                pointer = f"/modules/{idx}/dependsOn/{dep_idx}"
+                with errors.unit(CATALOG_PATH, rule="module-dependency", pointer=pointer):
+                    if not isinstance(dep, str):
+                        fail(f"{context}.dependsOn values must be strings", pointer=pointer, rule="type")
+                    if dep not in seen_ids:
+                        fail(
+                            f"{module_id} depends on unknown module id: {dep}",
+                            pointer=pointer,
+                            rule="dependency-exists",
+                        )
+
+    return f"validated {len(modules)} modules in {CATALOG_PATH.relative_to(REPO_ROOT)}"
 
 
 def main() -> None:
-    catalog = load_catalog()
-    validate(catalog)
+    run_standalone(VALIDATOR_NAME, validate)
 
 
 if __name__ == "__main__":
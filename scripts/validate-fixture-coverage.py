@@ -6,17 +6,31 @@ Checks:
 - required module fixture packs exist and include baseline files
 - required MCP fixture packs exist and include baseline files
 - MCP billing tool fixture packs align with capabilities response fixture
-- JSON fixtures parse successfully
+- version directories are named as semantic versions
+- JSON fixtures parse successfully; large row tables (`STREAMED_ARRAYS`) are
+  streamed rather than held in memory
+
+The fixture tree is read through the shared index in `validation/fixtures.py`: one
+`os.scandir` traversal, after which every existence, required-file and `input*` /
+`output.expected*` check is a set or dictionary lookup. Versions are listed and the
+latest one picked in semver order (`validation/versions.py`), so `10.0` follows `2.0`.
 """
 
 from __future__ import annotations
 
 import json
-import sys
 from pathlib import Path
 from typing import Any
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from validation.cache import ValidationCache, validation_cache
+from validation.capabilities import load_capabilities
+from validation.core import ErrorCollector, ValidationError, collect_errors, run_standalone, unit_selected
+from validation.fixtures import FixtureVersion, fixture_index
+from validation.jsonstream import JsonArrayReader
+from validation.paths import REPO_ROOT
+from validation.versions import parse_version
+
+VALIDATOR_NAME = "fixture-coverage"
 FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures"
 MODULE_ROOT = FIXTURE_ROOT
 MCP_ROOT = FIXTURE_ROOT / "mcp"
@@ -33,40 +47,94 @@ ALWAYS_REQUIRED_MCP_PACKS = {
     "mcp.context.envelope",
 }
 
+# Fixture files made of a small header around one large array (file name -> array
+# key). They are streamed with `JsonArrayReader` instead of going through the
+# index's payload memo, which would keep every row in memory for the whole run.
+STREAMED_ARRAYS = {
+    "parity.rows.json": "rows",
+}
+
 
-def fail(message: str) -> None:
-    print(f"[fixture-coverage] ERROR: {message}")
-    sys.exit(1)
+def fail(message: str, path: Path | str | None = None, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
 
 
-def load_json(path: Path, context: str) -> Any:
+def load_json(path: Path | str, context: str) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return fixture_index(FIXTURE_ROOT).load_json(path)
     except json.JSONDecodeError as exc:
-        fail(f"{context} invalid JSON: {exc}")
+        fail(f"{context} invalid JSON: {exc}", path=path, rule="json-syntax")
 
 
-def load_json_object(path: Path, context: str) -> dict[str, Any]:
+def load_json_object(path: Path | str, context: str) -> dict[str, Any]:
     payload = load_json(path, context)
     if not isinstance(payload, dict):
-        fail(f"{context} must be a JSON object")
+        fail(f"{context} must be a JSON object", path=path, rule="json-object")
     return payload
 
 
-def require_non_empty_string(container: dict[str, Any], key: str, context: str) -> str:
+def open_streamed(path: Path | str, context: str) -> JsonArrayReader:
+    """Open a `STREAMED_ARRAYS` file and read its header; must be used as a context manager."""
+    reader = JsonArrayReader(path, STREAMED_ARRAYS[Path(path).name])
+    try:
+        reader.read_header()
+    except json.JSONDecodeError as exc:
+        reader.close()
+        fail(f"{context} invalid JSON: {exc}", path=path, rule="json-syntax")
+    if not reader.is_object:
+        reader.close()
+        fail(f"{context} must be a JSON object", path=path, rule="json-object")
+    return reader
+
+
+def check_json_object(path: Path | str, context: str) -> None:
+    """Check that a fixture file is a JSON object, streaming `STREAMED_ARRAYS` files."""
+    if Path(path).name not in STREAMED_ARRAYS:
+        load_json_object(path, context)
+        return
+    with open_streamed(path, context) as reader:
+        try:
+            for _ in reader:
+                pass
+        except json.JSONDecodeError as exc:
+            fail(f"{context} invalid JSON: {exc}", path=path, rule="json-syntax")
+
+
+def require_non_empty_string(
+    container: dict[str, Any],
+    key: str,
+    context: str,
+    path: Path | None = None,
+    pointer: str = "",
+) -> str:
     value = container.get(key)
     if not isinstance(value, str) or not value:
-        fail(f"{context}.{key} must be a non-empty string")
+        fail(
+            f"{context}.{key} must be a non-empty string",
+            path=path,
+            pointer=f"{pointer}/{key}",
+            rule="non-empty-string",
+        )
     return value
 
 
-def list_version_dirs(pack_path: Path, context: str) -> list[Path]:
-    versions = sorted(child for child in pack_path.iterdir() if child.is_dir())
+def list_version_dirs(pack_path: Path, context: str) -> list[FixtureVersion]:
+    pack = fixture_index(FIXTURE_ROOT).pack(pack_path)
+    versions = [pack.versions[name] for name in pack.version_names()]
     if not versions:
-        fail(f"{context} has no version directories")
+        fail(f"{context} has no version directories", path=pack_path, rule="pack-versions")
     return versions
 
 
+def require_version_name(version: FixtureVersion, context: str) -> None:
+    if parse_version(version.name) is None:
+        fail(
+            f"{context} version directory '{version.name}' is not a semantic version (e.g. 1.0 or 1.2.0-rc.1)",
+            path=version.path,
+            rule="version-name",
+        )
+
+
 def required_mcp_files_for_pack(pack_name: str) -> set[str]:
     if pack_name == "mcp.capabilities.get":
         return {"response.expected.json"}
@@ -77,185 +145,263 @@ def required_mcp_files_for_pack(pack_name: str) -> set[str]:
     return {"request.valid.json", "request.invalid.json", "response.expected.json"}
 
 
-def validate_module_pack(pack_name: str, pack_path: Path) -> None:
+def validate_module_pack(
+    pack_name: str,
+    pack_path: Path,
+    cache: ValidationCache,
+    errors: ErrorCollector,
+) -> None:
     versions = list_version_dirs(pack_path, f"module pack '{pack_name}'")
 
     for version in versions:
-        notes_path = version / "notes.md"
-        if not notes_path.exists():
-            fail(f"module pack '{pack_name}' version '{version.name}' missing notes.md")
-
-        json_files = sorted(version.glob("*.json"))
-        if not json_files:
-            fail(f"module pack '{pack_name}' version '{version.name}' has no JSON fixtures")
-
-        has_input = any(path.name.startswith("input") for path in json_files)
-        has_expected_output = any(path.name.startswith("output.expected") for path in json_files)
-
-        if not has_input:
-            fail(
-                f"module pack '{pack_name}' version '{version.name}' must include at least one input*.json"
-            )
-        if not has_expected_output:
-            fail(
-                f"module pack '{pack_name}' version '{version.name}' must include at least one "
-                "output.expected*.json"
-            )
-
-        for json_path in json_files:
-            load_json(json_path, f"module pack '{pack_name}'/{version.name}/{json_path.name}")
+        unit = f"module-pack:{pack_name}/{version.name}"
+        if not unit_selected(VALIDATOR_NAME, unit):
+            continue
+        inputs = [fixture_file.location for fixture_file in version.files.values()]
+        if cache.lookup(unit, inputs) is not None:
+            errors.cached(version.path, "module-pack")
+            continue
+
+        with errors.unit(version.path, rule="module-pack") as outcome:
+            with errors.unit():
+                require_version_name(version, f"module pack '{pack_name}'")
+            if "notes.md" not in version.files:
+                with errors.unit():
+                    fail(
+                        f"module pack '{pack_name}' version '{version.name}' missing notes.md",
+                        path=version.path / "notes.md",
+                        rule="required-file",
+                    )
+
+            json_files = version.json_files()
+            if not json_files:
+                with errors.unit():
+                    fail(
+                        f"module pack '{pack_name}' version '{version.name}' has no JSON fixtures",
+                        path=version.path,
+                        rule="required-file",
+                    )
+
+            if not version.has_prefix("input", ".json"):
+                with errors.unit():
+                    fail(
+                        f"module pack '{pack_name}' version '{version.name}' must include at least one "
+                        "input*.json",
+                        path=version.path,
+                        rule="required-file",
+                    )
+            if not version.has_prefix("output.expected", ".json"):
+                with errors.unit():
+                    fail(
+                        f"module pack '{pack_name}' version '{version.name}' must include at least one "
+                        "output.expected*.json",
+                        path=version.path,
+                        rule="required-file",
+                    )
+
+            for json_file in json_files:
+                with errors.unit():
+                    load_json(json_file.location, f"module pack '{pack_name}'/{version.name}/{json_file.name}")
+
+        if outcome.ok:
+            cache.record(unit, inputs)
 
 
 def capabilities_billing_tools() -> tuple[set[str], str]:
-    capabilities_pack = MCP_ROOT / "mcp.capabilities.get"
-    versions = list_version_dirs(capabilities_pack, "MCP pack 'mcp.capabilities.get'")
-
-    latest = versions[-1]
-    response_path = latest / "response.expected.json"
-    if not response_path.exists():
-        fail(
-            "MCP pack 'mcp.capabilities.get' latest version "
-            f"'{latest.name}' missing response.expected.json"
-        )
-
-    payload = load_json_object(response_path, "mcp.capabilities.get response.expected")
-
-    namespaces = payload.get("toolNamespaces")
-    if not isinstance(namespaces, list):
-        fail("mcp.capabilities.get response.expected.toolNamespaces must be an array")
-
-    tools: set[str] = set()
-    for idx, namespace in enumerate(namespaces):
-        if not isinstance(namespace, dict):
-            fail(f"toolNamespaces[{idx}] must be an object")
-        ns_tools = namespace.get("tools")
-        if not isinstance(ns_tools, list) or not all(isinstance(tool, str) for tool in ns_tools):
-            fail(f"toolNamespaces[{idx}].tools must be an array of strings")
-        tools.update(ns_tools)
+    capabilities = load_capabilities(VALIDATOR_NAME)
+    return set(capabilities.tools), capabilities.parity_fixture_version
 
-    if not tools:
-        fail("No MCP tools found in mcp.capabilities.get fixture")
 
-    compatibility = payload.get("compatibility")
-    if not isinstance(compatibility, dict):
-        fail("mcp.capabilities.get response.expected.compatibility must be an object")
-
-    parity_fixture_version = require_non_empty_string(
-        compatibility,
-        "parityFixtureVersion",
-        "mcp.capabilities.get response.expected.compatibility",
-    )
-
-    return tools, parity_fixture_version
-
-
-def validate_legacy_alias_parity_contract(tools: set[str], expected_parity_version: str) -> None:
+def validate_legacy_alias_parity_contract(
+    tools: set[str],
+    expected_parity_version: str,
+    errors: ErrorCollector,
+) -> None:
+    index = fixture_index(FIXTURE_ROOT)
     parity_pack = PARITY_ROOT / expected_parity_version
-    if not parity_pack.exists() or not parity_pack.is_dir():
+    if not index.is_dir(parity_pack):
         fail(
             "legacy alias parity fixture version from capabilities does not exist: "
-            f"legacy-alias-parity/{expected_parity_version}"
+            f"legacy-alias-parity/{expected_parity_version}",
+            path=parity_pack,
+            rule="parity-version-exists",
         )
 
     parity_rows_path = parity_pack / "parity.rows.json"
-    if not parity_rows_path.exists():
+    if index.file(parity_rows_path) is None:
         fail(
             "legacy alias parity pack missing parity.rows.json at "
-            f"legacy-alias-parity/{expected_parity_version}"
+            f"legacy-alias-parity/{expected_parity_version}",
+            path=parity_rows_path,
+            rule="required-file",
         )
 
-    payload = load_json_object(
-        parity_rows_path,
-        f"legacy-alias-parity/{expected_parity_version}/parity.rows.json",
-    )
-
-    fixture_version = require_non_empty_string(payload, "fixtureVersion", "parity.rows")
+    context = f"legacy-alias-parity/{expected_parity_version}/parity.rows.json"
+    with open_streamed(parity_rows_path, context) as reader:
+        # fixtureVersion normally precedes the rows; check it before streaming them
+        # when it does, otherwise once the whole document has been read.
+        version_checked = "fixtureVersion" in reader.header or not reader.is_array
+        if version_checked:
+            validate_parity_version(reader.header, expected_parity_version, parity_rows_path)
+        if not reader.is_array or reader.empty:
+            fail(
+                "parity.rows.rows must be a non-empty array",
+                path=parity_rows_path,
+                pointer="/rows",
+                rule="non-empty-array",
+            )
+        try:
+            for idx, row in enumerate(reader):
+                with errors.unit(parity_rows_path, rule="parity-contract-row", pointer=f"/rows/{idx}"):
+                    validate_parity_row(idx, row, tools, parity_rows_path)
+        except json.JSONDecodeError as exc:
+            fail(f"{context} invalid JSON: {exc}", path=parity_rows_path, rule="json-syntax")
+        if not version_checked:
+            validate_parity_version(reader.header, expected_parity_version, parity_rows_path)
+
+
+def validate_parity_version(header: dict[str, Any], expected_parity_version: str, parity_rows_path: Path) -> None:
+    fixture_version = require_non_empty_string(header, "fixtureVersion", "parity.rows", path=parity_rows_path)
     if fixture_version != expected_parity_version:
         fail(
             "legacy alias parity fixtureVersion must match capabilities parityFixtureVersion "
-            f"('{expected_parity_version}'), got '{fixture_version}'"
+            f"('{expected_parity_version}'), got '{fixture_version}'",
+            path=parity_rows_path,
+            pointer="/fixtureVersion",
+            rule="parity-version-match",
         )
 
-    rows = payload.get("rows")
-    if not isinstance(rows, list) or not rows:
-        fail("parity.rows.rows must be a non-empty array")
 
-    for idx, row in enumerate(rows):
-        context = f"parity.rows.rows[{idx}]"
-        if not isinstance(row, dict):
-            fail(f"{context} must be an object")
-        canonical_tool = require_non_empty_string(row, "canonicalTool", context)
-        if canonical_tool not in tools:
-            fail(
-                f"{context}.canonicalTool '{canonical_tool}' not found in "
-                "mcp.capabilities.get toolNamespaces"
-            )
+def validate_parity_row(idx: int, row: Any, tools: set[str], parity_rows_path: Path) -> None:
+    context = f"parity.rows.rows[{idx}]"
+    pointer = f"/rows/{idx}"
+    if not isinstance(row, dict):
+        fail(f"{context} must be an object", path=parity_rows_path, pointer=pointer, rule="type")
+    canonical_tool = require_non_empty_string(
+        row,
+        "canonicalTool",
+        context,
+        path=parity_rows_path,
+        pointer=pointer,
+    )
+    if canonical_tool not in tools:
+        fail(
+            f"{context}.canonicalTool '{canonical_tool}' not found in "
+            "mcp.capabilities.get toolNamespaces",
+            path=parity_rows_path,
+            pointer=f"{pointer}/canonicalTool",
+            rule="capability-tool-declared",
+        )
 
 
-def validate_mcp_pack(pack_name: str, pack_path: Path) -> None:
+def validate_mcp_pack(
+    pack_name: str,
+    pack_path: Path,
+    cache: ValidationCache,
+    errors: ErrorCollector,
+) -> None:
     versions = list_version_dirs(pack_path, f"MCP pack '{pack_name}'")
     required_files = required_mcp_files_for_pack(pack_name)
 
     for version in versions:
-        notes_path = version / "notes.md"
-        if not notes_path.exists():
-            fail(f"MCP pack '{pack_name}' version '{version.name}' missing notes.md")
-
-        for file_name in required_files:
-            target = version / file_name
-            if not target.exists():
-                fail(
-                    f"MCP pack '{pack_name}' version '{version.name}' missing required file: {file_name}"
-                )
-            load_json_object(target, f"MCP pack '{pack_name}'/{version.name}/{file_name}")
-
-
-def validate() -> None:
-    if not FIXTURE_ROOT.exists():
-        fail(f"Fixture root not found: {FIXTURE_ROOT.relative_to(REPO_ROOT)}")
-    if not MCP_ROOT.exists():
-        fail(f"MCP fixture root not found: {MCP_ROOT.relative_to(REPO_ROOT)}")
-
-    module_pack_names = sorted(
-        child.name for child in MODULE_ROOT.iterdir() if child.is_dir() and child.name != "mcp"
-    )
+        unit = f"mcp-pack:{pack_name}/{version.name}"
+        if not unit_selected(VALIDATOR_NAME, unit):
+            continue
+        inputs = [fixture_file.location for fixture_file in version.files.values()]
+        if cache.lookup(unit, inputs) is not None:
+            errors.cached(version.path, "mcp-pack")
+            continue
+
+        with errors.unit(version.path, rule="mcp-pack") as outcome:
+            with errors.unit():
+                require_version_name(version, f"MCP pack '{pack_name}'")
+            if "notes.md" not in version.files:
+                with errors.unit():
+                    fail(
+                        f"MCP pack '{pack_name}' version '{version.name}' missing notes.md",
+                        path=version.path / "notes.md",
+                        rule="required-file",
+                    )
+
+            for file_name in sorted(required_files):
+                with errors.unit():
+                    target = version.files.get(file_name)
+                    if target is None:
+                        fail(
+                            f"MCP pack '{pack_name}' version '{version.name}' missing required file: {file_name}",
+                            path=version.path / file_name,
+                            rule="required-file",
+                        )
+                    check_json_object(target.location, f"MCP pack '{pack_name}'/{version.name}/{file_name}")
+
+        if outcome.ok:
+            cache.record(unit, inputs)
+
+
+def validate() -> str:
+    with validation_cache(VALIDATOR_NAME, __file__) as cache, collect_errors(VALIDATOR_NAME) as errors:
+        return validate_tree(cache, errors)
+
+
+def validate_tree(cache: ValidationCache, errors: ErrorCollector) -> str:
+    index = fixture_index(FIXTURE_ROOT)
+    if not index.is_dir(FIXTURE_ROOT):
+        fail(
+            f"Fixture root not found: {FIXTURE_ROOT.relative_to(REPO_ROOT)}",
+            path=FIXTURE_ROOT,
+            rule="fixture-root",
+        )
+    if not index.is_dir(MCP_ROOT):
+        fail(
+            f"MCP fixture root not found: {MCP_ROOT.relative_to(REPO_ROOT)}",
+            path=MCP_ROOT,
+            rule="fixture-root",
+        )
+
+    module_pack_names = index.module_pack_names()
 
     missing_module_packs = REQUIRED_MODULE_PACKS - set(module_pack_names)
     if missing_module_packs:
-        fail(f"Missing required module fixture packs: {sorted(missing_module_packs)}")
+        with errors.unit(FIXTURE_ROOT):
+            fail(f"Missing required module fixture packs: {sorted(missing_module_packs)}", rule="required-pack")
 
     for module_pack in module_pack_names:
-        validate_module_pack(module_pack, MODULE_ROOT / module_pack)
+        with errors.unit(MODULE_ROOT / module_pack):
+            validate_module_pack(module_pack, MODULE_ROOT / module_pack, cache, errors)
 
-    mcp_pack_names = sorted(child.name for child in MCP_ROOT.iterdir() if child.is_dir())
+    mcp_pack_names = index.mcp_pack_names()
     capability_tools, parity_fixture_version = capabilities_billing_tools()
     required_mcp_packs = ALWAYS_REQUIRED_MCP_PACKS | capability_tools
 
     missing_mcp_packs = required_mcp_packs - set(mcp_pack_names)
     if missing_mcp_packs:
-        fail(f"Missing required MCP fixture packs: {sorted(missing_mcp_packs)}")
+        with errors.unit(MCP_ROOT):
+            fail(f"Missing required MCP fixture packs: {sorted(missing_mcp_packs)}", rule="required-pack")
 
     unexpected_mcp_packs = set(mcp_pack_names) - required_mcp_packs
     if unexpected_mcp_packs:
-        fail(
-            "Unexpected MCP fixture packs not declared in capabilities baseline: "
-            f"{sorted(unexpected_mcp_packs)}"
-        )
+        with errors.unit(MCP_ROOT):
+            fail(
+                "Unexpected MCP fixture packs not declared in capabilities baseline: "
+                f"{sorted(unexpected_mcp_packs)}",
+                rule="declared-pack",
+            )
 
-    for mcp_pack in sorted(required_mcp_packs):
-        validate_mcp_pack(mcp_pack, MCP_ROOT / mcp_pack)
+    for mcp_pack in sorted(required_mcp_packs & set(mcp_pack_names)):
+        with errors.unit(MCP_ROOT / mcp_pack):
+            validate_mcp_pack(mcp_pack, MCP_ROOT / mcp_pack, cache, errors)
 
-    validate_legacy_alias_parity_contract(capability_tools, parity_fixture_version)
+    with errors.unit():
+        validate_legacy_alias_parity_contract(capability_tools, parity_fixture_version, errors)
 
-    print(
-        "[fixture-coverage] OK: validated "
-        f"{len(module_pack_names)} module packs and {len(required_mcp_packs)} required MCP packs "
+    return (
+        f"validated {len(module_pack_names)} module packs and {len(required_mcp_packs)} required MCP packs "
         f"(parity fixture version {parity_fixture_version})"
     )
 
 
 def main() -> None:
-    validate()
+    run_standalone(VALIDATOR_NAME, validate)
 
 
 if __name__ == "__main__":
@@ -2,213 +2,694 @@
 """Validate MCP legacy alias parity fixture baseline.
 
 Checks:
-- parity fixture file exists and is valid JSON
+- parity fixture file of the version pinned by the capabilities fixture
+  (`compatibility.parityFixtureVersion`, `validation/capabilities.py`) exists and is
+  valid JSON; its rows are streamed, so memory stays flat for large tables
 - each row has required keys
 - fixture file references resolve to existing files
 - legacyAlias and canonicalTool values are unique
+- canonicalTool is a billing tool of the provider rule table
+  (`tests/contracts/live-smoke/billing-provider-baselines.json`) and the response's
+  providerAdapterId is its adapter id
 - request/response fixtures satisfy parity contract expectations
+- per `parityCheck` mode, the response recorded through the legacy alias
+  (`legacyResponseFixture`) matches the canonical expected response:
+  - `response_shape`: no legacy response; the canonical fixtures are checked alone
+  - `value_equivalence`: equal JSON values, except that `canonical.*` numbers may
+    differ within the row's `tolerances`, e.g. `{"canonical.infraTotal": {"abs": 0.01},
+    "canonical.cudPct": {"pct": 0.5}}` (percent of the expected value)
+  - `structural_diff`: the same keys, array lengths and JSON types; a failure lists
+    the added, removed and changed paths
+  Both comparisons are hash-first (`validation/treediff.py`): identical subtrees are
+  skipped without being walked
+
+Rows usually share a handful of request/response fixtures. Each distinct reference
+is resolved once, each referenced file loaded and shape-checked once, and each
+request/response pair cross-checked once (`ParityFixtures`); rows reuse the results.
+Only passing results are kept, so a broken fixture is reported for every row that
+references it, in that row's context.
+
+With `--jobs N` (or `FICECAL_VALIDATE_PARITY_JOBS=N`) a table longer than
+`PARALLEL_MIN_ROWS` has the fixtures of its remaining rows checked in chunks by N
+forked workers. Field and uniqueness checks stay in the parent and results are
+reported in row order, so the report is identical to a serial run.
 """
 
 from __future__ import annotations
 
+import argparse
+import itertools
 import json
-import sys
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-PARITY_PATH = (
-    REPO_ROOT
-    / "tests"
-    / "contracts"
-    / "fixtures"
-    / "mcp"
-    / "legacy-alias-parity"
-    / "1.0"
-    / "parity.rows.json"
+from typing import Any, Callable, Iterable, Iterator
+
+from validation.baselines import load_baseline_rules
+from validation.capabilities import load_capabilities
+from validation.core import (
+    ErrorCollector,
+    ValidationError,
+    Violation,
+    add_common_arguments,
+    collect_errors,
+    run_standalone,
 )
+from validation.digestset import DigestSet
+from validation.fixtures import fixture_index
+from validation.jsonstream import JsonArrayReader
+from validation.paths import REPO_ROOT
+from validation.schema import compile_schema
+from validation.schemas import (
+    CANONICAL_NUMBER_KEYS,
+    PARITY_HEADER,
+    PARITY_REQUEST,
+    PARITY_ROW,
+    PARITY_ROWS,
+    RESPONSE_EXPECTED,
+    SCOPE_KEYS,
+)
+from validation.treediff import Difference, TreeDigests, diff_trees, json_type, type_digests, value_digests
+
+VALIDATOR_NAME = "legacy-alias-parity"
+FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures"
+PARITY_FILE_NAME = "parity.rows.json"
+
+JOBS_ENV = "FICECAL_VALIDATE_PARITY_JOBS"
+# Rows checked in-process before a pool is started; shorter tables never fork.
+PARALLEL_MIN_ROWS = 20000
+# Rows per work item sent to a worker.
+CHUNK_ROWS = 4096
+
+check_parity_header = compile_schema(PARITY_HEADER, VALIDATOR_NAME)
+check_parity_rows = compile_schema(PARITY_ROWS, VALIDATOR_NAME)
+check_row = compile_schema(PARITY_ROW, VALIDATOR_NAME)
+check_request = compile_schema(PARITY_REQUEST, VALIDATOR_NAME)
+check_response = compile_schema(RESPONSE_EXPECTED, VALIDATOR_NAME)
+
+PARITY_CHECKS = ("response_shape", "value_equivalence", "structural_diff")
+# Checks that compare legacyResponseFixture with expectedResponseFixture.
+COMPARED_CHECKS = frozenset({"value_equivalence", "structural_diff"})
+TOLERANCE_KINDS = ("abs", "pct")
+# Differences listed in a failure message; the rest are counted.
+MAX_LISTED_DIFFERENCES = 5
+
+# Tolerance of one canonical number: ("abs" | "pct", amount).
+Tolerance = tuple[str, float]
+
+def fail(message: str, path: Path | None = None, pointer: str = "", rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, pointer=pointer, rule=rule)
+
+
+class ParityFixtures:
+    """Per-run memo of the fixtures parity rows reference, relative to `parity_path`.
+
+    Holds resolved references, existence answers for paths outside the fixture index,
+    loaded payloads and the (check, path) shape checks and request/response pairs that
+    passed. Failures are not stored.
+    """
+
+    def __init__(self, parity_path: Path) -> None:
+        self.parity_path = parity_path
+        # Supported canonical tools: the billing provider rule table (`validation/baselines.py`).
+        self.adapter_ids = load_baseline_rules(VALIDATOR_NAME).adapter_ids()
+        self.index = fixture_index(FIXTURE_ROOT)
+        self.base = os.path.realpath(parity_path.parent)
+        self.paths: dict[str, Path] = {}
+        self.components: dict[tuple[str, str], str] = {}
+        self.payloads: dict[Path, dict[str, Any]] = {}
+        self.on_disk: dict[Path, bool] = {}
+        self.shapes: set[tuple[Callable[..., None], Path]] = set()
+        self.pairs: set[tuple[Path, Path]] = set()
+        self.digests = {"value_equivalence": value_digests(), "structural_diff": type_digests()}
+        self.compared: set[tuple[str, Path, Path, tuple[tuple[str, Tolerance], ...]]] = set()
+
+    def resolve(self, reference: str) -> Path:
+        """Return `(parity directory / reference).resolve()`.
+
+        Resolved one component at a time from an already-real directory, so each
+        directory shared by several references is checked for a symlink only once.
+        """
+        path = self.paths.get(reference)
+        if path is None:
+            location = os.sep if os.path.isabs(reference) else self.base
+            for name in (reference.replace(os.altsep, os.sep) if os.altsep else reference).split(os.sep):
+                if name in {"", "."}:
+                    continue
+                if name == "..":
+                    location = os.path.dirname(location)
+                    continue
+                location = self._component(location, name)
+            path = self.paths[reference] = Path(location)
+        return path
+
+    def _component(self, directory: str, name: str) -> str:
+        real = self.components.get((directory, name))
+        if real is None:
+            candidate = os.path.join(directory, name)
+            real = os.path.realpath(candidate) if os.path.islink(candidate) else candidate
+            self.components[(directory, name)] = real
+        return real
+
+    def exists(self, path: Path) -> bool:
+        if path in self.payloads or self.index.exists(path):
+            return True
+        # The index only knows what it walked under the fixture root; a reference outside
+        # it (or to a path the walk missed) is looked up on disk, once per path.
+        found = self.on_disk.get(path)
+        if found is None:
+            found = self.on_disk[path] = path.exists()
+        return found
+
+    def load(self, path: Path, context: str) -> dict[str, Any]:
+        payload = self.payloads.get(path)
+        if payload is None:
+            payload = self.payloads[path] = load_json(path, context)
+        return payload
+
+    def check_shape(self, check: Callable[..., None], path: Path, payload: dict[str, Any], context: str) -> None:
+        if (check, path) not in self.shapes:
+            check(payload, context, path)
+            self.shapes.add((check, path))
+
+    def compare(
+        self,
+        parity_check: str,
+        expected_path: Path,
+        expected: dict[str, Any],
+        legacy_path: Path,
+        legacy: dict[str, Any],
+        tolerances: dict[str, Tolerance],
+    ) -> list[Difference]:
+        """Differences between the legacy and expected responses under `parity_check`."""
+        key = (parity_check, expected_path, legacy_path, tuple(sorted(tolerances.items())))
+        if key in self.compared:
+            return []
+        digests: TreeDigests = self.digests[parity_check]
+        leaf_equal = within_tolerance(tolerances) if tolerances else None
+        differences = diff_trees(expected, legacy, digests, leaf_equal)
+        if not differences:
+            self.compared.add(key)
+        return differences
+
+
+def pinned_parity_path() -> Path:
+    """Return `parity.rows.json` of the version pinned by the capabilities fixture.
+
+    The same `compatibility.parityFixtureVersion` fixture-coverage checks against, so a
+    newer parity pack is not validated until capabilities adopts it.
+    """
+    capabilities = load_capabilities(VALIDATOR_NAME)
+    if not fixture_index(FIXTURE_ROOT).is_dir(capabilities.parity_pack):
+        fail(
+            "legacy alias parity fixture version from capabilities does not exist: "
+            f"legacy-alias-parity/{capabilities.parity_fixture_version}",
+            path=capabilities.parity_pack,
+            rule="parity-version-exists",
+        )
+    return capabilities.parity_pack / PARITY_FILE_NAME
 
-CANONICAL_PROVIDER_IDS = {
-    "billing.openops.ingest": "openops-billing",
-    "billing.aws.ingest": "aws-billing",
-    "billing.azure.ingest": "azure-billing",
-    "billing.gcp.ingest": "gcp-billing",
-}
-
-
-def fail(message: str) -> None:
-    print(f"[legacy-alias-parity] ERROR: {message}")
-    sys.exit(1)
-
-
-def load_parity() -> dict:
-    if not PARITY_PATH.exists():
-        fail(f"Fixture file not found: {PARITY_PATH.relative_to(REPO_ROOT)}")
 
-    try:
-        return json.loads(PARITY_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        fail(f"Invalid JSON: {exc}")
+def open_parity(parity_path: Path) -> JsonArrayReader:
+    if not fixture_index(FIXTURE_ROOT).exists(parity_path):
+        fail(
+            f"Fixture file not found: {parity_path.relative_to(REPO_ROOT)}",
+            path=parity_path,
+            rule="file-exists",
+        )
+    # Streamed rather than loaded through the fixture index, which would keep the
+    # whole table in memory for the rest of the run.
+    return JsonArrayReader(parity_path, "rows")
 
 
 def load_json(path: Path, context: str) -> dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = fixture_index(FIXTURE_ROOT).load_json(path)
     except json.JSONDecodeError as exc:
-        fail(f"{context} invalid JSON: {exc}")
+        fail(f"{context} invalid JSON: {exc}", path=path, rule="json-syntax")
 
     if not isinstance(data, dict):
-        fail(f"{context} must be a JSON object")
+        fail(f"{context} must be a JSON object", path=path, rule="json-object")
     return data
 
 
-def validate_non_empty_string(container: dict[str, Any], key: str, context: str) -> str:
-    value = container.get(key)
-    if not isinstance(value, str) or not value:
-        fail(f"{context}.{key} must be a non-empty string")
-    return value
-
-
 def validate_response_shape(
     row_context: str,
     canonical_tool: str,
+    request_path: Path,
     request_payload: dict[str, Any],
+    response_path: Path,
     response_payload: dict[str, Any],
+    parity_path: Path,
+    fixtures: ParityFixtures,
 ) -> None:
-    expected_provider = CANONICAL_PROVIDER_IDS.get(canonical_tool)
+    expected_provider = fixtures.adapter_ids.get(canonical_tool)
     if expected_provider is None:
-        fail(f"{row_context}.canonicalTool unsupported for response_shape parity check: {canonical_tool}")
-
-    integration_run_id = validate_non_empty_string(
-        request_payload, "integrationRunId", f"{row_context}.request"
-    )
-    start_date = validate_non_empty_string(request_payload, "startDate", f"{row_context}.request")
-    end_date = validate_non_empty_string(request_payload, "endDate", f"{row_context}.request")
-    currency = validate_non_empty_string(request_payload, "currency", f"{row_context}.request")
-    validate_non_empty_string(request_payload, "mappingProfile", f"{row_context}.request")
+        fail(
+            f"{row_context}.canonicalTool unsupported for response_shape parity check: {canonical_tool}",
+            path=parity_path,
+            rule="parity-supported-tool",
+        )
 
-    response_integration_run_id = validate_non_empty_string(
-        response_payload, "integrationRunId", f"{row_context}.response"
-    )
-    provider_adapter_id = validate_non_empty_string(
-        response_payload, "providerAdapterId", f"{row_context}.response"
-    )
+    fixtures.check_shape(check_request, request_path, request_payload, f"{row_context}.request")
+    fixtures.check_shape(check_response, response_path, response_payload, f"{row_context}.response")
 
-    if response_integration_run_id != integration_run_id:
-        fail(f"{row_context}.response.integrationRunId must match request.integrationRunId")
+    # Run id and scope depend only on the pair; the provider also on the row's tool.
+    pair_checked = (request_path, response_path) in fixtures.pairs
+    if not pair_checked and response_payload["integrationRunId"] != request_payload["integrationRunId"]:
+        fail(
+            f"{row_context}.response.integrationRunId must match request.integrationRunId",
+            path=response_path,
+            pointer="/integrationRunId",
+            rule="run-id-match",
+        )
+    provider_adapter_id = response_payload["providerAdapterId"]
     if provider_adapter_id != expected_provider:
         fail(
             f"{row_context}.response.providerAdapterId expected '{expected_provider}' "
-            f"for canonical tool '{canonical_tool}', got '{provider_adapter_id}'"
-        )
-
-    scope = response_payload.get("scope")
-    if not isinstance(scope, dict):
-        fail(f"{row_context}.response.scope must be an object")
-    if validate_non_empty_string(scope, "startDate", f"{row_context}.response.scope") != start_date:
-        fail(f"{row_context}.response.scope.startDate must match request.startDate")
-    if validate_non_empty_string(scope, "endDate", f"{row_context}.response.scope") != end_date:
-        fail(f"{row_context}.response.scope.endDate must match request.endDate")
-    if validate_non_empty_string(scope, "currency", f"{row_context}.response.scope") != currency:
-        fail(f"{row_context}.response.scope.currency must match request.currency")
-
-    canonical = response_payload.get("canonical")
-    if not isinstance(canonical, dict):
-        fail(f"{row_context}.response.canonical must be an object")
-    for key in ("infraTotal", "cudPct", "budgetCap", "nRef"):
-        value = canonical.get(key)
-        if not isinstance(value, (int, float)):
-            fail(f"{row_context}.response.canonical.{key} must be a number")
-
-    provenance = response_payload.get("provenance")
-    if not isinstance(provenance, dict):
-        fail(f"{row_context}.response.provenance must be an object")
-    validate_non_empty_string(provenance, "sourceVersion", f"{row_context}.response.provenance")
-    coverage_pct = provenance.get("coveragePct")
-    if not isinstance(coverage_pct, (int, float)):
-        fail(f"{row_context}.response.provenance.coveragePct must be a number")
-    mapping_confidence = provenance.get("mappingConfidence")
-    if mapping_confidence not in {"low", "medium", "high"}:
-        fail(
-            f"{row_context}.response.provenance.mappingConfidence must be one of: "
-            "low, medium, high"
-        )
-    warnings = provenance.get("warnings")
-    if not isinstance(warnings, list) or not all(isinstance(item, str) for item in warnings):
-        fail(f"{row_context}.response.provenance.warnings must be an array of strings")
-
-
-def validate(data: dict) -> None:
-    fixture_version = data.get("fixtureVersion")
-    rows = data.get("rows")
-
-    if not isinstance(fixture_version, str) or not fixture_version:
-        fail("Top-level key 'fixtureVersion' must be a non-empty string")
-    if not isinstance(rows, list) or not rows:
-        fail("Top-level key 'rows' must be a non-empty list")
-
-    seen_aliases: set[str] = set()
-    seen_tools: set[str] = set()
-
-    for idx, row in enumerate(rows):
-        context = f"rows[{idx}]"
-        if not isinstance(row, dict):
-            fail(f"{context} must be an object")
-
-        for key in (
-            "legacyAlias",
-            "canonicalTool",
-            "requestFixture",
-            "expectedResponseFixture",
-            "parityCheck",
-        ):
-            value = row.get(key)
-            if not isinstance(value, str) or not value:
-                fail(f"{context}.{key} must be a non-empty string")
-
-        alias = row["legacyAlias"]
-        tool = row["canonicalTool"]
-        parity_check = row["parityCheck"]
-
-        if not alias.startswith("finops."):
-            fail(f"{context}.legacyAlias must start with 'finops.'")
-        if alias.removeprefix("finops.") != tool:
-            fail(f"{context}.legacyAlias must map directly to canonicalTool via finops.* prefix")
-        if parity_check != "response_shape":
-            fail(f"{context}.parityCheck unsupported: {parity_check}")
-
-        if alias in seen_aliases:
-            fail(f"Duplicate legacyAlias: {alias}")
-        if tool in seen_tools:
-            fail(f"Duplicate canonicalTool: {tool}")
-
-        seen_aliases.add(alias)
-        seen_tools.add(tool)
-
-        request_path = (PARITY_PATH.parent / row["requestFixture"]).resolve()
-        expected_path = (PARITY_PATH.parent / row["expectedResponseFixture"]).resolve()
-
-        if not request_path.exists():
-            fail(f"{context}.requestFixture does not exist: {row['requestFixture']}")
-        if not expected_path.exists():
+            f"for canonical tool '{canonical_tool}', got '{provider_adapter_id}'",
+            path=response_path,
+            pointer="/providerAdapterId",
+            rule="provider-adapter-id",
+        )
+    if pair_checked:
+        return
+
+    scope = response_payload["scope"]
+    for key in SCOPE_KEYS:
+        if scope[key] != request_payload[key]:
             fail(
-                f"{context}.expectedResponseFixture does not exist: "
-                f"{row['expectedResponseFixture']}"
+                f"{row_context}.response.scope.{key} must match request.{key}",
+                path=response_path,
+                pointer=f"/scope/{key}",
+                rule="scope-match",
             )
+    fixtures.pairs.add((request_path, response_path))
+
+
+def jobs_from_env() -> int:
+    try:
+        jobs = int(os.environ.get(JOBS_ENV, "1"))
+    except ValueError:
+        return 1
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def validate(data: dict | None = None) -> str:
+    parity_path = pinned_parity_path()
+    with collect_errors(VALIDATOR_NAME) as errors:
+        if data is not None:
+            check_parity_rows(data, "parity.rows", parity_path)
+            count = validate_rows(data["rows"], parity_path, errors)
+        else:
+            count = validate_streamed(parity_path, errors)
+
+    return f"validated {count} rows in {parity_path.relative_to(REPO_ROOT)}"
+
+
+def validate_streamed(parity_path: Path, errors: ErrorCollector) -> int:
+    with open_parity(parity_path) as reader:
+        try:
+            reader.read_header()
+            if not reader.is_object:
+                fail("parity.rows must be an object", path=parity_path, rule="type")
+            # fixtureVersion normally precedes the rows; check it before streaming them
+            # when it does, otherwise once the whole document has been read.
+            header_checked = "fixtureVersion" in reader.header or not reader.is_array
+            if header_checked:
+                check_parity_header(reader.header, "parity.rows", parity_path)
+            if not reader.is_array or reader.empty:
+                fail(
+                    "Top-level key 'rows' must be a non-empty list",
+                    path=parity_path,
+                    pointer="/rows",
+                    rule="non-empty-array",
+                )
+            validate_rows(reader, parity_path, errors)
+        except json.JSONDecodeError as exc:
+            fail(f"Invalid JSON: {exc}", path=parity_path, rule="json-syntax")
+        if not header_checked:
+            check_parity_header(reader.header, "parity.rows", parity_path)
+        return reader.count
+
+
+def validate_rows(
+    rows: Iterable[Any],
+    parity_path: Path,
+    errors: ErrorCollector,
+    jobs: int | None = None,
+) -> int:
+    jobs = jobs_from_env() if jobs is None else jobs
+    fixtures = ParityFixtures(parity_path)
+    # Hashed sets: a streamed table's keys are not kept alive by the rows.
+    seen_aliases = DigestSet()
+    seen_tools = DigestSet()
+
+    rows = iter(rows)
+    parallel = jobs > 1 and "fork" in multiprocessing.get_all_start_methods()
+    count = 0
+    for row in itertools.islice(rows, PARALLEL_MIN_ROWS) if parallel else rows:
+        with errors.unit(parity_path, rule="parity-row", pointer=f"/rows/{count}"):
+            validate_row(count, row, fixtures, seen_aliases, seen_tools, parity_path)
+        count += 1
+    if parallel:
+        count = validate_rows_parallel(rows, count, jobs, fixtures, seen_aliases, seen_tools, errors)
+    return count
+
+
+def validate_row(
+    idx: int,
+    row: Any,
+    fixtures: ParityFixtures,
+    seen_aliases: DigestSet,
+    seen_tools: DigestSet,
+    parity_path: Path,
+) -> None:
+    check_row_fields(idx, row, parity_path)
+    check_row_unique(idx, row, seen_aliases, seen_tools, parity_path)
+    check_row_fixtures(idx, row, fixtures, parity_path)
+
+
+def check_row_fields(idx: int, row: Any, parity_path: Path) -> None:
+    context = f"rows[{idx}]"
+    pointer = f"/rows/{idx}"
+    check_row(row, context, parity_path, pointer)
+
+    alias = row["legacyAlias"]
+    tool = row["canonicalTool"]
+    parity_check = row["parityCheck"]
+
+    if not alias.startswith("finops."):
+        fail(
+            f"{context}.legacyAlias must start with 'finops.'",
+            path=parity_path,
+            pointer=f"{pointer}/legacyAlias",
+            rule="alias-prefix",
+        )
+    if alias.removeprefix("finops.") != tool:
+        fail(
+            f"{context}.legacyAlias must map directly to canonicalTool via finops.* prefix",
+            path=parity_path,
+            pointer=f"{pointer}/legacyAlias",
+            rule="alias-maps-to-tool",
+        )
+    if parity_check not in PARITY_CHECKS:
+        fail(
+            f"{context}.parityCheck unsupported: {parity_check}",
+            path=parity_path,
+            pointer=f"{pointer}/parityCheck",
+            rule="parity-check-type",
+        )
+    if parity_check in COMPARED_CHECKS and row.get("legacyResponseFixture") is None:
+        fail(
+            f"{context}.legacyResponseFixture is required for parityCheck '{parity_check}'",
+            path=parity_path,
+            pointer=f"{pointer}/legacyResponseFixture",
+            rule="legacy-response-fixture",
+        )
+    if parity_check != "value_equivalence" and "tolerances" in row:
+        fail(
+            f"{context}.tolerances only apply to parityCheck 'value_equivalence'",
+            path=parity_path,
+            pointer=f"{pointer}/tolerances",
+            rule="parity-tolerance",
+        )
+
+
+def check_row_unique(
+    idx: int,
+    row: dict[str, Any],
+    seen_aliases: DigestSet,
+    seen_tools: DigestSet,
+    parity_path: Path,
+) -> None:
+    pointer = f"/rows/{idx}"
+    alias = row["legacyAlias"]
+    tool = row["canonicalTool"]
+    if alias in seen_aliases:
+        fail(
+            f"Duplicate legacyAlias: {alias}",
+            path=parity_path,
+            pointer=f"{pointer}/legacyAlias",
+            rule="unique-alias",
+        )
+    if tool in seen_tools:
+        fail(
+            f"Duplicate canonicalTool: {tool}",
+            path=parity_path,
+            pointer=f"{pointer}/canonicalTool",
+            rule="unique-tool",
+        )
+
+    seen_aliases.add(alias)
+    seen_tools.add(tool)
+
+
+def check_row_fixtures(idx: int, row: dict[str, Any], fixtures: ParityFixtures, parity_path: Path) -> None:
+    context = f"rows[{idx}]"
+    pointer = f"/rows/{idx}"
+    request_path = fixtures.resolve(row["requestFixture"])
+    expected_path = fixtures.resolve(row["expectedResponseFixture"])
+
+    if not fixtures.exists(request_path):
+        fail(
+            f"{context}.requestFixture does not exist: {row['requestFixture']}",
+            path=parity_path,
+            pointer=f"{pointer}/requestFixture",
+            rule="fixture-exists",
+        )
+    if not fixtures.exists(expected_path):
+        fail(
+            f"{context}.expectedResponseFixture does not exist: "
+            f"{row['expectedResponseFixture']}",
+            path=parity_path,
+            pointer=f"{pointer}/expectedResponseFixture",
+            rule="fixture-exists",
+        )
 
-        request_payload = load_json(request_path, f"{context}.requestFixture")
-        response_payload = load_json(expected_path, f"{context}.expectedResponseFixture")
-        validate_response_shape(context, tool, request_payload, response_payload)
+    request_payload = fixtures.load(request_path, f"{context}.requestFixture")
+    response_payload = fixtures.load(expected_path, f"{context}.expectedResponseFixture")
+    validate_response_shape(
+        context,
+        row["canonicalTool"],
+        request_path,
+        request_payload,
+        expected_path,
+        response_payload,
+        parity_path,
+        fixtures,
+    )
+    if row["parityCheck"] in COMPARED_CHECKS:
+        validate_legacy_response(idx, row, expected_path, response_payload, fixtures, parity_path)
+
+
+def parse_tolerances(idx: int, row: dict[str, Any], parity_path: Path) -> dict[str, Tolerance]:
+    """Return the row's tolerances keyed by JSON pointer, e.g. `/canonical/infraTotal`."""
+    context = f"rows[{idx}].tolerances"
+    pointer = f"/rows/{idx}/tolerances"
+    raw = row.get("tolerances")
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        fail(f"{context} must be an object", path=parity_path, pointer=pointer, rule="parity-tolerance")
+    tolerances: dict[str, Tolerance] = {}
+    for field, spec in raw.items():
+        section, _, name = field.partition(".")
+        if section != "canonical" or name not in CANONICAL_NUMBER_KEYS:
+            fail(
+                f"{context} key '{field}' must name a canonical number: "
+                f"{', '.join(f'canonical.{key}' for key in CANONICAL_NUMBER_KEYS)}",
+                path=parity_path,
+                pointer=pointer,
+                rule="parity-tolerance",
+            )
+        valid = isinstance(spec, dict) and len(spec) == 1
+        kind, amount = next(iter(spec.items())) if valid else ("", None)
+        if (
+            kind not in TOLERANCE_KINDS
+            or isinstance(amount, bool)
+            or not isinstance(amount, (int, float))
+            or amount < 0
+        ):
+            fail(
+                f"{context}.{field} must be an object with one non-negative number, 'abs' or 'pct'",
+                path=parity_path,
+                pointer=f"{pointer}/{field}",
+                rule="parity-tolerance",
+            )
+        tolerances[f"/canonical/{name}"] = (kind, float(amount))
+    return tolerances
+
+
+def within_tolerance(tolerances: dict[str, Tolerance]) -> Callable[[str, Any, Any], bool]:
+    def leaf_equal(pointer: str, expected: Any, actual: Any) -> bool:
+        tolerance = tolerances.get(pointer)
+        if tolerance is None or json_type(expected) != "number" or json_type(actual) != "number":
+            return False
+        kind, amount = tolerance
+        limit = amount if kind == "abs" else abs(expected) * amount / 100
+        return abs(actual - expected) <= limit
+
+    return leaf_equal
+
+
+def describe_difference(difference: Difference, parity_check: str, tolerances: dict[str, Tolerance]) -> str:
+    if difference.kind != "changed":
+        return f"{difference.kind} {difference.pointer}"
+    if parity_check == "structural_diff":
+        return f"changed {difference.pointer} ({json_type(difference.expected)} -> {json_type(difference.actual)})"
+    text = f"changed {difference.pointer}"
+    if not isinstance(difference.expected, (dict, list)) and not isinstance(difference.actual, (dict, list)):
+        text += f" ({json.dumps(difference.expected)} -> {json.dumps(difference.actual)}"
+        tolerance = tolerances.get(difference.pointer)
+        if tolerance is not None:
+            kind, amount = tolerance
+            text += f", tolerance {kind} {amount:g}"
+        text += ")"
+    return text
+
+
+def validate_legacy_response(
+    idx: int,
+    row: dict[str, Any],
+    expected_path: Path,
+    expected_payload: dict[str, Any],
+    fixtures: ParityFixtures,
+    parity_path: Path,
+) -> None:
+    context = f"rows[{idx}]"
+    parity_check = row["parityCheck"]
+    tolerances = parse_tolerances(idx, row, parity_path) if parity_check == "value_equivalence" else {}
+    legacy_path = fixtures.resolve(row["legacyResponseFixture"])
+    if not fixtures.exists(legacy_path):
+        fail(
+            f"{context}.legacyResponseFixture does not exist: {row['legacyResponseFixture']}",
+            path=parity_path,
+            pointer=f"/rows/{idx}/legacyResponseFixture",
+            rule="fixture-exists",
+        )
+    legacy_payload = fixtures.load(legacy_path, f"{context}.legacyResponseFixture")
 
-    print(
-        f"[legacy-alias-parity] OK: validated {len(rows)} rows in "
-        f"{PARITY_PATH.relative_to(REPO_ROOT)}"
+    differences = fixtures.compare(
+        parity_check, expected_path, expected_payload, legacy_path, legacy_payload, tolerances
     )
+    if differences:
+        listed = [
+            describe_difference(difference, parity_check, tolerances)
+            for difference in differences[:MAX_LISTED_DIFFERENCES]
+        ]
+        if len(differences) > MAX_LISTED_DIFFERENCES:
+            listed.append(f"{len(differences) - MAX_LISTED_DIFFERENCES} more")
+        fail(
+            f"{context} {parity_check}: legacy response differs from expectedResponseFixture "
+            f"at {len(differences)} path(s): {'; '.join(listed)}",
+            path=legacy_path,
+            pointer=differences[0].pointer,
+            rule=parity_check.replace("_", "-"),
+        )
+
+
+# Read-only state for pool workers, set before the pool forks: the parent's fixture
+# memo, warmed by the rows checked in-process, is shared instead of rebuilt.
+_shared: dict[str, Any] = {}
+
+
+def _check_fixtures_chunk(rows: list[tuple[int, dict[str, Any]]]) -> dict[int, Violation]:
+    """Worker: check the fixtures of `(index, row)` pairs; return failures by row index."""
+    fixtures: ParityFixtures = _shared["fixtures"]
+    failures: dict[int, Violation] = {}
+    for idx, row in rows:
+        try:
+            check_row_fixtures(idx, row, fixtures, fixtures.parity_path)
+        except ValidationError as exc:
+            failures[idx] = exc.violation(fixtures.parity_path)
+    return failures
+
+
+def validate_rows_parallel(
+    rows: Iterator[Any],
+    start: int,
+    jobs: int,
+    fixtures: ParityFixtures,
+    seen_aliases: DigestSet,
+    seen_tools: DigestSet,
+    errors: ErrorCollector,
+) -> int:
+    """Check the rows after `start`, fixtures in worker chunks; return the total row count.
+
+    The parent runs the field and uniqueness checks, which are cheap and depend on
+    earlier rows, as it reads; rows that pass them go to a worker for the fixture
+    checks. Results are reported in row order as chunks complete. At most two chunks
+    per worker are in flight, so a streamed table is still not held in memory.
+    """
+    parity_path = fixtures.parity_path
+    count = start
+    # (first row index, row count, failures found in the parent, worker result)
+    pending: deque[tuple[int, int, dict[int, ValidationError], Future[dict[int, Violation]]]] = deque()
+
+    def report() -> None:
+        chunk_start, size, early, future = pending.popleft()
+        failures = future.result()
+        for idx in range(chunk_start, chunk_start + size):
+            with errors.unit(parity_path, rule="parity-row", pointer=f"/rows/{idx}"):
+                if idx in early:
+                    raise early[idx]
+                violation = failures.get(idx)
+                if violation is not None:
+                    raise ValidationError(
+                        VALIDATOR_NAME,
+                        violation.message,
+                        path=violation.path,
+                        pointer=violation.pointer,
+                        rule=violation.rule,
+                    )
+
+    _shared["fixtures"] = fixtures
+    context = multiprocessing.get_context("fork")
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            try:
+                while chunk := list(itertools.islice(rows, CHUNK_ROWS)):
+                    early: dict[int, ValidationError] = {}
+                    work: list[tuple[int, dict[str, Any]]] = []
+                    for idx, row in enumerate(chunk, count):
+                        try:
+                            check_row_fields(idx, row, parity_path)
+                            check_row_unique(idx, row, seen_aliases, seen_tools, parity_path)
+                        except ValidationError as exc:
+                            early[idx] = exc
+                            continue
+                        work.append((idx, row))
+                    pending.append((count, len(chunk), early, pool.submit(_check_fixtures_chunk, work)))
+                    count += len(chunk)
+                    if len(pending) >= 2 * jobs:
+                        report()
+                while pending:
+                    report()
+            finally:
+                for *_, future in pending:
+                    future.cancel()
+    finally:
+        _shared.clear()
+    return count
 
 
 def main() -> None:
-    data = load_parity()
-    validate(data)
+    parser = argparse.ArgumentParser(description=f"Run the {VALIDATOR_NAME} validator")
+    add_common_arguments(parser)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help=f"Check rows of large tables in N worker processes (0 = one per CPU; default ${JOBS_ENV} or 1)",
+    )
+    args = parser.parse_args()
+    if args.jobs is not None:
+        os.environ[JOBS_ENV] = str(args.jobs)
+    run_standalone(VALIDATOR_NAME, validate, args)
 
 
 if __name__ == "__main__":
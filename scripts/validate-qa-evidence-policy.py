@@ -13,10 +13,12 @@ Checks:
 from __future__ import annotations
 
 import re
-import sys
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from validation.core import ErrorCollector, ValidationError, collect_errors, run_standalone
+from validation.paths import REPO_ROOT
+
+VALIDATOR_NAME = "qa-evidence-policy"
 
 QA_CONVENTION_PATH = REPO_ROOT / "docs" / "qa-evidence-storage-convention.md"
 UI_CONTRACT_PATH = REPO_ROOT / "docs" / "ui-foundation-hci-metrics-contract.md"
@@ -51,80 +53,100 @@ RETENTION_LINE_PATTERN = re.compile(
 PROOF_ARTIFACT_LINE_PATTERN = re.compile(r"^- (log|ci|screenshot): .+", re.MULTILINE)
 
 
-def fail(message: str) -> None:
-    print(f"[qa-evidence-policy] ERROR: {message}")
-    sys.exit(1)
+def fail(message: str, path: Path | None = None, rule: str = "") -> None:
+    raise ValidationError(VALIDATOR_NAME, message, path=path, rule=rule)
 
 
 def assert_exists(path: Path, context: str) -> None:
     if not path.exists():
-        fail(f"Missing {context}: {path.relative_to(REPO_ROOT)}")
+        fail(f"Missing {context}: {path.relative_to(REPO_ROOT)}", path=path, rule="file-exists")
 
 
-def validate_evidence_file(path: Path, filename_pattern: re.Pattern[str], phase_label: str) -> None:
+def validate_evidence_file(
+    path: Path,
+    filename_pattern: re.Pattern[str],
+    phase_label: str,
+    errors: ErrorCollector,
+) -> None:
     rel_path = path.relative_to(REPO_ROOT)
 
-    if not filename_pattern.match(path.name):
-        fail(
-            f"{phase_label} evidence filename does not follow convention '{filename_pattern.pattern}': "
-            f"{rel_path}"
-        )
+    with errors.unit(path):
+        if not filename_pattern.match(path.name):
+            fail(
+                f"{phase_label} evidence filename does not follow convention '{filename_pattern.pattern}': "
+                f"{rel_path}",
+                rule="filename-convention",
+            )
 
     content = path.read_text(encoding="utf-8")
 
     for heading in REQUIRED_HEADINGS:
-        if heading not in content:
-            fail(f"{rel_path} missing required heading: {heading}")
+        with errors.unit(path):
+            if heading not in content:
+                fail(f"{rel_path} missing required heading: {heading}", rule="required-heading")
 
     for marker in REQUIRED_MARKERS:
-        if marker not in content:
-            fail(f"{rel_path} missing required checklist marker: {marker}")
-
-    if RETENTION_LINE_PATTERN.search(content) is None:
-        fail(
-            f"{rel_path} missing required retention line. "
-            "Expected one of: routine-30d | phase-close-90d | release-critical-180d"
-        )
-
-    if PROOF_ARTIFACT_LINE_PATTERN.search(content) is None:
-        fail(
-            f"{rel_path} missing proof artifacts entries. "
-            "Expected at least one line in '## Proof Artifacts' section matching "
-            "'- log: ...' or '- ci: ...' or '- screenshot: ...'"
-        )
-
-
-def validate() -> None:
-    assert_exists(QA_CONVENTION_PATH, "QA evidence convention doc")
-    assert_exists(UI_CONTRACT_PATH, "UI foundation contract doc")
-    assert_exists(SMOKE_JOURNEYS_PATH, "smoke journeys baseline")
-    assert_exists(P05_EVIDENCE_DIR, "P05 evidence directory")
-    assert_exists(P07_EVIDENCE_DIR, "P07 evidence directory")
-    assert_exists(BASELINE_EVIDENCE_PATH, "P05 baseline smoke journey evidence doc")
-
-    p05_evidence_files = sorted(P05_EVIDENCE_DIR.glob("*.md"))
-    p07_evidence_files = sorted(P07_EVIDENCE_DIR.glob("*.md"))
-
-    if not p05_evidence_files:
-        fail("No P05 evidence markdown files found")
-    if not p07_evidence_files:
-        fail("No P07 evidence markdown files found")
-
-    for evidence_file in p05_evidence_files:
-        validate_evidence_file(evidence_file, P05_EVIDENCE_FILE_NAME_PATTERN, "P05")
-
-    for evidence_file in p07_evidence_files:
-        validate_evidence_file(evidence_file, P07_EVIDENCE_FILE_NAME_PATTERN, "P07")
-
-    print(
-        "[qa-evidence-policy] OK: validated "
-        f"{len(p05_evidence_files)} P05 evidence file(s) and "
+        with errors.unit(path):
+            if marker not in content:
+                fail(f"{rel_path} missing required checklist marker: {marker}", rule="required-marker")
+
+    with errors.unit(path):
+        if RETENTION_LINE_PATTERN.search(content) is None:
+            fail(
+                f"{rel_path} missing required retention line. "
+                "Expected one of: routine-30d | phase-close-90d | release-critical-180d",
+                rule="retention-line",
+            )
+
+    with errors.unit(path):
+        if PROOF_ARTIFACT_LINE_PATTERN.search(content) is None:
+            fail(
+                f"{rel_path} missing proof artifacts entries. "
+                "Expected at least one line in '## Proof Artifacts' section matching "
+                "'- log: ...' or '- ci: ...' or '- screenshot: ...'",
+                rule="proof-artifact",
+            )
+
+
+def validate() -> str:
+    with collect_errors(VALIDATOR_NAME) as errors:
+        for path, context in (
+            (QA_CONVENTION_PATH, "QA evidence convention doc"),
+            (UI_CONTRACT_PATH, "UI foundation contract doc"),
+            (SMOKE_JOURNEYS_PATH, "smoke journeys baseline"),
+            (P05_EVIDENCE_DIR, "P05 evidence directory"),
+            (P07_EVIDENCE_DIR, "P07 evidence directory"),
+            (BASELINE_EVIDENCE_PATH, "P05 baseline smoke journey evidence doc"),
+        ):
+            with errors.unit(path, rule="file-exists"):
+                assert_exists(path, context)
+
+        p05_evidence_files = sorted(P05_EVIDENCE_DIR.glob("*.md"))
+        p07_evidence_files = sorted(P07_EVIDENCE_DIR.glob("*.md"))
+
+        with errors.unit(P05_EVIDENCE_DIR):
+            if not p05_evidence_files:
+                fail("No P05 evidence markdown files found", rule="evidence-present")
+        with errors.unit(P07_EVIDENCE_DIR):
+            if not p07_evidence_files:
+                fail("No P07 evidence markdown files found", rule="evidence-present")
+
+        for evidence_file in p05_evidence_files:
+            with errors.unit(evidence_file, rule="evidence-file"):
+                validate_evidence_file(evidence_file, P05_EVIDENCE_FILE_NAME_PATTERN, "P05", errors)
+
+        for evidence_file in p07_evidence_files:
+            with errors.unit(evidence_file, rule="evidence-file"):
+                validate_evidence_file(evidence_file, P07_EVIDENCE_FILE_NAME_PATTERN, "P07", errors)
+
+    return (
+        f"validated {len(p05_evidence_files)} P05 evidence file(s) and "
         f"{len(p07_evidence_files)} P07 evidence file(s)"
     )
 
 
 def main() -> None:
-    validate()
+    run_standalone(VALIDATOR_NAME, validate)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Run the repository validation suite in a single process.
+
+Runs every validator behind `npm run validate` (or the subset named on the command
+line) and exits non-zero if any of them fails. Each validator script stays runnable
+on its own.
+
+Unchanged fixture pack versions, billing handoff checks and markdown files are
+skipped through the persistent unit cache in `.cache/ficecal-validate/`; pass
+`--no-cache` to validate everything.
+
+With `--changed-since <git-ref>` only the validators and validation units affected by
+the diff against that ref are run (see `validation/changes.py`).
+
+With `--jobs N` the validators run concurrently in a process pool; results are
+reported in suite order with per-validator wall time, independent of completion order.
+
+With `--format json|junit` the report (per-check rule id, target, outcome and
+nanosecond timing) is written to stdout instead of the text summary; progress notes
+go to stderr.
+
+With `--profile OUT` the run is profiled in-process (see `validation/profiling.py`).
+
+With `--watch` the validators stay loaded with warm fixture state and re-run on file
+changes; `--status` asks that daemon for its latest results over its Unix socket,
+which is what editor integrations and pre-commit hooks should call (see
+`validation/watch.py`). The daemon runs validators in-process and prints text, so
+`--watch` rejects `--jobs`, `--format json|junit`, `--changed-since` and `--profile`;
+`--status --format json` gives a JSON report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from validation import watch
+from validation.changes import changed_paths, plan_changes
+from validation.core import add_common_arguments, apply_common_arguments
+from validation.profiling import profiled
+from validation.report import render_report
+from validation.runner import SUITE, VALIDATORS, run_suite
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run repository validators in one process or a worker pool")
+    parser.add_argument(
+        "validators",
+        nargs="*",
+        metavar="VALIDATOR",
+        help=f"Validators to run (default: the npm run validate suite). Choices: {', '.join(VALIDATORS)}",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help="Only run validators and units affected by changes since GIT_REF (including untracked files)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Run validators concurrently in N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: re-run affected validators on file changes and serve status on --socket",
+    )
+    parser.add_argument(
+        "--poll",
+        type=float,
+        metavar="SECONDS",
+        help="With --watch, poll for changes every SECONDS instead of using inotify",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=watch.SOCKET_PATH,
+        help="Unix socket of the watch daemon (default: .cache/ficecal-validate/watch.sock)",
+    )
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Print the latest results of a running --watch daemon (--rerun to refresh first)",
+    )
+    parser.add_argument(
+        "--rerun",
+        action="store_true",
+        help="With --status, make the daemon re-run every validator before answering",
+    )
+    add_common_arguments(parser)
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List available validators and exit",
+    )
+    return parser.parse_args()
+
+
+def print_status(args: argparse.Namespace) -> None:
+    try:
+        status = watch.query(args.socket, "rerun" if args.rerun else "status")
+    except OSError as exc:
+        print(f"[validate] ERROR: no watch daemon on {args.socket} ({exc}); start one with --watch")
+        sys.exit(2)
+
+    if args.format != "text":
+        print(json.dumps(status, indent=2))
+    else:
+        for entry in status["validators"]:
+            print(f"[{entry['name']}] {'OK' if entry['ok'] else 'ERROR'}: {entry['message']}")
+            if not entry["ok"]:
+                for violation in entry["violations"]:
+                    location = "#".join(part for part in (violation["path"], violation["pointer"]) if part)
+                    rule = f"[{violation['rule']}]" if violation["rule"] else ""
+                    print("- " + " ".join(part for part in (location, rule, violation["message"]) if part))
+        state = "OK" if status["ok"] else "ERROR"
+        print(f"[validate] {state}: watch daemon generation {status['generation']}")
+    if not status["ok"]:
+        sys.exit(1)
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.status:
+        print_status(args)
+        return
+
+    if args.list:
+        for name in VALIDATORS:
+            print(name)
+        return
+
+    unknown = [name for name in args.validators if name not in VALIDATORS]
+    if unknown:
+        print(f"[validate] ERROR: Unknown validator(s): {', '.join(unknown)}")
+        sys.exit(2)
+
+    apply_common_arguments(args)
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    names = list(args.validators) if args.validators else list(SUITE)
+    names = [name for name in VALIDATORS if name in names]
+
+    if args.watch:
+        if args.changed_since or args.profile or args.jobs != 1 or args.format != "text":
+            print(
+                "[validate] ERROR: --watch cannot be combined with --changed-since, --profile, --jobs "
+                "or --format json|junit (use --status --format json for a JSON report)"
+            )
+            sys.exit(2)
+        try:
+            watch.watch(
+                names,
+                socket_path=args.socket,
+                force_polling=args.poll is not None,
+                poll_interval=args.poll or watch.DEFAULT_POLL_INTERVAL,
+            )
+        except OSError as exc:
+            print(f"[validate] ERROR: {exc}")
+            sys.exit(2)
+        return
+
+    notes = sys.stdout if args.format == "text" else sys.stderr
+    units: dict[str, frozenset[str] | None] = {}
+    if args.changed_since:
+        plan = plan_changes(changed_paths(args.changed_since), VALIDATORS, SUITE)
+        if not args.validators:
+            names = [name for name in VALIDATORS if name in plan]
+        names = [name for name in names if name in plan]
+        units = {name: None if plan[name] is None else frozenset(plan[name]) for name in names}
+        if not names and args.format == "text":
+            print(f"[validate] OK: no validators affected by changes since {args.changed_since}")
+            return
+        for name in names:
+            scope = "all units" if units[name] is None else f"{len(units[name])} unit(s)"
+            print(f"[validate] changed since {args.changed_since}: {name} ({scope})", file=notes)
+
+    started = time.perf_counter_ns()
+    if args.profile:
+        if jobs > 1:
+            print("[validate] --profile runs validators in-process; ignoring --jobs", file=sys.stderr)
+            jobs = 1
+        with profiled(args.profile, args.profile_memory):
+            results = run_suite(names, jobs=jobs, units=units)
+    else:
+        results = run_suite(names, jobs=jobs, units=units)
+    wall_ns = time.perf_counter_ns() - started
+
+    if args.format != "text":
+        print(render_report(results, args.format, wall_ns=wall_ns))
+        if not all(result.ok for result in results):
+            sys.exit(1)
+        return
+
+    wall_seconds = wall_ns / 1e9
+    for result in results:
+        print(result.render())
+
+    print(f"[validate] summary (jobs={jobs}, wall {wall_seconds:.3f}s):")
+    for result in results:
+        status = "OK" if result.ok else "ERROR"
+        print(f"- {result.name}: {status} ({result.elapsed_seconds:.3f}s)")
+
+    failed = [result.name for result in results if not result.ok]
+    if failed:
+        print(f"[validate] ERROR: {len(failed)} of {len(results)} validator(s) failed: {', '.join(failed)}")
+        sys.exit(1)
+
+    print(f"[validate] OK: {len(results)} validator(s) passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""Shared helpers for the repository validation scripts.
+
+The `scripts/validate-*.py` entry points stay runnable on their own; this package holds
+the pieces they share so `scripts/validate.py` can run all of them in one process.
+"""
+
+from validation.core import (
+    ValidationError,
+    ValidatorResult,
+    Violation,
+    collect_errors,
+    run_standalone,
+    run_validator,
+)
+
+__all__ = [
+    "ValidationError",
+    "ValidatorResult",
+    "Violation",
+    "collect_errors",
+    "run_standalone",
+    "run_validator",
+]
@@ -0,0 +1,109 @@
+"""Billing provider rule table shared by the handoff and parity validators.
+
+`tests/contracts/live-smoke/billing-provider-baselines.json` lists one entry per
+billing tool: adapter id, provider scope field, sourceVersion prefix and required
+provenance warnings. It is the single list of supported billing tools; onboarding a
+provider is a table entry. `load_baseline_rules` checks the table and compiles it
+into a sourceVersion prefix trie and one warning matcher (`validation/matchers.py`).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from validation.core import ValidationError
+from validation.matchers import MultiMatcher, PrefixTrie
+from validation.paths import REPO_ROOT
+from validation.schema import compile_schema
+from validation.schemas import PROVIDER_BASELINES
+
+BASELINES_PATH = REPO_ROOT / "tests" / "contracts" / "live-smoke" / "billing-provider-baselines.json"
+
+
+@dataclass(frozen=True)
+class RequiredWarning:
+    pattern_id: int  # in BaselineRules.warnings
+    label: str
+
+
+@dataclass(frozen=True)
+class ProviderBaseline:
+    """One provider entry of the rule table."""
+
+    tool_name: str
+    adapter_id: str
+    label: str
+    # Request field listing the provider accounts (workspaces, subscriptions, ...) to ingest.
+    scope_key: str
+    source_version_prefix: str
+    warnings: tuple[RequiredWarning, ...]
+
+
+@dataclass(frozen=True)
+class BaselineRules:
+    """The provider rule table, compiled once into matchers shared by all providers.
+
+    `source_versions` maps each sourceVersion prefix to its tool names and `warnings`
+    holds every required warning pattern, so checking a response walks its
+    sourceVersion and warnings once, however many providers the table lists.
+    """
+
+    providers: dict[str, ProviderBaseline]
+    source_versions: PrefixTrie
+    warnings: MultiMatcher
+
+    def adapter_ids(self) -> dict[str, str]:
+        """Adapter id by billing tool name."""
+        return {tool_name: baseline.adapter_id for tool_name, baseline in self.providers.items()}
+
+
+def load_baseline_rules(validator: str, path: Path = BASELINES_PATH) -> BaselineRules:
+    """Read and compile the rule table; violations are reported under `validator`."""
+
+    def fail(message: str, pointer: str = "", rule: str = "") -> None:
+        raise ValidationError(validator, message, path=path, pointer=pointer, rule=rule)
+
+    if not path.is_file():
+        fail(f"Missing provider baseline table: {path.relative_to(REPO_ROOT)}", rule="file-exists")
+    try:
+        table = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        fail(f"Invalid JSON in {path.relative_to(REPO_ROOT)}: {exc}", rule="json-syntax")
+    compile_schema(PROVIDER_BASELINES, validator)(table, "provider baselines", path)
+
+    providers: dict[str, ProviderBaseline] = {}
+    source_versions = PrefixTrie()
+    warnings = MultiMatcher()
+    for idx, entry in enumerate(table["providers"]):
+        context = f"provider baselines.providers[{idx}]"
+        pointer = f"/providers/{idx}"
+        tool_name = entry["fixtureToolName"]
+        if tool_name in providers:
+            fail(
+                f"{context}.fixtureToolName '{tool_name}' is listed more than once",
+                pointer=f"{pointer}/fixtureToolName",
+                rule="provider-baseline-table",
+            )
+        required = []
+        for position, warning in enumerate(entry["requiredWarnings"]):
+            prefix, equals = warning.get("prefix"), warning.get("equals")
+            if (prefix is None) == (equals is None):
+                fail(
+                    f"{context}.requiredWarnings[{position}] must set exactly one of prefix, equals",
+                    pointer=f"{pointer}/requiredWarnings/{position}",
+                    rule="provider-baseline-table",
+                )
+            pattern_id = warnings.add_prefix(prefix) if prefix is not None else warnings.add_exact(equals)
+            required.append(RequiredWarning(pattern_id, warning["label"]))
+        source_versions.add(entry["sourceVersionPrefix"], tool_name)
+        providers[tool_name] = ProviderBaseline(
+            tool_name=tool_name,
+            adapter_id=entry["adapterId"],
+            label=entry["providerLabel"],
+            scope_key=entry["providerScopeKey"],
+            source_version_prefix=entry["sourceVersionPrefix"],
+            warnings=tuple(required),
+        )
+    return BaselineRules(providers, source_versions, warnings)
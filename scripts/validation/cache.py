@@ -0,0 +1,272 @@
+"""Persistent content-hash cache for validation units.
+
+A unit is the smallest piece of a validator that can be skipped on its own: one
+fixture pack version, one billing tool handoff check, one markdown file. For each
+passing unit the cache records the files it read (size, mtime and sha256) and, for
+link-style checks, which paths it expected to exist or not and which other files it
+depended on (a markdown file whose headings an anchor link targets). A later run skips
+the unit when the same file set is present with the same content, every dependency is
+unchanged and every recorded existence fact still holds. Failing units are never
+cached, so errors are always re-reported.
+
+Each validator has its own cache file keyed by a hash of the validator script and the
+shared `validation` package; editing either discards the validator's cached units.
+
+The watch daemon calls `keep_resident()`: each validator's cache is then loaded once and
+reused by later runs, and a unit whose inputs were checked is trusted without further
+`stat` calls until `invalidate_resident()` reports a change to one of its files (or to a
+directory above them). A batch of lost events invalidates every unit.
+
+Set `FICECAL_VALIDATE_NO_CACHE=1` (or pass `--no-cache` to `scripts/validate.py`) to
+bypass the cache entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from validation.paths import REPO_ROOT, repo_relative
+
+CACHE_DIR = REPO_ROOT / ".cache" / "ficecal-validate"
+PACKAGE_DIR = Path(__file__).resolve().parent
+NO_CACHE_ENV = "FICECAL_VALIDATE_NO_CACHE"
+CACHE_FORMAT = 1
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(NO_CACHE_ENV, "") not in {"1", "true", "yes"}
+
+
+def sha256_file(path: Path | str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_hash(script_path: Path) -> str:
+    """Hash the validator script together with the shared `validation` package."""
+    digest = hashlib.sha256()
+    for path in [script_path, *sorted(PACKAGE_DIR.glob("*.py"))]:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _rel(path: Path | str) -> str:
+    rel = repo_relative(path)
+    return rel if rel is not None else str(path)
+
+
+def _abs(key: str) -> Path:
+    path = Path(key)
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+def _fingerprints(paths: Iterable[Path | str]) -> dict[str, list[Any]]:
+    recorded: dict[str, list[Any]] = {}
+    for path in paths:
+        stat = os.stat(path)
+        recorded[_rel(path)] = [stat.st_size, stat.st_mtime_ns, sha256_file(path)]
+    return recorded
+
+
+class ValidationCache:
+    """Per-validator unit cache. Use through `validation_cache()`."""
+
+    def __init__(self, validator: str, script_path: Path, enabled: bool = True, resident: bool = False) -> None:
+        self.validator = validator
+        self.enabled = enabled
+        self.path = CACHE_DIR / f"{validator}.json"
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._units: dict[str, dict[str, Any]] = {}
+        # Resident caches only: units whose inputs were verified since the last change
+        # to any of their paths, and the units to forget when a path changes.
+        self._trusted: set[str] | None = set() if resident else None
+        self._units_by_path: dict[str, set[str]] = {}
+        self._source_hash = source_hash(script_path) if enabled else ""
+        if enabled:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(stored, dict)
+            and stored.get("format") == CACHE_FORMAT
+            and stored.get("sourceHash") == self._source_hash
+            and isinstance(stored.get("units"), dict)
+        ):
+            self._units = stored["units"]
+        else:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self.enabled or not self._dirty:
+            return
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": CACHE_FORMAT,
+            "validator": self.validator,
+            "sourceHash": self._source_hash,
+            "units": self._units,
+        }
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def lookup(self, unit: str, files: Iterable[Path | str]) -> dict[str, Any] | None:
+        """Return the data recorded for a passing `unit`, or None if it must re-run.
+
+        `files` is the unit's current input file set; it must match the recorded set.
+        """
+        if not self.enabled:
+            return None
+        entry = self._units.get(unit)
+        if entry is None:
+            self.misses += 1
+            return None
+        if self._trusted is not None and unit in self._trusted:
+            if {_rel(path) for path in files} != set(entry.get("files", {})):
+                self.misses += 1
+                return None
+        elif not self._inputs_unchanged(entry, files):
+            self.misses += 1
+            return None
+        else:
+            self._trust(unit, entry)
+        self.hits += 1
+        return entry.get("data", {})
+
+    def _trust(self, unit: str, entry: dict[str, Any]) -> None:
+        if self._trusted is None:
+            return
+        self._trusted.add(unit)
+        for section in ("files", "dependencies", "presence"):
+            for key in entry.get(section, ()):
+                self._units_by_path.setdefault(key, set()).add(unit)
+
+    def invalidate(self, paths: Iterable[str] | None) -> None:
+        """Re-verify units reading any of the repository-relative `paths`; None means all."""
+        if self._trusted is None:
+            return
+        if paths is None:
+            self._trusted.clear()
+            self._units_by_path.clear()
+            return
+        for path in paths:
+            # A recorded key may be a directory above the changed path (a presence fact).
+            key = path
+            while key:
+                units = self._units_by_path.pop(key, None)
+                if units:
+                    self._trusted.difference_update(units)
+                key = key.rpartition("/")[0]
+
+    def _inputs_unchanged(self, entry: dict[str, Any], files: Iterable[Path | str]) -> bool:
+        recorded: dict[str, list[Any]] = entry.get("files", {})
+        current = {_rel(path) for path in files}
+        if current != set(recorded):
+            return False
+
+        if not self._unchanged(recorded) or not self._unchanged(entry.get("dependencies", {})):
+            return False
+
+        for key, expected in entry.get("presence", {}).items():
+            if os.path.exists(_abs(key)) != expected:
+                return False
+        return True
+
+    def _unchanged(self, recorded: dict[str, list[Any]]) -> bool:
+        refreshed = False
+        for key, (size, mtime_ns, digest) in recorded.items():
+            try:
+                stat = os.stat(_abs(key))
+            except OSError:
+                return False
+            if stat.st_size != size:
+                return False
+            if stat.st_mtime_ns != mtime_ns:
+                if sha256_file(_abs(key)) != digest:
+                    return False
+                recorded[key] = [size, stat.st_mtime_ns, digest]
+                refreshed = True
+        if refreshed:
+            self._dirty = True
+        return True
+
+    def record(
+        self,
+        unit: str,
+        files: Iterable[Path | str],
+        presence: dict[Path, bool] | None = None,
+        data: dict[str, Any] | None = None,
+        dependencies: Iterable[Path | str] = (),
+    ) -> None:
+        """Record that `unit` passed with the given inputs.
+
+        `dependencies` are files the unit read beyond its own input set; they are only
+        checked for changed content, not compared against the caller's file list.
+        """
+        if not self.enabled:
+            return
+        entry: dict[str, Any] = {"files": _fingerprints(files)}
+        extra = _fingerprints(dependencies)
+        if extra:
+            entry["dependencies"] = extra
+        if presence:
+            entry["presence"] = {_rel(path): exists for path, exists in presence.items()}
+        if data:
+            entry["data"] = data
+        self._units[unit] = entry
+        self._dirty = True
+        self._trust(unit, entry)
+
+
+# Caches kept loaded between runs, by validator; None outside the watch daemon.
+_resident: dict[str, ValidationCache] | None = None
+
+
+def keep_resident() -> None:
+    """Keep each validator's cache loaded for later runs in this process."""
+    global _resident
+    if _resident is None:
+        _resident = {}
+
+
+def invalidate_resident(paths: Iterable[str] | None) -> None:
+    """Report changed repository-relative `paths` (None: unknown) to the resident caches."""
+    if _resident is None:
+        return
+    changed = None if paths is None else list(paths)
+    for cache in _resident.values():
+        cache.invalidate(changed)
+
+
+@contextmanager
+def validation_cache(validator: str, script_path: str | Path) -> Iterator[ValidationCache]:
+    """Open the validator's cache and persist it when the validation run ends."""
+    enabled = cache_enabled()
+    cache = _resident.get(validator) if _resident is not None else None
+    if cache is None or cache.enabled != enabled:
+        resident = _resident is not None
+        cache = ValidationCache(validator, Path(script_path).resolve(), enabled=enabled, resident=resident)
+        if _resident is not None:
+            _resident[validator] = cache
+    else:
+        cache.hits = cache.misses = 0
+    try:
+        yield cache
+    finally:
+        cache.save()
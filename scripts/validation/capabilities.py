@@ -0,0 +1,118 @@
+"""Capabilities fixture shared by the fixture-coverage and alias parity validators.
+
+The latest version of the `mcp.capabilities.get` pack (semver order) declares the MCP
+tools, which drive the required fixture packs, and pins the legacy alias parity
+fixture version (`compatibility.parityFixtureVersion`). Both validators resolve the
+parity pack through that pin, never through the newest parity pack directory, so a
+new parity version is only checked once the capabilities fixture adopts it.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from validation.core import ValidationError
+from validation.fixtures import FIXTURE_ROOT, MCP_DIR_NAME, fixture_index
+
+CAPABILITIES_PACK = FIXTURE_ROOT / MCP_DIR_NAME / "mcp.capabilities.get"
+PARITY_PACK = FIXTURE_ROOT / MCP_DIR_NAME / "legacy-alias-parity"
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """What the latest capabilities response declares."""
+
+    tools: frozenset[str]
+    parity_fixture_version: str
+    # response.expected.json the values were read from.
+    path: Path
+
+    @property
+    def parity_pack(self) -> Path:
+        """Version directory of the pinned legacy alias parity fixtures."""
+        return PARITY_PACK / self.parity_fixture_version
+
+
+def load_capabilities(validator: str) -> Capabilities:
+    """Read the latest capabilities response; violations are raised as `validator`."""
+
+    def fail(message: str, path: Path, pointer: str = "", rule: str = "") -> None:
+        raise ValidationError(validator, message, path=path, pointer=pointer, rule=rule)
+
+    index = fixture_index(FIXTURE_ROOT)
+    pack = index.pack(CAPABILITIES_PACK)
+    if not pack.version_names():
+        fail("MCP pack 'mcp.capabilities.get' has no version directories", CAPABILITIES_PACK, rule="pack-versions")
+    latest = pack.latest()
+    if latest is None:
+        fail(
+            "MCP pack 'mcp.capabilities.get' has no semantic version directories",
+            CAPABILITIES_PACK,
+            rule="pack-versions",
+        )
+    response_file = latest.files.get("response.expected.json")
+    if response_file is None:
+        fail(
+            "MCP pack 'mcp.capabilities.get' latest version "
+            f"'{latest.name}' missing response.expected.json",
+            latest.path / "response.expected.json",
+            rule="required-file",
+        )
+
+    response_path = response_file.path
+    context = "mcp.capabilities.get response.expected"
+    try:
+        payload: Any = index.load_json(response_path)
+    except json.JSONDecodeError as exc:
+        fail(f"{context} invalid JSON: {exc}", response_path, rule="json-syntax")
+    if not isinstance(payload, dict):
+        fail(f"{context} must be a JSON object", response_path, rule="json-object")
+
+    namespaces = payload.get("toolNamespaces")
+    if not isinstance(namespaces, list):
+        fail(f"{context}.toolNamespaces must be an array", response_path, pointer="/toolNamespaces", rule="type")
+
+    tools: set[str] = set()
+    for idx, namespace in enumerate(namespaces):
+        if not isinstance(namespace, dict):
+            fail(
+                f"toolNamespaces[{idx}] must be an object",
+                response_path,
+                pointer=f"/toolNamespaces/{idx}",
+                rule="type",
+            )
+        ns_tools = namespace.get("tools")
+        if not isinstance(ns_tools, list) or not all(isinstance(tool, str) for tool in ns_tools):
+            fail(
+                f"toolNamespaces[{idx}].tools must be an array of strings",
+                response_path,
+                pointer=f"/toolNamespaces/{idx}/tools",
+                rule="type",
+            )
+        tools.update(ns_tools)
+
+    if not tools:
+        fail(
+            "No MCP tools found in mcp.capabilities.get fixture",
+            response_path,
+            pointer="/toolNamespaces",
+            rule="capability-tools",
+        )
+
+    compatibility = payload.get("compatibility")
+    if not isinstance(compatibility, dict):
+        fail(f"{context}.compatibility must be an object", response_path, pointer="/compatibility", rule="type")
+
+    parity_fixture_version = compatibility.get("parityFixtureVersion")
+    if not isinstance(parity_fixture_version, str) or not parity_fixture_version:
+        fail(
+            f"{context}.compatibility.parityFixtureVersion must be a non-empty string",
+            response_path,
+            pointer="/compatibility/parityFixtureVersion",
+            rule="non-empty-string",
+        )
+
+    return Capabilities(frozenset(tools), parity_fixture_version, response_path)
@@ -0,0 +1,206 @@
+"""Map changed repository paths to the validators and units that depend on them.
+
+Used by `scripts/validate.py --changed-since <git-ref>`. The rules mirror the
+cross-file reads the validators actually perform:
+
+- fixture pack versions map to their fixture-coverage unit; billing tool packs also
+  re-run the canonical handoff unit, legacy alias parity and the dry-run smoke
+- `mcp.capabilities.get` drives the required MCP pack set and pins the parity
+  fixture version (`validation/capabilities.py`), so it re-runs all MCP coverage and
+  alias parity
+- the live smoke config feeds readiness, smoke and reconciliation; the provider
+  baseline table feeds every canonical handoff unit and alias parity
+- an added, deleted or renamed path re-runs every markdown file that mentions its name,
+  so docs linking to a moved document are re-checked; so does any edited markdown
+  file, since its headings are anchor targets for the docs linking to it
+- a `.gitignore` at any depth decides which markdown files docs-links walks
+  (`validation/walk.py`), so changing one re-runs every docs-links unit
+- editing a validator re-runs it; editing the shared `validation` package re-runs all
+
+A plan maps validator name to a set of unit ids, or to None for "every unit".
+"""
+
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+
+from validation.paths import REPO_ROOT
+
+FIXTURE_PREFIX = ("tests", "contracts", "fixtures")
+CATALOG_PATH = "src/features/feature-catalog.json"
+LIVE_SMOKE_CONFIG_PATH = "tests/contracts/live-smoke/billing-live-smoke.config.json"
+PROVIDER_BASELINES_PATH = "tests/contracts/live-smoke/billing-provider-baselines.json"
+
+READINESS_INPUTS = {
+    "docs/playbooks/billing-live-integration-readiness.md",
+    ".env.example",
+    ".env.live.example",
+    ".github/workflows/billing-live-smoke.yml",
+    ".github/workflows/release.yml",
+}
+
+QA_EVIDENCE_INPUTS = {
+    "docs/qa-evidence-storage-convention.md",
+    "docs/ui-foundation-hci-metrics-contract.md",
+    "tests/e2e/smoke-journeys.md",
+}
+QA_EVIDENCE_DIRS = ("tests/evidence/p05/", "tests/evidence/p07/")
+GITIGNORE_NAME = ".gitignore"
+
+# Validators whose inputs are fixture packs referenced by the billing tool packs.
+BILLING_PACK_DEPENDENTS = ("legacy-alias-parity", "billing-live-smoke")
+
+Plan = dict[str, "set[str] | None"]
+
+
+@dataclass(frozen=True)
+class Change:
+    status: str
+    path: str
+    old_path: str | None = None
+
+
+def _git(*args: str) -> str:
+    completed = subprocess.run(
+        ["git", *args],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout
+
+
+def changed_paths(ref: str) -> list[Change]:
+    """Return paths changed between `ref` and the working tree, plus untracked files."""
+    tokens = _git("diff", "--name-status", "-M", "-z", ref, "--").split("\0")
+    changes: list[Change] = []
+    idx = 0
+    while idx < len(tokens) and tokens[idx]:
+        status = tokens[idx][0]
+        if status in {"R", "C"}:
+            changes.append(Change(status, tokens[idx + 2], tokens[idx + 1]))
+            idx += 3
+        else:
+            changes.append(Change(status, tokens[idx + 1]))
+            idx += 2
+
+    for path in _git("ls-files", "--others", "--exclude-standard", "-z").split("\0"):
+        if path:
+            changes.append(Change("A", path))
+    return changes
+
+
+def _markdown_mentioning(names: set[str]) -> set[str]:
+    if not names:
+        return set()
+    args = ["grep", "-l", "-z", "--untracked", "-F"]
+    for name in sorted(names):
+        args.extend(["-e", name])
+    args.extend(["--", "*.md"])
+    try:
+        output = _git(*args)
+    except subprocess.CalledProcessError:
+        # git grep exits 1 when nothing matches.
+        return set()
+    return {path for path in output.split("\0") if path}
+
+
+class _PlanBuilder:
+    def __init__(self) -> None:
+        self.plan: Plan = {}
+
+    def everything(self, validator: str) -> None:
+        self.plan[validator] = None
+
+    def unit(self, validator: str, unit: str) -> None:
+        if validator in self.plan and self.plan[validator] is None:
+            return
+        units = self.plan.setdefault(validator, set())
+        assert units is not None
+        units.add(unit)
+
+
+def _plan_fixture_path(builder: _PlanBuilder, parts: tuple[str, ...]) -> None:
+    rest = parts[len(FIXTURE_PREFIX):]
+    if rest and rest[0] == "mcp":
+        if len(rest) < 4:
+            builder.everything("fixture-coverage")
+            return
+        pack, version = rest[1], rest[2]
+        if pack == "mcp.capabilities.get":
+            builder.everything("fixture-coverage")
+            builder.everything("legacy-alias-parity")
+            return
+        builder.unit("fixture-coverage", f"mcp-pack:{pack}/{version}")
+        if pack == "legacy-alias-parity":
+            builder.everything("legacy-alias-parity")
+        elif pack.startswith("billing."):
+            builder.unit("billing-canonical-handoff", f"phase1-tool:{pack}/{version}")
+            for validator in BILLING_PACK_DEPENDENTS:
+                builder.everything(validator)
+        return
+
+    if len(rest) < 3:
+        builder.everything("fixture-coverage")
+        return
+    builder.unit("fixture-coverage", f"module-pack:{rest[0]}/{rest[1]}")
+
+
+def plan_changes(changes: list[Change], validators: dict[str, str], suite: tuple[str, ...]) -> Plan:
+    """Return the validators and units affected by `changes`.
+
+    `validators` maps validator name to script file name; `suite` is the default set
+    re-run when the shared `validation` package changes.
+    """
+    builder = _PlanBuilder()
+    script_owners = {f"scripts/{script}": name for name, script in validators.items()}
+    moved_names: set[str] = set()
+
+    paths: list[tuple[str, str]] = []
+    for change in changes:
+        paths.append((change.status, change.path))
+        if change.old_path is not None:
+            paths.append(("D", change.old_path))
+
+    for status, path in paths:
+        parts = PurePosixPath(path).parts
+
+        if status in {"A", "D"}:
+            moved_names.add(parts[-1])
+            # Module paths in the catalog must keep existing.
+            if status == "D":
+                builder.everything("feature-catalog")
+
+        if path in script_owners:
+            builder.everything(script_owners[path])
+        elif path.startswith("scripts/validation/"):
+            for name in suite:
+                builder.everything(name)
+
+        if path == CATALOG_PATH:
+            builder.everything("feature-catalog")
+        if parts[: len(FIXTURE_PREFIX)] == FIXTURE_PREFIX:
+            _plan_fixture_path(builder, parts)
+        if path == LIVE_SMOKE_CONFIG_PATH:
+            for name in ("billing-live-readiness", "billing-live-smoke", "billing-live-reconciliation"):
+                builder.everything(name)
+        if path == PROVIDER_BASELINES_PATH:
+            for name in ("billing-canonical-handoff", "legacy-alias-parity"):
+                builder.everything(name)
+        if path in READINESS_INPUTS:
+            builder.everything("billing-live-readiness")
+        if path in QA_EVIDENCE_INPUTS or path.startswith(QA_EVIDENCE_DIRS):
+            builder.everything("qa-evidence-policy")
+        if path.endswith(".md"):
+            builder.unit("docs-links", f"doc:{path}")
+            moved_names.add(parts[-1])
+        if parts[-1] == GITIGNORE_NAME:
+            builder.everything("docs-links")
+
+    for doc in _markdown_mentioning(moved_names):
+        builder.unit("docs-links", f"doc:{doc}")
+
+    return builder.plan
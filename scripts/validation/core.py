@@ -0,0 +1,382 @@
+"""Structured validator results.
+
+Validators raise `ValidationError` from their `fail()` helper instead of exiting, and
+return their OK summary from `validate()`. `run_validator` turns either outcome into a
+`ValidatorResult`; `run_standalone` keeps the historical script behavior (print one
+`[name] OK/ERROR` line, exit 1 on failure).
+
+Errors are fail-fast by default. With `--collect-errors` (or
+`FICECAL_VALIDATE_COLLECT_ERRORS=1`) a validator keeps going past a failing unit, a
+fixture pack, parity row, module or evidence file, and reports every violation with
+its file, JSON pointer and rule id, up to `--max-errors`.
+
+Units that name a `rule` are also recorded as timed checks (rule id, target path,
+outcome, `time.perf_counter_ns` duration) on the `ValidatorResult`, which
+`validation.report` renders as JSON or JUnit XML for `--format json|junit`.
+
+`select_units` narrows a validator to a subset of its validation units (see
+`validation.changes`); validators consult `unit_selected` before checking a unit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from validation.cache import NO_CACHE_ENV
+from validation.paths import repo_relative
+from validation.profiling import profiled
+from validation.report import render_report
+
+COLLECT_ERRORS_ENV = "FICECAL_VALIDATE_COLLECT_ERRORS"
+MAX_ERRORS_ENV = "FICECAL_VALIDATE_MAX_ERRORS"
+DEFAULT_MAX_ERRORS = 200
+
+
+def _rel(path: Path | str | None) -> str:
+    if path is None:
+        return ""
+    rel = repo_relative(path)
+    return rel if rel is not None else Path(path).as_posix()
+
+
+@dataclass(frozen=True)
+class Violation:
+    validator: str
+    message: str
+    path: str = ""
+    pointer: str = ""
+    rule: str = ""
+
+    def location(self) -> str:
+        if self.path and self.pointer:
+            return f"{self.path}#{self.pointer}"
+        return self.path or (f"#{self.pointer}" if self.pointer else "")
+
+    def render(self) -> str:
+        prefix = " ".join(part for part in (self.location(), f"[{self.rule}]" if self.rule else "") if part)
+        return f"{prefix} {self.message}" if prefix else self.message
+
+
+class ValidationError(Exception):
+    """Raised by a validator's `fail()` helper."""
+
+    def __init__(
+        self,
+        validator: str,
+        message: str,
+        details: list[str] | None = None,
+        *,
+        path: Path | str | None = None,
+        pointer: str = "",
+        rule: str = "",
+        violations: list[Violation] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.validator = validator
+        self.message = message
+        self.details = list(details or [])
+        self.path = _rel(path)
+        self.pointer = pointer
+        self.rule = rule
+        self.violations = list(violations or [])
+
+    def violation(self, default_path: Path | str | None = None) -> Violation:
+        return Violation(
+            validator=self.validator,
+            message=self.message,
+            path=self.path or _rel(default_path),
+            pointer=self.pointer,
+            rule=self.rule,
+        )
+
+
+@dataclass
+class Check:
+    """One timed validation unit: a fixture pack version, parity row, markdown file."""
+
+    validator: str
+    rule: str
+    target: str
+    outcome: str  # passed | failed | cached | error
+    elapsed_ns: int = 0
+    violations: list[Violation] = field(default_factory=list)
+
+
+_checks: list[Check] | None = None
+
+
+def record_check(check: Check) -> None:
+    """Attach `check` to the validator run in progress, if any."""
+    if _checks is not None:
+        _checks.append(check)
+
+
+@contextmanager
+def recording_checks() -> Iterator[list[Check]]:
+    global _checks
+    previous, _checks = _checks, []
+    try:
+        yield _checks
+    finally:
+        _checks = previous
+
+
+def _target(path: Path | str | None, pointer: str = "") -> str:
+    target = _rel(path)
+    return f"{target}#{pointer}" if pointer else target
+
+
+@dataclass
+class ValidatorResult:
+    name: str
+    ok: bool
+    message: str
+    details: list[str] = field(default_factory=list)
+    elapsed_ns: int = 0
+    violations: list[Violation] = field(default_factory=list)
+    checks: list[Check] = field(default_factory=list)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self.elapsed_ns / 1e9
+
+    def render(self) -> str:
+        status = "OK" if self.ok else "ERROR"
+        lines = [f"[{self.name}] {status}: {self.message}"]
+        lines.extend(f"- {entry}" for entry in self.details)
+        return "\n".join(lines)
+
+
+def collect_errors_enabled() -> bool:
+    return os.environ.get(COLLECT_ERRORS_ENV, "") in {"1", "true", "yes"}
+
+
+def max_errors() -> int:
+    try:
+        return int(os.environ.get(MAX_ERRORS_ENV, DEFAULT_MAX_ERRORS))
+    except ValueError:
+        return DEFAULT_MAX_ERRORS
+
+
+@dataclass
+class UnitOutcome:
+    collector: ErrorCollector
+    start: int
+
+    @property
+    def ok(self) -> bool:
+        return len(self.collector.violations) == self.start
+
+
+class ErrorCollector:
+    """Unit boundary for collect-all-errors mode. Use through `collect_errors()`."""
+
+    def __init__(self, validator: str) -> None:
+        self.validator = validator
+        self.collect = collect_errors_enabled()
+        self.limit = max_errors()
+        self.violations: list[Violation] = []
+        self.truncated = False
+
+    @contextmanager
+    def unit(
+        self,
+        path: Path | str | None = None,
+        rule: str = "",
+        pointer: str = "",
+    ) -> Iterator[UnitOutcome]:
+        """Run one unit; in collect mode a failure is recorded and the run continues.
+
+        The yielded outcome reports whether the unit, including nested units, stayed
+        free of violations; check it after the `with` block before caching a pass.
+        A unit with a `rule` is recorded as a timed check on `path`/`pointer`.
+        """
+        outcome = UnitOutcome(self, len(self.violations))
+        started = time.perf_counter_ns()
+        failure: Violation | None = None
+        crashed = False
+        try:
+            yield outcome
+        except ValidationError as exc:
+            if not self.collect or exc.violations:
+                if not exc.violations:
+                    failure = exc.violation(path)
+                raise
+            self.add(exc.violation(path))
+        except BaseException:
+            crashed = True
+            raise
+        finally:
+            if rule:
+                violations = [failure] if failure else self.violations[outcome.start:]
+                if crashed:
+                    status = "error"
+                else:
+                    status = "failed" if violations else "passed"
+                record_check(
+                    Check(
+                        self.validator,
+                        rule,
+                        _target(path, pointer),
+                        status,
+                        time.perf_counter_ns() - started,
+                        list(violations),
+                    )
+                )
+
+    def cached(self, path: Path | str | None, rule: str, pointer: str = "") -> None:
+        """Record a unit skipped because the cache holds a passing result."""
+        record_check(Check(self.validator, rule, _target(path, pointer), "cached"))
+
+    def add(self, violation: Violation) -> None:
+        self.violations.append(violation)
+        if self.limit > 0 and len(self.violations) >= self.limit:
+            self.truncated = True
+            raise self.error()
+
+    def error(self) -> ValidationError:
+        message = f"{len(self.violations)} violation(s) found"
+        if self.truncated:
+            message += f" (stopped at --max-errors {self.limit})"
+        return ValidationError(
+            self.validator,
+            message,
+            [violation.render() for violation in self.violations],
+            violations=self.violations,
+        )
+
+
+@contextmanager
+def collect_errors(validator: str) -> Iterator[ErrorCollector]:
+    """Wrap a validation run; raises one combined error if any unit failed."""
+    collector = ErrorCollector(validator)
+    try:
+        yield collector
+    except ValidationError as exc:
+        if exc.violations or not collector.violations:
+            raise
+        # A fatal error outside any unit still reports what was collected before it.
+        collector.violations.append(exc.violation())
+        raise collector.error() from None
+    if collector.violations:
+        raise collector.error()
+
+
+_selected_units: dict[str, frozenset[str]] = {}
+
+
+def select_units(validator: str, units: Iterable[str] | None) -> None:
+    """Restrict `validator` to `units`; None selects every unit."""
+    if units is None:
+        _selected_units.pop(validator, None)
+    else:
+        _selected_units[validator] = frozenset(units)
+
+
+def unit_selected(validator: str, unit: str) -> bool:
+    selected = _selected_units.get(validator)
+    return selected is None or unit in selected
+
+
+def run_validator(name: str, validate: Callable[[], str]) -> ValidatorResult:
+    with recording_checks() as checks:
+        started = time.perf_counter_ns()
+        try:
+            message = validate()
+        except ValidationError as exc:
+            return ValidatorResult(
+                name=name,
+                ok=False,
+                message=exc.message,
+                details=exc.details,
+                elapsed_ns=time.perf_counter_ns() - started,
+                violations=exc.violations or [exc.violation()],
+                checks=list(checks),
+            )
+        return ValidatorResult(
+            name=name,
+            ok=True,
+            message=message,
+            elapsed_ns=time.perf_counter_ns() - started,
+            checks=list(checks),
+        )
+
+
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options every validator script and the runner accept."""
+    parser.add_argument(
+        "--collect-errors",
+        action="store_true",
+        help="Report every violation in one pass instead of stopping at the first",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=None,
+        help=(
+            f"Stop collecting after N violations (default ${MAX_ERRORS_ENV} or {DEFAULT_MAX_ERRORS}, "
+            "0 = no limit)"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "junit"),
+        default="text",
+        help="Output format: text lines (default), a JSON report or JUnit XML",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the .cache/ficecal-validate unit cache and validate everything",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="OUT",
+        help="Profile the run; writes OUT.pstats and OUT.collapsed (flamegraph input)",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile, also trace allocations and write OUT.memory.txt",
+    )
+
+
+def apply_common_arguments(args: argparse.Namespace) -> None:
+    # Exported through the environment so process-pool workers see the same settings.
+    if args.collect_errors:
+        os.environ[COLLECT_ERRORS_ENV] = "1"
+    if args.max_errors is not None:
+        os.environ[MAX_ERRORS_ENV] = str(args.max_errors)
+    if args.no_cache:
+        os.environ[NO_CACHE_ENV] = "1"
+
+
+def run_standalone(
+    name: str,
+    validate: Callable[[], str],
+    args: argparse.Namespace | None = None,
+) -> None:
+    if args is None:
+        parser = argparse.ArgumentParser(description=f"Run the {name} validator")
+        add_common_arguments(parser)
+        args = parser.parse_args()
+    apply_common_arguments(args)
+
+    if args.profile:
+        with profiled(args.profile, args.profile_memory, label=name):
+            result = run_validator(name, validate)
+    else:
+        result = run_validator(name, validate)
+    if args.format == "text":
+        print(result.render())
+    else:
+        print(render_report([result], args.format, wall_ns=result.elapsed_ns))
+    if not result.ok:
+        sys.exit(1)
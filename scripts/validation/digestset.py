@@ -0,0 +1,99 @@
+"""Compact membership set for large numbers of strings.
+
+`DigestSet` keeps a 64-bit hash of each string in an open-addressing table backed by
+`array('q')` and the string itself as UTF-8 bytes in one shared `bytearray`, so an
+entry costs about 30 bytes plus its encoded length instead of a str object plus a set
+slot (about 80-100 bytes for a typical alias). It is used for uniqueness checks over
+streamed tables, where a set of str would be the largest object in the process.
+
+Lookups compare digests first and confirm a digest hit against the stored bytes, so
+membership is exact: two distinct strings with equal hashes are both kept (linear
+probing moves on past a slot whose digest matches but whose bytes do not). The hash is
+Python's `hash()` of the string (64-bit SipHash, randomized per process), so the
+table layout is only meaningful within one process.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable
+
+_EMPTY = 0
+_MIN_CAPACITY = 1024
+
+
+class DigestSet:
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self._table = array("q", bytes(8 * _MIN_CAPACITY))
+        # Entry number of the string in each occupied slot of `_table`.
+        self._entries = array("q", bytes(8 * _MIN_CAPACITY))
+        self._mask = _MIN_CAPACITY - 1
+        # Entry i is `_blob[_ends[i - 1]:_ends[i]]` (from 0 for the first entry).
+        self._ends = array("q", [0])
+        self._blob = bytearray()
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return len(self._ends) - 1
+
+    def _same(self, entry: int, encoded: bytes) -> bool:
+        ends = self._ends
+        start, end = ends[entry], ends[entry + 1]
+        return end - start == len(encoded) and self._blob[start:end] == encoded
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+        digest = hash(value) or 1
+        table = self._table
+        mask = self._mask
+        index = digest & mask
+        current = table[index]
+        encoded = None
+        while current != _EMPTY:
+            if current == digest:
+                if encoded is None:
+                    encoded = value.encode("utf-8", "surrogatepass")
+                if self._same(self._entries[index], encoded):
+                    return True
+            index = (index + 1) & mask
+            current = table[index]
+        return False
+
+    def add(self, value: str) -> bool:
+        """Add `value`; return False if it was already a member."""
+        # Linear probing, inlined: this runs once per row of a streamed table.
+        digest = hash(value) or 1
+        encoded = value.encode("utf-8", "surrogatepass")
+        table = self._table
+        mask = self._mask
+        index = digest & mask
+        current = table[index]
+        while current != _EMPTY:
+            if current == digest and self._same(self._entries[index], encoded):
+                return False
+            index = (index + 1) & mask
+            current = table[index]
+        table[index] = digest
+        self._entries[index] = len(self._ends) - 1
+        self._blob += encoded
+        self._ends.append(len(self._blob))
+        if (len(self._ends) - 1) * 3 > len(table) * 2:
+            self._grow()
+        return True
+
+    def _grow(self) -> None:
+        old_table, old_entries = self._table, self._entries
+        self._table = array("q", bytes(16 * len(old_table)))
+        self._entries = array("q", bytes(16 * len(old_table)))
+        self._mask = len(self._table) - 1
+        table, entries = self._table, self._entries
+        mask = self._mask
+        for slot, digest in enumerate(old_table):
+            if digest != _EMPTY:
+                index = digest & mask
+                while table[index] != _EMPTY:
+                    index = (index + 1) & mask
+                table[index] = digest
+                entries[index] = old_entries[slot]
@@ -0,0 +1,295 @@
+"""Opt-in checker for external http(s) link targets.
+
+`check_urls` probes a set of URLs concurrently on one asyncio event loop, using only
+the standard library:
+
+- a small HTTP/1.1 client over `asyncio.open_connection` that keeps connections
+  alive and pools them per (scheme, host, port)
+- a global concurrency limit plus a per-host limit, so one slow or rate-limiting
+  site does not starve the rest and no site sees more than a few parallel requests
+- `HEAD` first; a `HEAD` answered with an error status is retried as `GET`, since
+  many servers reject or mishandle `HEAD`. Redirects are followed
+- a persistent result cache (`.cache/ficecal-validate/external-links.json`): a URL
+  that answered healthy is not probed again until its entry is older than the TTL
+
+A URL counts as alive when the final status is below 400, or 401/403/429 (the page
+exists but refuses anonymous or rapid clients). Only alive URLs with a status below
+400 are cached, so failures and inconclusive answers are re-probed on every run.
+
+`scripts/selfcheck-external-links.py` exercises this module offline against a local
+`http.server`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import ssl
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import quote, urljoin, urlsplit
+
+from validation.cache import CACHE_DIR, cache_enabled
+
+CACHE_PATH = CACHE_DIR / "external-links.json"
+CACHE_FORMAT = 1
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_CONCURRENCY = 32
+DEFAULT_PER_HOST = 4
+DEFAULT_TTL_HOURS = 72.0
+
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+ALIVE_ERROR_STATUSES = frozenset({401, 403, 429})
+# Bodies up to this size are read so the connection can be reused; larger ones close it.
+MAX_DRAIN_BYTES = 64 * 1024
+USER_AGENT = "ficecal-doc-links/1 (+external link check)"
+PATH_SAFE = "/%?=&:@!$'()*+,;~-._"
+
+_Key = tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class ExternalOptions:
+    timeout: float = DEFAULT_TIMEOUT  # seconds per request
+    concurrency: int = DEFAULT_CONCURRENCY
+    per_host: int = DEFAULT_PER_HOST
+    ttl_hours: float = DEFAULT_TTL_HOURS
+
+
+@dataclass(frozen=True)
+class ExternalResult:
+    url: str
+    alive: bool
+    status: int = 0  # final HTTP status; 0 when no response was received
+    detail: str = ""
+    cached: bool = False
+
+
+class _Connections:
+    """Keep-alive connection pool and concurrency limits per (scheme, host, port)."""
+
+    def __init__(self, per_host: int) -> None:
+        self.per_host = per_host
+        self._idle: dict[_Key, list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self._limits: dict[_Key, asyncio.Semaphore] = {}
+        self._ssl: ssl.SSLContext | None = None
+
+    def limit(self, key: _Key) -> asyncio.Semaphore:
+        semaphore = self._limits.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host)
+            self._limits[key] = semaphore
+        return semaphore
+
+    async def open(self, key: _Key) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """Return a connection for `key` and whether it was reused from the pool."""
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            reader, writer = await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return reader, writer, False
+
+    def release(self, key: _Key, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._idle.setdefault(key, []).append((reader, writer))
+
+    async def close(self) -> None:
+        writers = [writer for idle in self._idle.values() for _, writer in idle]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[int, dict[str, str]]:
+    status_line = (await reader.readuntil(b"\r\n")).decode("latin-1")
+    parts = status_line.split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise ValueError(f"malformed status line {status_line.strip()!r}")
+    headers: dict[str, str] = {}
+    while True:
+        line = (await reader.readuntil(b"\r\n")).decode("latin-1")
+        if line == "\r\n":
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+async def _drain_body(reader: asyncio.StreamReader, method: str, status: int, headers: dict[str, str]) -> bool:
+    """Consume the response body; return whether the connection can be reused."""
+    if "close" in headers.get("connection", "").lower():
+        return False
+    if method == "HEAD" or status in {204, 304} or 100 <= status < 200:
+        return True
+    length = headers.get("content-length", "")
+    if headers.get("transfer-encoding") or not length.isdigit() or int(length) > MAX_DRAIN_BYTES:
+        return False
+    await reader.readexactly(int(length))
+    return True
+
+
+def _request_target(url: str) -> tuple[_Key, str, str]:
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if not host:
+        raise ValueError("URL has no host")
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    path = quote(parts.path or "/", safe=PATH_SAFE)
+    if parts.query:
+        path += "?" + quote(parts.query, safe=PATH_SAFE)
+    host_header = host.encode("idna").decode("ascii")
+    if ":" in host_header:
+        host_header = f"[{host_header}]"
+    if parts.port:
+        host_header += f":{parts.port}"
+    return (parts.scheme, host, port), path, host_header
+
+
+async def _request(connections: _Connections, method: str, url: str) -> tuple[int, dict[str, str]]:
+    key, path, host_header = _request_target(url)
+    request = (
+        f"{method} {path} HTTP/1.1\r\nHost: {host_header}\r\nUser-Agent: {USER_AGENT}\r\n"
+        "Accept: */*\r\nConnection: keep-alive\r\n\r\n"
+    ).encode("ascii")
+    async with connections.limit(key):
+        while True:
+            reader, writer, reused = await connections.open(key)
+            reusable = False
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, headers = await _read_head(reader)
+                reusable = await _drain_body(reader, method, status, headers)
+                return status, headers
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # A pooled connection the server has since closed: retry on a fresh one.
+                if reused:
+                    continue
+                raise
+            finally:
+                if reusable:
+                    connections.release(key, reader, writer)
+                else:
+                    writer.close()
+
+
+async def _probe(connections: _Connections, url: str, timeout: float) -> ExternalResult:
+    current = url
+    method = "HEAD"
+    redirects = 0
+    try:
+        while True:
+            status, headers = await asyncio.wait_for(_request(connections, method, current), timeout)
+            if status in REDIRECT_STATUSES and headers.get("location"):
+                redirects += 1
+                if redirects > MAX_REDIRECTS:
+                    return ExternalResult(url, False, status, f"more than {MAX_REDIRECTS} redirects")
+                current = urljoin(current, headers["location"])
+                if urlsplit(current).scheme not in {"http", "https"}:
+                    return ExternalResult(url, True, status)
+                continue
+            if status >= 400 and method == "HEAD":
+                method = "GET"
+                continue
+            alive = status < 400 or status in ALIVE_ERROR_STATUSES
+            return ExternalResult(url, alive, status, "" if alive else f"HTTP {status}")
+    except asyncio.TimeoutError:
+        return ExternalResult(url, False, detail=f"timed out after {timeout:g}s")
+    except (OSError, ValueError, UnicodeError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as exc:
+        return ExternalResult(url, False, detail=f"{type(exc).__name__}: {exc}".rstrip(": "))
+
+
+async def _probe_all(urls: list[str], timeout: float, concurrency: int, per_host: int) -> list[ExternalResult]:
+    connections = _Connections(per_host)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(url: str) -> ExternalResult:
+        async with semaphore:
+            return await _probe(connections, url, timeout)
+
+    try:
+        return await asyncio.gather(*(bounded(url) for url in urls))
+    finally:
+        await connections.close()
+
+
+def _load_cache(path: Path) -> dict[str, dict[str, float]]:
+    try:
+        stored = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(stored, dict) or stored.get("format") != CACHE_FORMAT:
+        return {}
+    if not isinstance(stored.get("urls"), dict):
+        return {}
+    return stored["urls"]
+
+
+def _save_cache(path: Path, entries: dict[str, dict[str, float]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps({"format": CACHE_FORMAT, "urls": entries}, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def check_urls(
+    urls: Iterable[str],
+    options: ExternalOptions = ExternalOptions(),
+    cache_path: Path = CACHE_PATH,
+) -> dict[str, ExternalResult]:
+    """Probe each distinct URL once (fragments ignored) and return results by URL.
+
+    URLs with a healthy cache entry younger than `options.ttl_hours` are not probed.
+    The cache is neither read nor written when the validation cache is disabled.
+    """
+    by_resource: dict[str, list[str]] = {}
+    for url in urls:
+        by_resource.setdefault(url.partition("#")[0], []).append(url)
+
+    use_cache = cache_enabled()
+    entries = _load_cache(cache_path) if use_cache else {}
+    now = time.time()
+    ttl_seconds = options.ttl_hours * 3600
+    results: dict[str, ExternalResult] = {}
+    to_probe: list[str] = []
+    for resource in by_resource:
+        entry = entries.get(resource)
+        if entry is not None and now - entry.get("checkedAt", 0) < ttl_seconds:
+            results[resource] = ExternalResult(resource, True, int(entry.get("status", 0)), cached=True)
+        else:
+            to_probe.append(resource)
+
+    if to_probe:
+        probes = _probe_all(to_probe, options.timeout, max(1, options.concurrency), max(1, options.per_host))
+        for result in asyncio.run(probes):
+            results[result.url] = result
+            if result.alive and 0 < result.status < 400:
+                entries[result.url] = {"checkedAt": now, "status": result.status}
+            else:
+                entries.pop(result.url, None)
+
+    if use_cache:
+        for resource, entry in list(entries.items()):
+            if now - entry.get("checkedAt", 0) >= ttl_seconds:
+                del entries[resource]
+        _save_cache(cache_path, entries)
+
+    return {url: results[resource] for resource, originals in by_resource.items() for url in originals}
@@ -0,0 +1,254 @@
+"""Shared index of the contract fixture tree.
+
+`tests/contracts/fixtures` is walked once with `os.scandir`; every directory's entries
+are recorded with file sizes, so existence and required-file checks are dictionary and
+set lookups rather than filesystem calls. Content hashes and parsed JSON payloads are computed
+lazily and memoized, so a fixture read by several validators in the same process is
+read and parsed once. Pack versions are ordered as semantic versions through a
+`VersionIndex` built once per pack. `FixtureIndex.refresh` rescans only the directories around
+changed paths and keeps the memoized state of files whose size and mtime are unchanged
+(used by `scripts/validate.py --watch`).
+
+Parsed payloads are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from validation.paths import REPO_ROOT
+from validation.versions import VersionIndex
+
+FIXTURE_ROOT = REPO_ROOT / "tests" / "contracts" / "fixtures"
+MCP_DIR_NAME = "mcp"
+
+
+@dataclass
+class FixtureFile:
+    location: str  # absolute path as a string; `path` builds the Path on demand
+    size: int
+    mtime_ns: int = 0
+    _path: Path | None = field(default=None, repr=False)
+    _digest: str | None = field(default=None, repr=False)
+    _payload: Any = field(default=None, repr=False)
+    _error: json.JSONDecodeError | None = field(default=None, repr=False)
+    _parsed: bool = field(default=False, repr=False)
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = Path(self.location)
+        return self._path
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.location)
+
+    def digest(self) -> str:
+        """Return the sha256 hex digest of the file content."""
+        if self._digest is None:
+            with open(self.location, "rb") as handle:
+                self._digest = hashlib.sha256(handle.read()).hexdigest()
+        return self._digest
+
+    def payload(self) -> Any:
+        """Return the parsed JSON payload, raising `json.JSONDecodeError` on bad JSON."""
+        if not self._parsed:
+            with open(self.location, "rb") as handle:
+                raw = handle.read()
+            if self._digest is None:
+                self._digest = hashlib.sha256(raw).hexdigest()
+            try:
+                self._payload = json.loads(raw.decode("utf-8"))
+            except json.JSONDecodeError as exc:
+                self._error = exc
+            self._parsed = True
+        if self._error is not None:
+            raise self._error
+        return self._payload
+
+
+@dataclass
+class FixtureVersion:
+    name: str
+    path: Path
+    files: dict[str, FixtureFile]  # by file name; shared with the index, read-only
+
+    def json_files(self) -> list[FixtureFile]:
+        return [self.files[name] for name in sorted(self.files) if name.endswith(".json")]
+
+    def has_prefix(self, prefix: str, suffix: str = "") -> bool:
+        return any(name.startswith(prefix) and name.endswith(suffix) for name in self.files)
+
+
+@dataclass
+class FixturePack:
+    name: str
+    path: Path
+    versions: dict[str, FixtureVersion]
+
+    @cached_property
+    def version_index(self) -> VersionIndex:
+        return VersionIndex(self.versions)
+
+    def version_names(self) -> list[str]:
+        """Version directory names in semver order, non-semver names first."""
+        return self.version_index.names()
+
+    def latest(self) -> FixtureVersion | None:
+        """The highest release version (highest pre-release if there is no release)."""
+        latest = self.version_index.latest
+        return self.versions[latest.name] if latest is not None else None
+
+
+@dataclass
+class _DirEntries:
+    dirs: list[str]
+    files: dict[str, FixtureFile]
+
+
+class FixtureIndex:
+    """Snapshot of a fixture tree built from a single `os.scandir` traversal.
+
+    Entries are keyed by path string; lookups accept `Path` or `str`. Each file costs
+    one `scandir` entry and one `stat`, and `Path` objects are only built on demand.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._root = os.fspath(root)
+        self._dirs: dict[str, _DirEntries] = {}
+        self._files: dict[str, FixtureFile] = {}
+        self._packs: dict[str, FixturePack] = {}
+        if os.path.isdir(self._root):
+            self._walk(self._root)
+
+    def _walk(self, root: str, previous: dict[str, FixtureFile] | None = None) -> None:
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            entries = _DirEntries(dirs=[], files={})
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        entries.dirs.append(entry.name)
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        fixture_file = previous.get(entry.path) if previous else None
+                        if (
+                            fixture_file is None
+                            or fixture_file.size != stat.st_size
+                            or fixture_file.mtime_ns != stat.st_mtime_ns
+                        ):
+                            fixture_file = FixtureFile(entry.path, stat.st_size, stat.st_mtime_ns)
+                        entries.files[entry.name] = fixture_file
+                        self._files[entry.path] = fixture_file
+            entries.dirs.sort()
+            self._dirs[directory] = entries
+
+    def _drop(self, directory: str) -> dict[str, FixtureFile]:
+        """Forget `directory` and everything below it; return the files it held."""
+        dropped: dict[str, FixtureFile] = {}
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            entries = self._dirs.pop(current, None)
+            if entries is None:
+                continue
+            for fixture_file in entries.files.values():
+                dropped[fixture_file.location] = fixture_file
+                self._files.pop(fixture_file.location, None)
+            pending.extend(os.path.join(current, name) for name in entries.dirs)
+        return dropped
+
+    def refresh(self, paths: Iterable[Path | str]) -> None:
+        """Bring the index up to date after `paths` were added, modified or removed."""
+        rescan: set[str] = set()
+        for path in paths:
+            location = os.fspath(path)
+            if not location.startswith(self._root + os.sep):
+                continue
+            # Rescan from the deepest directory the index knows, starting at the parent,
+            # so creations and deletions of whole subtrees are picked up.
+            directory = os.path.dirname(location)
+            while directory != self._root and directory not in self._dirs:
+                directory = os.path.dirname(directory)
+            rescan.add(directory)
+        # A directory nested under another one being rescanned is covered by it.
+        for directory in sorted(rescan, key=len):
+            if any(directory.startswith(other + os.sep) for other in rescan):
+                continue
+            previous = self._drop(directory)
+            if os.path.isdir(directory):
+                self._walk(directory, previous)
+            parent = self._dirs.get(os.path.dirname(directory))
+            if parent is not None and directory != self._root:
+                name = os.path.basename(directory)
+                present = directory in self._dirs
+                if present and name not in parent.dirs:
+                    parent.dirs.append(name)
+                    parent.dirs.sort()
+                elif not present and name in parent.dirs:
+                    parent.dirs.remove(name)
+        if rescan:
+            self._packs.clear()
+
+    def is_dir(self, path: Path | str) -> bool:
+        return os.fspath(path) in self._dirs
+
+    def exists(self, path: Path | str) -> bool:
+        location = os.fspath(path)
+        return location in self._files or location in self._dirs
+
+    def file(self, path: Path | str) -> FixtureFile | None:
+        return self._files.get(os.fspath(path))
+
+    def subdirs(self, path: Path | str) -> list[str]:
+        entries = self._dirs.get(os.fspath(path))
+        return list(entries.dirs) if entries is not None else []
+
+    def files_in(self, path: Path | str) -> dict[str, FixtureFile]:
+        entries = self._dirs.get(os.fspath(path))
+        return dict(entries.files) if entries is not None else {}
+
+    def module_pack_names(self) -> list[str]:
+        return [name for name in self.subdirs(self._root) if name != MCP_DIR_NAME]
+
+    def mcp_pack_names(self) -> list[str]:
+        return self.subdirs(os.path.join(self._root, MCP_DIR_NAME))
+
+    def pack(self, path: Path) -> FixturePack:
+        """Return the pack at `path`; each subdirectory is one version."""
+        location = os.fspath(path)
+        pack = self._packs.get(location)
+        if pack is None:
+            entries = self._dirs.get(location)
+            versions = {}
+            for name in entries.dirs if entries is not None else ():
+                version_entries = self._dirs.get(os.path.join(location, name))
+                files = version_entries.files if version_entries is not None else {}
+                versions[name] = FixtureVersion(name, path / name, files)
+            pack = FixturePack(path.name, path, versions)
+            self._packs[location] = pack
+        return pack
+
+    def load_json(self, path: Path | str) -> Any:
+        """Parse `path` through the index, falling back to a direct read outside it."""
+        fixture_file = self._files.get(os.fspath(path))
+        if fixture_file is None:
+            with open(path, encoding="utf-8") as handle:
+                return json.load(handle)
+        return fixture_file.payload()
+
+
+@lru_cache(maxsize=None)
+def fixture_index(root: Path = FIXTURE_ROOT) -> FixtureIndex:
+    """Return the process-wide index for `root`, building it on first use."""
+    return FixtureIndex(root)
@@ -0,0 +1,111 @@
+"""Markdown link graph collected during the doc-link pass.
+
+Nodes are repository-relative paths with compact integer ids: first every markdown
+file in scope (in walk order), then link targets as they are first seen. Edges point
+from a document to each distinct existing local target it links to (files, images,
+directories, other docs). Fragment-only links to the document itself add no edge.
+
+The graph answers the questions the doc-link report needs without another scan:
+orphan documents (no inbound link from another document), the most-linked documents
+and the reverse index "who links here", which is what a rename breaks. It exports as
+JSON (`nodes` plus an `[source, target]` edge list) or as tab-separated adjacency
+lists.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Iterable
+
+# Entry points reached from outside the docs tree; never reported as orphans.
+ENTRY_POINTS = frozenset({"README.md", "CONTRIBUTING.md"})
+
+
+class LinkGraph:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._docs: list[int] = []
+        self._out: list[list[int]] = []
+        self._inbound: list[list[int]] | None = None
+
+    def node(self, path: str) -> int:
+        node_id = self._ids.get(path)
+        if node_id is None:
+            node_id = len(self.paths)
+            self._ids[path] = node_id
+            self.paths.append(path)
+            self._out.append([])
+        return node_id
+
+    def add_doc(self, path: str) -> None:
+        self._docs.append(self.node(path))
+
+    def add_links(self, source: str, targets: Iterable[str]) -> None:
+        """Add edges from document `source` to distinct `targets`."""
+        source_id = self.node(source)
+        self._out[source_id].extend(self.node(target) for target in targets)
+        self._inbound = None
+
+    def inbound(self) -> list[list[int]]:
+        """Return, per node id, the ids of documents linking to it."""
+        if self._inbound is None:
+            inbound: list[list[int]] = [[] for _ in self.paths]
+            for source_id, targets in enumerate(self._out):
+                for target_id in targets:
+                    inbound[target_id].append(source_id)
+            self._inbound = inbound
+        return self._inbound
+
+    def orphans(self) -> list[str]:
+        """Documents no other document links to, entry points excepted."""
+        inbound = self.inbound()
+        return sorted(
+            self.paths[doc_id]
+            for doc_id in self._docs
+            if not inbound[doc_id] and self.paths[doc_id] not in ENTRY_POINTS
+        )
+
+    def most_linked(self, limit: int) -> list[tuple[str, int]]:
+        """The `limit` documents with the most linking documents, ties by path."""
+        inbound = self.inbound()
+        ranked = sorted(
+            ((self.paths[doc_id], len(inbound[doc_id])) for doc_id in self._docs if inbound[doc_id]),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return ranked[:limit]
+
+    def linking_to(self, path: str) -> list[tuple[str, list[str]]]:
+        """Reverse index: documents linking to `path` or to anything below it.
+
+        Returns `(source document, targets it links to)` pairs sorted by source.
+        """
+        path = path.strip("/")
+        prefix = f"{path}/"
+        inbound = self.inbound()
+        sources: dict[str, list[str]] = {}
+        for target_id, target in enumerate(self.paths):
+            if target != path and not target.startswith(prefix):
+                continue
+            for source_id in inbound[target_id]:
+                sources.setdefault(self.paths[source_id], []).append(target)
+        return [(source, sorted(targets)) for source, targets in sorted(sources.items())]
+
+    def to_json(self) -> str:
+        docs = set(self._docs)
+        payload = {
+            "nodes": [
+                {"id": node_id, "path": path, "doc": node_id in docs} for node_id, path in enumerate(self.paths)
+            ],
+            "edges": [
+                [source_id, target_id] for source_id, targets in enumerate(self._out) for target_id in targets
+            ],
+        }
+        return json.dumps(payload, separators=(",", ":")) + "\n"
+
+    def to_adjacency(self) -> str:
+        """One `id<TAB>path<TAB>target ids` line per node."""
+        lines = ["# id\tpath\tlinks to (ids)"]
+        for node_id, path in enumerate(self.paths):
+            lines.append(f"{node_id}\t{path}\t{' '.join(str(target_id) for target_id in self._out[node_id])}")
+        return "\n".join(lines) + "\n"
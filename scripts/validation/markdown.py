@@ -0,0 +1,377 @@
+"""Streaming Markdown link scanner.
+
+`scan_file` reads a document line by line and yields every link target it contains:
+
+- inline links and images: `[text](target)`, `![alt](target "title")`
+- reference definitions: `[label]: target` (the usages `[x][label]` carry no target)
+- raw HTML `href` / `src` attributes, e.g. `<img src="diagram.png">`
+
+Fenced code blocks (``` and ~~~), inline code spans and HTML comments are skipped.
+Indented code blocks are not recognized, since they are indistinguishable from
+nested list content without a full block parser.
+
+Every scan is linear in the line length. Brackets are matched with a stack, and
+searches for closing `)`, `>` or quotes go through `_NextIndex`, which never rescans
+text it has already passed. Plain lines (no escapes, code spans or nested brackets)
+take a regex fast path; see `_simple_links` for when it is exact and linear.
+Pathological input such as ten thousand unclosed `[` or `](` cannot trigger the
+quadratic backtracking of a regex like `\\[[^\\]]*\\]\\(`.
+`benchmarks/markdown_adversarial.py` checks this.
+
+`file_anchors` returns the fragment ids a document defines: GitHub heading slugs
+(ATX and setext, with `-1`, `-2` suffixes for duplicates) plus explicit HTML `id` and
+`name` attributes.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+FENCE_PATTERN = re.compile(r" {0,3}(`{3,}|~{3,})")
+FENCE_STARTS = tuple(f"{' ' * indent}{fence}" for indent in range(4) for fence in ("```", "~~~"))
+DEFINITION_PATTERN = re.compile(r" {0,3}\[((?:[^\]\\]|\\.)+)\]:[ \t]*(<[^>\n]*>|\S+)")
+BRACKET_PATTERN = re.compile(r"[\[\]\\]")
+SIMPLE_LINK_PATTERN = re.compile(r"(!?)\[[^\[\]]*\]\(([^)]*)\)")
+ATX_HEADING_PATTERN = re.compile(r" {0,3}#{1,6}(?:[ \t]|\Z)")
+SETEXT_UNDERLINE_PATTERN = re.compile(r" {0,3}(=+|-+)[ \t]*\Z")
+NOT_PARAGRAPH_PATTERN = re.compile(r" {0,3}(?:[-*+>|#]|\d+[.)]|<)")
+HEADING_LINK_PATTERN = re.compile(r"!?\[([^\[\]]*)\](?:\([^()]*\)|\[[^\[\]]*\])?")
+UNDERSCORE_RUN_PATTERN = re.compile(r"_+")
+HTML_TAG_PATTERN = re.compile(r"<[^<>]*>")
+ID_ATTRIBUTE_PATTERN = re.compile(r"""(?<![\w-])(?:id|name)[ \t]*=[ \t]*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r"(?<![\w-])(href|src)[ \t]*=[ \t]*", re.IGNORECASE)
+
+
+@dataclass
+class Link:
+    line: int
+    column: int  # 1-based column of the target
+    target: str
+    kind: str  # inline | image | reference | html
+
+
+class _NextIndex:
+    """Amortized `str.find` for monotonically increasing start positions."""
+
+    def __init__(self, text: str, char: str) -> None:
+        self.text = text
+        self.char = char
+        self.found = -2  # result of the last search; -1 means none left
+
+    def after(self, pos: int) -> int:
+        if self.found == -1 or (self.found >= pos):
+            return self.found
+        self.found = self.text.find(self.char, pos)
+        return self.found
+
+
+def _code_spans(line: str) -> list[tuple[int, int]]:
+    """Return [start, end) ranges of inline code spans, in order."""
+    runs: list[tuple[int, int]] = []
+    idx = 0
+    length = len(line)
+    while True:
+        idx = line.find("`", idx)
+        if idx < 0:
+            break
+        end = idx
+        while end < length and line[end] == "`":
+            end += 1
+        runs.append((idx, end - idx))
+        idx = end
+
+    # Each opener closes at the next run of the same length. Runs are bucketed by
+    # length, and a per-length cursor only moves forward, which keeps this linear.
+    by_length: dict[int, list[int]] = {}
+    for position, (_start, size) in enumerate(runs):
+        by_length.setdefault(size, []).append(position)
+    cursors = dict.fromkeys(by_length, 0)
+
+    spans: list[tuple[int, int]] = []
+    position = 0
+    while position < len(runs):
+        start, size = runs[position]
+        bucket = by_length[size]
+        cursor = cursors[size]
+        while cursor < len(bucket) and bucket[cursor] <= position:
+            cursor += 1
+        cursors[size] = cursor
+        if cursor == len(bucket):
+            position += 1
+            continue
+        closer = bucket[cursor]
+        spans.append((start, runs[closer][0] + size))
+        position = closer + 1
+    return spans
+
+
+def _simple_links(line: str) -> list[re.Match[str]] | None:
+    """Match `line` with `SIMPLE_LINK_PATTERN` if that agrees with `_inline_links`.
+
+    The regex is linear as long as every `](` has a `)` after it. It is exact when
+    every bracket on the line is one of its matches' own `[`/`]` pair: no nesting, no
+    stray brackets and no brackets inside targets. Otherwise return None.
+    """
+    if "\\" in line or "`" in line or line.rfind("](") > line.rfind(")"):
+        return None
+    matches = list(SIMPLE_LINK_PATTERN.finditer(line))
+    if line.count("[") + line.count("]") != 2 * len(matches):
+        return None
+    return matches
+
+
+def _inline_links(line: str, number: int, skip: list[tuple[int, int]]) -> Iterator[Link]:
+    openers: list[bool] = []  # one entry per unmatched `[`: whether it opens an image
+    # Links cannot contain other links: after a link, the `[` openers still pending
+    # below this stack height are plain text (image openers stay active).
+    inactive_below = 0
+    close_paren = _NextIndex(line, ")")
+    skip_idx = 0
+    idx = 0
+    length = len(line)
+    while True:
+        match = BRACKET_PATTERN.search(line, idx)
+        if match is None:
+            return
+        idx = match.start()
+        while skip_idx < len(skip) and skip[skip_idx][1] <= idx:
+            skip_idx += 1
+        if skip_idx < len(skip) and skip[skip_idx][0] <= idx:
+            idx = skip[skip_idx][1]
+            continue
+        char = line[idx]
+        if char == "\\":
+            idx += 2
+            continue
+        if char == "[":
+            openers.append(idx > 0 and line[idx - 1] == "!")
+        elif openers:
+            image = openers.pop()
+            active = image or len(openers) >= inactive_below
+            inactive_below = min(inactive_below, len(openers))
+            if active and idx + 1 < length and line[idx + 1] == "(":
+                end = close_paren.after(idx + 2)
+                if end >= 0:
+                    target = line[idx + 2 : end]
+                    if target.strip():
+                        yield Link(number, idx + 3, target, "image" if image else "inline")
+                    if not image:
+                        inactive_below = len(openers)
+                    idx = end
+        idx += 1
+
+
+def _html_links(line: str, number: int, skip: list[tuple[int, int]]) -> Iterator[Link]:
+    close_tag = _NextIndex(line, ">")
+    quotes = {'"': _NextIndex(line, '"'), "'": _NextIndex(line, "'")}
+    idx = 0
+    skip_idx = 0
+    while True:
+        idx = line.find("<", idx)
+        if idx < 0:
+            return
+        while skip_idx < len(skip) and skip[skip_idx][1] <= idx:
+            skip_idx += 1
+        if skip_idx < len(skip) and skip[skip_idx][0] <= idx:
+            idx = skip[skip_idx][1]
+            continue
+        if idx + 1 >= len(line) or not line[idx + 1].isalpha():
+            idx += 1
+            continue
+        end = close_tag.after(idx + 1)
+        if end < 0:
+            return
+        for match in ATTRIBUTE_PATTERN.finditer(line, idx + 1, end):
+            value_start = match.end()
+            quote = line[value_start : value_start + 1]
+            if quote in quotes:
+                value_end = quotes[quote].after(value_start + 1)
+                if value_end < 0:
+                    continue
+                value = line[value_start + 1 : value_end]
+                column = value_start + 2
+            else:
+                value_end = value_start
+                while value_end < end and not line[value_end].isspace():
+                    value_end += 1
+                value = line[value_start:value_end]
+                column = value_start + 1
+            if value:
+                yield Link(number, column, value, "html")
+        idx = end + 1
+
+
+def _strip_comments(line: str, in_comment: bool) -> tuple[str, bool]:
+    """Blank out HTML comment text, which may span lines, keeping columns stable."""
+    out: list[str] = []
+    idx = 0
+    while idx < len(line):
+        if in_comment:
+            end = line.find("-->", idx)
+            if end < 0:
+                out.append(" " * (len(line) - idx))
+                return "".join(out), True
+            out.append(" " * (end + 3 - idx))
+            idx = end + 3
+            in_comment = False
+        else:
+            start = line.find("<!--", idx)
+            if start < 0:
+                out.append(line[idx:])
+                break
+            out.append(line[idx:start])
+            idx = start
+            in_comment = True
+    return "".join(out), in_comment
+
+
+def iter_links(lines: Iterable[str]) -> Iterator[Link]:
+    """Yield the link targets found in `lines`, in document order per line."""
+    fence: str | None = None
+    in_comment = False
+    for number, raw_line in enumerate(lines, start=1):
+        line = raw_line.rstrip("\r\n")
+
+        fence_match = FENCE_PATTERN.match(line) if line.startswith(FENCE_STARTS) else None
+        if fence is not None:
+            if fence_match and fence_match.group(1).startswith(fence) and not line[fence_match.end():].strip():
+                fence = None
+            continue
+        if fence_match and not (fence_match.group(1)[0] == "`" and "`" in line[fence_match.end():]):
+            fence = fence_match.group(1)
+            continue
+
+        if in_comment or "<!--" in line:
+            line, in_comment = _strip_comments(line, in_comment)
+        if "[" not in line and "<" not in line:
+            continue
+
+        definition = DEFINITION_PATTERN.match(line) if "]:" in line else None
+        if definition:
+            yield Link(number, definition.start(2) + 1, definition.group(2), "reference")
+            continue
+
+        spans = _code_spans(line) if "`" in line else []
+        if "](" in line:
+            matches = None if spans else _simple_links(line)
+            if matches is None:
+                yield from _inline_links(line, number, spans)
+            else:
+                for match in matches:
+                    target = match.group(2)
+                    if target.strip():
+                        yield Link(number, match.start(2) + 1, target, "image" if match.group(1) else "inline")
+        if "<" in line:
+            yield from _html_links(line, number, spans)
+
+
+def github_slug(text: str) -> str:
+    """Slug a heading's rendered text the way GitHub does (before duplicate suffixes)."""
+    slug: list[str] = []
+    for char in text.lower():
+        if char == " ":
+            slug.append("-")
+        elif char in "-_" or char.isalnum() or unicodedata.category(char).startswith("M"):
+            slug.append(char)
+    return "".join(slug)
+
+
+def _atx_content(line: str, start: int) -> str:
+    """Return an ATX heading's inline content without the optional closing `#`s."""
+    content = line[start:].strip()
+    stripped = content.rstrip("#")
+    if stripped != content and (not stripped or stripped[-1] in " \t"):
+        content = stripped.rstrip()
+    return content
+
+
+def _strip_underscore_emphasis(text: str) -> str:
+    # `_` runs at a word edge are emphasis markers; inside words (snake_case) they stay.
+    out: list[str] = []
+    last = 0
+    for match in UNDERSCORE_RUN_PATTERN.finditer(text):
+        start, end = match.span()
+        before = text[start - 1] if start else " "
+        after = text[end] if end < len(text) else " "
+        if before.isalnum() and after.isalnum():
+            continue
+        out.append(text[last:start])
+        last = end
+    out.append(text[last:])
+    return "".join(out)
+
+
+def _heading_text(raw: str) -> str:
+    """Approximate the rendered text of inline heading markdown."""
+    text = HEADING_LINK_PATTERN.sub(r"\1", raw)
+    text = HTML_TAG_PATTERN.sub("", text)
+    text = _strip_underscore_emphasis(text)
+    return text.replace("`", "").replace("*", "").replace("~~", "").strip()
+
+
+def iter_anchors(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the fragment ids defined by `lines`, in document order."""
+    seen: dict[str, int] = {}
+
+    def unique(slug: str) -> str:
+        # github-slugger: a repeated slug gets the first free `-N` suffix.
+        if slug not in seen:
+            seen[slug] = 0
+            return slug
+        while True:
+            seen[slug] += 1
+            candidate = f"{slug}-{seen[slug]}"
+            if candidate not in seen:
+                seen[candidate] = 0
+                return candidate
+
+    fence: str | None = None
+    paragraph: str | None = None  # a single preceding text line that may be a setext heading
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        fence_match = FENCE_PATTERN.match(line) if line.startswith(FENCE_STARTS) else None
+        if fence is not None:
+            if fence_match and fence_match.group(1).startswith(fence) and not line[fence_match.end():].strip():
+                fence = None
+            continue
+        if fence_match and not (fence_match.group(1)[0] == "`" and "`" in line[fence_match.end():]):
+            fence = fence_match.group(1)
+            paragraph = None
+            continue
+
+        if "<" in line:
+            for match in ID_ATTRIBUTE_PATTERN.finditer(line):
+                yield match.group(1) if match.group(1) is not None else match.group(2)
+
+        heading = ATX_HEADING_PATTERN.match(line) if "#" in line else None
+        if heading:
+            yield unique(github_slug(_heading_text(_atx_content(line, heading.end()))))
+            paragraph = None
+            continue
+        if paragraph is not None and SETEXT_UNDERLINE_PATTERN.match(line):
+            yield unique(github_slug(_heading_text(paragraph)))
+            paragraph = None
+            continue
+        if not line.strip() or NOT_PARAGRAPH_PATTERN.match(line) or line.startswith("    "):
+            paragraph = None
+        else:
+            paragraph = line
+
+
+def file_anchors(path: Path) -> frozenset[str]:
+    """Return the fragment ids `path` defines; empty if it cannot be read."""
+    try:
+        with path.open(encoding="utf-8") as handle:
+            return frozenset(iter_anchors(handle))
+    except (OSError, UnicodeDecodeError):
+        return frozenset()
+
+
+def scan_file(path: Path) -> Iterator[Link]:
+    """Stream `path` and yield its link targets without reading it whole."""
+    with path.open(encoding="utf-8") as handle:
+        yield from iter_links(handle)
@@ -0,0 +1,99 @@
+"""Precompiled string matchers for rule tables.
+
+Rule tables (provider baselines, say) name many literal prefixes and exact strings.
+Testing them one after another costs a comparison per rule; the matchers here are
+built once per table and test a string against every rule in a single pass:
+
+- `PrefixTrie`: a character trie of literal prefixes. `matches(text)` walks `text`
+  once and yields the value of every stored prefix it starts with, and
+  `has(text, value)` tests one value with a set lookup per matching prefix, so the
+  cost depends on the length of `text`, not on how many prefixes or values are stored
+- `MultiMatcher`: exact strings (one dict lookup) and prefixes (one trie walk) under
+  integer pattern ids; `hits(texts)` returns the ids matched by any of the texts
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+# Key of a node's values (a dict used as an ordered set); every other key is a single
+# character, so they cannot clash.
+_VALUES = ""
+
+
+class PrefixTrie:
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, prefix: str, value: Any) -> None:
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        values = node.setdefault(_VALUES, {})
+        if value not in values:
+            values[value] = None
+            self._size += 1
+
+    def matches(self, text: str) -> Iterator[Any]:
+        """Yield the values of every stored prefix of `text`, shortest prefix first."""
+        node = self._root
+        if _VALUES in node:
+            yield from node[_VALUES]
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return
+            if _VALUES in node:
+                yield from node[_VALUES]
+
+    def has(self, text: str, value: Any) -> bool:
+        """Whether `value` was added under some prefix of `text`."""
+        node = self._root
+        if value in node.get(_VALUES, ()):
+            return True
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return False
+            if value in node.get(_VALUES, ()):
+                return True
+        return False
+
+
+class MultiMatcher:
+    """Exact-string and prefix patterns, each registered under an integer id."""
+
+    def __init__(self) -> None:
+        self._exact: dict[str, list[int]] = {}
+        self._prefixes = PrefixTrie()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add_exact(self, text: str) -> int:
+        pattern_id = self._count
+        self._count += 1
+        self._exact.setdefault(text, []).append(pattern_id)
+        return pattern_id
+
+    def add_prefix(self, prefix: str) -> int:
+        pattern_id = self._count
+        self._count += 1
+        self._prefixes.add(prefix, pattern_id)
+        return pattern_id
+
+    def hits(self, texts: Iterable[str]) -> set[int]:
+        """Ids of the patterns matched by at least one of `texts`."""
+        found: set[int] = set()
+        exact = self._exact
+        for text in texts:
+            ids = exact.get(text)
+            if ids is not None:
+                found.update(ids)
+            found.update(self._prefixes.matches(text))
+        return found
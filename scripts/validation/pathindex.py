@@ -0,0 +1,239 @@
+"""In-memory index of repository paths for link-target resolution.
+
+`PathIndex.resolve` resolves a link target against a document directory lexically.
+Each directory it passes through is listed once with `os.scandir` and kept, and every
+`(directory, target)` pair is memoized, so thousands of links to the same playbooks
+cost a handful of syscalls instead of a `Path.resolve()` and `exists()` each.
+
+Resolution follows `Path.resolve()` semantics: a symlinked component is replaced by its
+real path before later `..` components apply, and missing components are handled
+lexically. Name matching is exact, so a link whose case differs from the file on disk
+is reported as missing on case-insensitive filesystems too, the same as on Linux CI;
+the result carries the correctly cased name as a hint. Targets that leave the
+repository fall back to the filesystem.
+
+`PathIndex.anchors` memoizes the fragment ids (heading slugs, HTML ids) of a markdown
+file, parsed on first use, so only files that anchor links actually target are read.
+
+Listings are a snapshot. `path_index()` returns the process-wide index, and
+`PathIndex.refresh` brings it up to date after a batch of file changes (used by
+`scripts/validate.py --watch`): it drops the listings of directories whose
+entries changed, the anchors of changed files and, when the set of paths changed, the
+memoized resolutions and `derived` values. `preload` and `add_anchors` fill the index up
+front so forked workers share one read-only copy.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from validation.changes import Change
+from validation.markdown import file_anchors
+
+FILE = 0
+DIR = 1
+SYMLINK = 2
+
+
+def _kind(location: str) -> int | None:
+    try:
+        mode = os.lstat(location).st_mode
+    except OSError:
+        return None
+    if stat.S_ISLNK(mode):
+        return SYMLINK
+    return DIR if stat.S_ISDIR(mode) else FILE
+
+
+@dataclass(frozen=True)
+class Resolved:
+    path: Path
+    exists: bool
+    case_hint: str = ""  # repository-relative path differing only in case, if any
+    rel: str = ""  # repository-relative path, if inside the repository
+    is_file: bool = False
+
+
+class PathIndex:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._root_str = str(root)
+        self._listings: dict[str, dict[str, int] | None] = {}
+        self._folded: dict[str, dict[str, str]] = {}
+        self._memo: dict[tuple[str, str], Resolved] = {}
+        self._anchors: dict[str, frozenset[str]] = {}
+        self._paths: dict[str, Path] = {}
+        self._derived: dict[str, Any] = {}
+
+    def _listing(self, rel_dir: str) -> dict[str, int] | None:
+        if rel_dir in self._listings:
+            return self._listings[rel_dir]
+        listing: dict[str, int] | None = {}
+        try:
+            with os.scandir(os.path.join(self._root_str, rel_dir)) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        listing[entry.name] = SYMLINK
+                    elif entry.is_dir(follow_symlinks=False):
+                        listing[entry.name] = DIR
+                    else:
+                        listing[entry.name] = FILE
+        except OSError:
+            listing = None
+        self._listings[rel_dir] = listing
+        return listing
+
+    def _case_match(self, rel_dir: str, name: str) -> str | None:
+        folded = self._folded.get(rel_dir)
+        if folded is None:
+            folded = {entry.casefold(): entry for entry in self._listing(rel_dir) or {}}
+            self._folded[rel_dir] = folded
+        return folded.get(name.casefold())
+
+    def _relative(self, real: str) -> list[str] | None:
+        if real == self._root_str:
+            return []
+        if real.startswith(self._root_str + os.sep):
+            return real[len(self._root_str) + 1 :].split(os.sep)
+        return None
+
+    def _outside(self, base: str, target: str) -> Resolved:
+        real = os.path.realpath(os.path.join(self._root_str, base, target))
+        return Resolved(Path(real), os.path.exists(real))
+
+    def preload(self, rel_dirs: Iterable[str]) -> None:
+        """List `rel_dirs` and their ancestors now, e.g. before forking workers."""
+        for rel_dir in set(rel_dirs):
+            parts = rel_dir.split("/") if rel_dir else []
+            for depth in range(len(parts) + 1):
+                self._listing("/".join(parts[:depth]))
+
+    def derived(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return `build()`, memoized under `key` until paths are added or removed.
+
+        For values computed from the set of paths, such as a validator's file list. A
+        changed `.gitignore` also drops them, since walks honor it.
+        """
+        if key not in self._derived:
+            self._derived[key] = build()
+        return self._derived[key]
+
+    def refresh(self, changes: Iterable[Change]) -> None:
+        """Bring the index up to date after `changes` (paths relative to the index root)."""
+        tree_changed = False
+        for change in changes:
+            for status, rel in ((change.status, change.path), ("D", change.old_path)):
+                if rel is None:
+                    continue
+                self._anchors.pop(rel, None)
+                if status != "M" or rel.rpartition("/")[2] == ".gitignore":
+                    tree_changed = True
+                # Drop every cached listing that disagrees with the disk: a file created
+                # in a new directory also changes the listing above that directory.
+                while rel:
+                    parent, _, name = rel.rpartition("/")
+                    if parent in self._listings:
+                        listing = self._listings[parent]
+                        if listing is not None and listing.get(name) == _kind(os.path.join(self._root_str, rel)):
+                            break
+                        del self._listings[parent]
+                        self._folded.pop(parent, None)
+                        tree_changed = True
+                    rel = parent
+        if tree_changed:
+            self._memo.clear()
+            self._derived.clear()
+
+    def add_anchors(self, rel: str, anchors: frozenset[str]) -> None:
+        """Record the fragment ids of `rel` when the caller has already parsed it."""
+        self._anchors[rel] = anchors
+
+    def anchors(self, rel: str) -> frozenset[str]:
+        """Return the fragment ids defined by the markdown file at `rel`."""
+        anchors = self._anchors.get(rel)
+        if anchors is None:
+            anchors = file_anchors(self.root / rel)
+            self._anchors[rel] = anchors
+        return anchors
+
+    def resolve(self, base: str, target: str) -> Resolved:
+        """Resolve `target` (already URL-decoded) relative to repository directory `base`.
+
+        A target starting with `/` is relative to the repository root.
+        """
+        key = (base, target)
+        cached = self._memo.get(key)
+        if cached is None:
+            cached = self._resolve(base, target)
+            self._memo[key] = cached
+        return cached
+
+    def _resolve(self, base: str, target: str) -> Resolved:
+        if target.startswith("/"):
+            base, target = "", target.lstrip("/")
+            current: list[str] = []
+        else:
+            current = base.split("/") if base else []
+
+        for part in target.split("/"):
+            if part in {"", "."}:
+                continue
+            if part == "..":
+                if not current:
+                    return self._outside(base, target)
+                current.pop()
+                continue
+            listing = self._listing("/".join(current))
+            if listing is not None and listing.get(part) == SYMLINK:
+                real = os.path.realpath(os.path.join(self._root_str, *current, part))
+                relative = self._relative(real)
+                if relative is None:
+                    return self._outside(base, target)
+                current = relative
+                continue
+            current.append(part)
+
+        return self._check(current)
+
+    def path(self, rel: str) -> Path:
+        """Return the absolute path for repository-relative `rel`, shared between callers."""
+        path = self._paths.get(rel)
+        if path is None:
+            path = self.root / rel if rel else self.root
+            self._paths[rel] = path
+        return path
+
+    def _check(self, parts: list[str]) -> Resolved:
+        path = self.path("/".join(parts))
+        parent = ""
+        kind: int | None = DIR
+        for idx, part in enumerate(parts):
+            listing = self._listing(parent)
+            kind = listing.get(part) if listing is not None else None
+            if kind is None:
+                match = self._case_match(parent, part) if listing is not None else None
+                hint = ""
+                if match:
+                    candidate = [*parts[:idx], match, *parts[idx + 1 :]]
+                    found = self._check(candidate)
+                    if found.exists or found.case_hint:
+                        hint = found.case_hint or "/".join(candidate)
+                return Resolved(path, False, hint)
+            if kind == SYMLINK:
+                # A dangling or looping link left unresolved by the walk above.
+                return Resolved(path, os.path.exists(path))
+            if kind == FILE and idx < len(parts) - 1:
+                return Resolved(path, False)
+            parent = f"{parent}/{part}" if parent else part
+        return Resolved(path, True, rel=parent, is_file=kind == FILE)
+
+
+@lru_cache(maxsize=None)
+def path_index(root: Path) -> PathIndex:
+    """Return the process-wide index for `root`, building it on first use."""
+    return PathIndex(root)
@@ -0,0 +1,33 @@
+"""Repository root used by the validators.
+
+Validators check the repository they live in. Setting `FICECAL_VALIDATE_ROOT` points
+them at another tree with the same layout instead; the benchmark suite uses this to
+run the real scripts against generated repositories.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path, PurePath
+
+ROOT_ENV = "FICECAL_VALIDATE_ROOT"
+SOURCE_ROOT = Path(__file__).resolve().parents[2]
+REPO_ROOT = Path(os.environ[ROOT_ENV]).resolve() if os.environ.get(ROOT_ENV) else SOURCE_ROOT
+
+_ROOT_PREFIX = os.path.join(os.fspath(REPO_ROOT), "")
+
+
+def repo_relative(path: PurePath | str) -> str | None:
+    """Return `path` relative to REPO_ROOT with `/` separators, or None if outside it.
+
+    Lexical like `Path.relative_to`, but a string prefix check, which matters when
+    called once per fixture file or parity row.
+    """
+    location = os.fspath(path)
+    if location.startswith(_ROOT_PREFIX):
+        rel = location[len(_ROOT_PREFIX) :]
+        return rel.replace(os.sep, "/") if os.sep != "/" else rel
+    try:
+        return Path(location).relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return None
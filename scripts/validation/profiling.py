@@ -0,0 +1,133 @@
+"""Profiling hook behind `--profile OUT`.
+
+Wraps a validation run in cProfile and writes:
+
+- `OUT.pstats`: cProfile statistics, readable with `python -m pstats` or snakeviz
+- `OUT.collapsed`: sampled call stacks in collapsed format (`frame;frame;frame count`),
+  readable directly by flamegraph.pl, speedscope or inferno
+
+The collapsed stacks come from a sampling thread that reads the validating thread's
+frame through `sys._current_frames()`, since cProfile keeps only caller/callee pairs.
+With `--profile-memory` tracemalloc also runs and the peak traced size and top
+allocation sites are written to `OUT.memory.txt`.
+
+A short hot-spot table goes to stderr so stdout stays usable for `--format json|junit`.
+Combine with `--no-cache` to profile the full validation work rather than cache hits.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SAMPLE_INTERVAL_SECONDS = 0.001
+TOP_FUNCTIONS = 15
+TOP_ALLOCATIONS = 10
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = Path(code.co_filename)
+    try:
+        filename = path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        filename = path.name
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Sample one thread's call stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL_SECONDS) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="validation-stack-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels: list[str] = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: Path) -> None:
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+
+def _memory_report(snapshot: tracemalloc.Snapshot, peak: int) -> str:
+    lines = [f"peak traced memory: {peak / 1024:.1f} KiB", f"top {TOP_ALLOCATIONS} allocation sites:"]
+    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def profiled(out: str | Path, trace_memory: bool = False, label: str = "validate") -> Iterator[None]:
+    """Profile the enclosed block and write the reports next to `out`."""
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    if trace_memory:
+        tracemalloc.start()
+    sampler = StackSampler(threading.get_ident())
+    profiler = cProfile.Profile()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, cProfile.__file__), tracemalloc.Filter(False, __file__)]
+            )
+            tracemalloc.stop()
+
+        stats_path = out.with_name(out.name + ".pstats")
+        collapsed_path = out.with_name(out.name + ".collapsed")
+        profiler.dump_stats(str(stats_path))
+        sampler.write(collapsed_path)
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("tottime").print_stats(TOP_FUNCTIONS)
+        print(summary.getvalue().rstrip(), file=sys.stderr)
+        written = [stats_path, collapsed_path]
+
+        if trace_memory:
+            memory_path = out.with_name(out.name + ".memory.txt")
+            report = _memory_report(snapshot, peak)
+            memory_path.write_text(report, encoding="utf-8")
+            print(report.rstrip(), file=sys.stderr)
+            written.append(memory_path)
+
+        print(
+            f"[{label}] profile: {sum(sampler.stacks.values())} stack samples; wrote "
+            + ", ".join(str(path) for path in written),
+            file=sys.stderr,
+        )
@@ -0,0 +1,143 @@
+"""Machine-readable validation reports.
+
+`--format json` emits one JSON document; `--format junit` emits JUnit XML with one
+`<testsuite>` per validator and one `<testcase>` per recorded check, so CI can show
+per-check durations. Cached checks are reported as skipped. Violations raised outside
+any check, or by a validator that records no checks, are reported on a testcase named
+after the validator itself.
+"""
+
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING, Any, Sequence
+
+if TYPE_CHECKING:
+    from validation.core import Check, ValidatorResult, Violation
+
+REPORT_FORMAT = 1
+
+
+def _violation_dict(violation: Violation) -> dict[str, str]:
+    return {
+        "rule": violation.rule,
+        "path": violation.path,
+        "pointer": violation.pointer,
+        "message": violation.message,
+    }
+
+
+def _check_dict(check: Check) -> dict[str, Any]:
+    return {
+        "rule": check.rule,
+        "target": check.target,
+        "outcome": check.outcome,
+        "elapsedNs": check.elapsed_ns,
+        "violations": [_violation_dict(violation) for violation in check.violations],
+    }
+
+
+def _uncovered_violations(result: ValidatorResult) -> list[Violation]:
+    covered = {violation for check in result.checks for violation in check.violations}
+    return [violation for violation in result.violations if violation not in covered]
+
+
+def render_json(results: Sequence[ValidatorResult], wall_ns: int) -> str:
+    payload = {
+        "format": REPORT_FORMAT,
+        "ok": all(result.ok for result in results),
+        "wallNs": wall_ns,
+        "validators": [
+            {
+                "name": result.name,
+                "ok": result.ok,
+                "message": result.message,
+                "elapsedNs": result.elapsed_ns,
+                "violations": [_violation_dict(violation) for violation in result.violations],
+                "checks": [_check_dict(check) for check in result.checks],
+            }
+            for result in results
+        ],
+    }
+    return json.dumps(payload, indent=2)
+
+
+def _seconds(elapsed_ns: int) -> str:
+    return f"{elapsed_ns / 1e9:.6f}"
+
+
+def _add_failure(testcase: ET.Element, violations: Sequence[Violation], message: str) -> None:
+    failure = ET.SubElement(
+        testcase,
+        "failure",
+        message=message,
+        type=violations[0].rule if violations and violations[0].rule else "validation",
+    )
+    failure.text = "\n".join(violation.render() for violation in violations) or message
+
+
+def render_junit(results: Sequence[ValidatorResult], wall_ns: int) -> str:
+    root = ET.Element("testsuites", name="ficecal-validate", time=_seconds(wall_ns))
+    total_tests = total_failures = total_errors = total_skipped = 0
+
+    for result in results:
+        suite = ET.SubElement(root, "testsuite", name=result.name, time=_seconds(result.elapsed_ns))
+        tests = failures = errors = skipped = 0
+
+        for check in result.checks:
+            testcase = ET.SubElement(
+                suite,
+                "testcase",
+                classname=f"{result.name}.{check.rule}",
+                name=check.target or check.rule,
+                time=_seconds(check.elapsed_ns),
+            )
+            tests += 1
+            if check.outcome == "cached":
+                ET.SubElement(testcase, "skipped", message="unchanged since last passing run")
+                skipped += 1
+            elif check.outcome == "failed":
+                _add_failure(testcase, check.violations, f"{len(check.violations)} violation(s)")
+                failures += 1
+            elif check.outcome == "error":
+                ET.SubElement(testcase, "error", message="validator crashed during this check")
+                errors += 1
+
+        uncovered = _uncovered_violations(result)
+        if not result.checks or (not result.ok and (uncovered or not result.violations)):
+            testcase = ET.SubElement(
+                suite,
+                "testcase",
+                classname=result.name,
+                name=result.name,
+                time=_seconds(result.elapsed_ns),
+            )
+            tests += 1
+            if not result.ok:
+                _add_failure(testcase, uncovered or result.violations, result.message)
+                failures += 1
+
+        suite.set("tests", str(tests))
+        suite.set("failures", str(failures))
+        suite.set("errors", str(errors))
+        suite.set("skipped", str(skipped))
+        total_tests += tests
+        total_failures += failures
+        total_errors += errors
+        total_skipped += skipped
+
+    root.set("tests", str(total_tests))
+    root.set("failures", str(total_failures))
+    root.set("errors", str(total_errors))
+    root.set("skipped", str(total_skipped))
+    ET.indent(root)
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(root, encoding="unicode")
+
+
+def render_report(results: Sequence[ValidatorResult], output_format: str, wall_ns: int) -> str:
+    if output_format == "json":
+        return render_json(results, wall_ns)
+    if output_format == "junit":
+        return render_junit(results, wall_ns)
+    raise ValueError(f"unknown report format: {output_format}")
@@ -0,0 +1,91 @@
+"""In-process runner for the `npm run validate` suite.
+
+Each validator script is imported once by file path and its `validate()` is called as a
+library function, so the whole suite pays interpreter startup a single time.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+from validation.core import ValidatorResult, run_validator, select_units
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+
+VALIDATORS: dict[str, str] = {
+    "feature-catalog": "validate-feature-catalog.py",
+    "fixture-coverage": "validate-fixture-coverage.py",
+    "legacy-alias-parity": "validate-legacy-alias-parity.py",
+    "billing-canonical-handoff": "validate-billing-canonical-handoff.py",
+    "billing-live-readiness": "validate-billing-live-readiness.py",
+    "qa-evidence-policy": "validate-qa-evidence-policy.py",
+    "docs-links": "validate-doc-links.py",
+    "billing-live-smoke": "run-billing-live-smoke.py",
+    "billing-live-reconciliation": "validate-billing-live-reconciliation.py",
+}
+
+# Default suite; order matches the historical `npm run validate` chain. The billing
+# live smoke validators only run when named or selected by --changed-since.
+SUITE: tuple[str, ...] = (
+    "feature-catalog",
+    "fixture-coverage",
+    "legacy-alias-parity",
+    "billing-canonical-handoff",
+    "billing-live-readiness",
+    "qa-evidence-policy",
+    "docs-links",
+)
+
+_loaded: dict[str, ModuleType] = {}
+
+
+def load_validator(name: str) -> ModuleType:
+    module = _loaded.get(name)
+    if module is not None:
+        return module
+
+    script_path = SCRIPTS_DIR / VALIDATORS[name]
+    module_name = "ficecal_validate_" + name.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load validator script: {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution so dataclasses in the script can resolve their module.
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    _loaded[name] = module
+    return module
+
+
+def run_named(name: str, units: frozenset[str] | None = None) -> ValidatorResult:
+    """Run one validator, restricted to `units` when given."""
+    try:
+        select_units(name, units)
+        module = load_validator(name)
+        return run_validator(name, module.validate)
+    except Exception as exc:  # noqa: BLE001 - a crashing validator must not hide the others
+        return ValidatorResult(name=name, ok=False, message=f"validator crashed: {exc!r}")
+
+
+def run_suite(
+    names: list[str],
+    jobs: int = 1,
+    units: dict[str, frozenset[str] | None] | None = None,
+) -> list[ValidatorResult]:
+    """Run validators and return results in the order of `names`.
+
+    `units` optionally restricts validators to a subset of their validation units.
+    With `jobs > 1` validators run concurrently in a process pool. Results are still
+    returned in suite order, so output and exit code do not depend on completion order.
+    """
+    units = units or {}
+    if jobs <= 1 or len(names) <= 1:
+        return [run_named(name, units.get(name)) for name in names]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+        futures = [pool.submit(run_named, name, units.get(name)) for name in names]
+        return [future.result() for future in futures]
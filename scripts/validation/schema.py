@@ -0,0 +1,268 @@
+"""Declarative payload schemas compiled into specialized check functions.
+
+A schema is a tree of the node types below. `compile_schema` walks it once and
+returns a closure `check(payload, context, path, pointer="")` that raises
+`ValidationError` at the first violation, with the message, JSON pointer and rule
+id the hand-written checks used, e.g.
+`billing.aws.ingest.response.canonical.nRef must be a number` at
+`/canonical/nRef` under rule `number`.
+
+Each node's message is the text after the field name ("must be a number"); a message
+starting with an upper-case letter replaces the whole sentence instead. Optional
+fields append " when provided".
+
+Every decision that depends only on the schema (field order, type tests, messages,
+nested closures) is taken at compile time. On the passing path a check is a
+`dict.get` plus an `isinstance` per field. Nested checks carry their key path and
+join it to the payload's context and pointer only when they fail, so no message or
+pointer string is built for a passing object (array items excepted). Compiled checks
+are memoized per (schema, validator); scripts compiling the same schema share them.
+
+Schemas live in `validation/schemas.py`; relations between fields or payloads
+(request/response run ids, scope matches, provider baselines) stay in the scripts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from validation.core import ValidationError
+
+Check = Callable[..., None]
+# (container, context, pointer, path): validates one field of `container`.
+_FieldCheck = Callable[[dict, str, str, "Path | str | None"], None]
+_NUMBER = (int, float)
+
+
+@dataclass(frozen=True)
+class String:
+    non_empty: bool = True
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class Number:
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class OneOf:
+    values: tuple[str, ...]
+    rule: str = "enum"
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class Const:
+    value: str
+    rule: str = "const"
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class StringArray:
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class Array:
+    """A JSON array; `items` (if given) is checked for every element."""
+
+    items: Any = None
+    non_empty: bool = False
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class Object:
+    fields: tuple[tuple[str, Any], ...]
+    message: str = ""
+
+    @classmethod
+    def of(cls, fields: Mapping[str, Any], message: str = "") -> Object:
+        return cls(tuple(fields.items()), message)
+
+    def extend(self, fields: Mapping[str, Any]) -> Object:
+        return Object(self.fields + tuple(fields.items()), self.message)
+
+    def field(self, name: str) -> Any:
+        return dict(self.fields)[name]
+
+
+@dataclass(frozen=True)
+class Optional:
+    """The field may be absent or null; otherwise it must match `node`."""
+
+    node: Any
+
+
+def _spec(node: Any, optional: bool) -> tuple[Callable[[Any], bool], str, str]:
+    """Return (type test, message suffix, rule) for a node."""
+    suffix = " when provided" if optional else ""
+    if isinstance(node, String):
+        if node.non_empty:
+            test = lambda value: isinstance(value, str) and bool(value)  # noqa: E731
+            default = "must be a non-empty string"
+        else:
+            test = lambda value: isinstance(value, str)  # noqa: E731
+            default = "must be a string"
+        return test, (node.message or default) + suffix, "non-empty-string" if node.non_empty else "type"
+    if isinstance(node, Number):
+        return (lambda value: isinstance(value, _NUMBER)), (node.message or "must be a number") + suffix, "number"
+    if isinstance(node, OneOf):
+        values = frozenset(node.values)
+        default = f"must be one of: {', '.join(node.values)}"
+        return (lambda value: value in values), (node.message or default) + suffix, node.rule
+    if isinstance(node, Const):
+        expected = node.value
+        default = f"must be '{expected}'"
+        return (lambda value: value == expected), (node.message or default) + suffix, node.rule
+    if isinstance(node, StringArray):
+        test = lambda value: isinstance(value, list) and all(isinstance(item, str) for item in value)  # noqa: E731
+        return test, (node.message or "must be an array of strings") + suffix, "string-array"
+    if isinstance(node, Array):
+        if node.non_empty:
+            test = lambda value: isinstance(value, list) and bool(value)  # noqa: E731
+            return test, (node.message or "must be a non-empty array") + suffix, "non-empty-array"
+        return (lambda value: isinstance(value, list)), (node.message or "must be an array") + suffix, "type"
+    if isinstance(node, Object):
+        return (lambda value: isinstance(value, dict)), (node.message or "must be an object") + suffix, "type"
+    raise TypeError(f"unknown schema node: {node!r}")
+
+
+def _message(context: str, message: str) -> str:
+    # A `message` starting with an upper-case letter is a complete sentence.
+    return message if message[:1].isupper() else f"{context} {message}"
+
+
+def _location(keys: tuple[str, ...], context: str, pointer: str) -> tuple[str, str]:
+    """Context and pointer of the value at `keys` below the payload at `context`/`pointer`."""
+    dotted = ".".join(keys)
+    return (f"{context}.{dotted}" if context else dotted), f"{pointer}/{'/'.join(keys)}"
+
+
+def _children(node: Any, validator: str, keys: tuple[str, ...]) -> Callable[[Any, str, str, Any], None] | None:
+    """Compile the checks below the object or array node at `keys`, or None if there are none.
+
+    Nested object checks receive the payload's own context and pointer and only join
+    the key path to them when they fail.
+    """
+    if isinstance(node, Object):
+        field_checks = tuple(_compile_field((*keys, key), child, validator) for key, child in node.fields)
+        if len(field_checks) == 1:
+            return field_checks[0]
+
+        def check_fields(value: dict, context: str, pointer: str, path: Any) -> None:
+            for field_check in field_checks:
+                field_check(value, context, pointer, path)
+
+        return check_fields
+    if isinstance(node, Array) and node.items is not None:
+        item_test, item_message, item_rule = _spec(node.items, False)
+        item_children = _children(node.items, validator, ())
+
+        def check_items(value: list, context: str, pointer: str, path: Any) -> None:
+            if keys:
+                context, pointer = _location(keys, context, pointer)
+            for index, item in enumerate(value):
+                if not item_test(item):
+                    raise ValidationError(
+                        validator,
+                        _message(f"{context}[{index}]", item_message),
+                        path=path,
+                        pointer=f"{pointer}/{index}",
+                        rule=item_rule,
+                    )
+                if item_children is not None:
+                    item_children(item, f"{context}[{index}]", f"{pointer}/{index}", path)
+
+        return check_items
+    return None
+
+
+def _compile_field(keys: tuple[str, ...], node: Any, validator: str) -> _FieldCheck:
+    key = keys[-1]
+    optional = isinstance(node, Optional)
+    if optional:
+        node = node.node
+    test, message, rule = _spec(node, optional)
+    children = _children(node, validator, keys)
+
+    def fail(context: str, pointer: str, path: Any) -> None:
+        field_context, field_pointer = _location(keys, context, pointer)
+        raise ValidationError(
+            validator,
+            _message(field_context, message),
+            path=path,
+            pointer=field_pointer,
+            rule=rule,
+        )
+
+    # Specialized closures for the common shapes keep the passing path to a lookup and a test.
+    if not optional and isinstance(node, String) and node.non_empty:
+
+        def check_string(container: dict, context: str, pointer: str, path: Any) -> None:
+            value = container.get(key)
+            if not isinstance(value, str) or not value:
+                fail(context, pointer, path)
+
+        return check_string
+    if not optional and isinstance(node, Number):
+
+        def check_number(container: dict, context: str, pointer: str, path: Any) -> None:
+            if not isinstance(container.get(key), _NUMBER):
+                fail(context, pointer, path)
+
+        return check_number
+    if children is None and optional:
+
+        def check_optional(container: dict, context: str, pointer: str, path: Any) -> None:
+            value = container.get(key)
+            if value is not None and not test(value):
+                fail(context, pointer, path)
+
+        return check_optional
+    if children is None:
+
+        def check_scalar(container: dict, context: str, pointer: str, path: Any) -> None:
+            if not test(container.get(key)):
+                fail(context, pointer, path)
+
+        return check_scalar
+    if isinstance(node, Object) and not optional:
+
+        def check_object(container: dict, context: str, pointer: str, path: Any) -> None:
+            value = container.get(key)
+            if not isinstance(value, dict):
+                fail(context, pointer, path)
+            children(value, context, pointer, path)
+
+        return check_object
+
+    def check_nested(container: dict, context: str, pointer: str, path: Any) -> None:
+        value = container.get(key)
+        if value is None and optional:
+            return
+        if not test(value):
+            fail(context, pointer, path)
+        children(value, context, pointer, path)
+
+    return check_nested
+
+
+@lru_cache(maxsize=None)
+def compile_schema(schema: Object | Array, validator: str) -> Check:
+    """Compile `schema` into `check(payload, context, path, pointer="")` for `validator`."""
+    test, message, rule = _spec(schema, False)
+    children = _children(schema, validator, ())
+
+    def check(payload: Any, context: str, path: Path | str | None = None, pointer: str = "") -> None:
+        if not test(payload):
+            raise ValidationError(validator, _message(context, message), path=path, pointer=pointer, rule=rule)
+        if children is not None:
+            children(payload, context, pointer, path)
+
+    return check
@@ -0,0 +1,113 @@
+"""Shapes of the contract fixture payloads, shared by the validator scripts.
+
+Compile a schema once per validator with `validation.schema.compile_schema` and call
+the result per payload. Each schema covers structure only (required keys, types and
+allowed values); cross-payload rules stay with the validator that owns them.
+"""
+
+from __future__ import annotations
+
+from validation.schema import Array, Const, Number, Object, OneOf, Optional, String, StringArray
+
+MAPPING_CONFIDENCE = ("low", "medium", "high")
+CANONICAL_NUMBER_KEYS = ("infraTotal", "cudPct", "budgetCap", "nRef")
+SCOPE_KEYS = ("startDate", "endDate", "currency")
+
+# request.valid.json of a billing tool pack.
+REQUEST_VALID = Object.of(
+    {
+        "integrationRunId": String(),
+        **{key: String() for key in SCOPE_KEYS},
+        "authMode": Optional(Const("read-only", rule="read-only-auth")),
+        "credentialRef": Optional(String(non_empty=False)),
+    }
+)
+
+# request.edge-case.<scenario>.json of a billing tool pack: no paired response, so the
+# request must name the mapping profile it is run with.
+REQUEST_EDGE_CASE = REQUEST_VALID.extend({"mappingProfile": String()})
+
+# Requests referenced from parity rows also carry the mapping profile.
+PARITY_REQUEST = REQUEST_EDGE_CASE
+
+# response.expected.json of a billing tool pack.
+RESPONSE_EXPECTED = Object.of(
+    {
+        "integrationRunId": String(),
+        "providerAdapterId": String(),
+        "scope": Object.of({key: String() for key in SCOPE_KEYS}),
+        "canonical": Object.of({key: Number() for key in CANONICAL_NUMBER_KEYS}),
+        "provenance": Object.of(
+            {
+                "sourceVersion": String(),
+                "coveragePct": Number(),
+                "mappingConfidence": OneOf(MAPPING_CONFIDENCE, rule="mapping-confidence"),
+                "warnings": StringArray(),
+            }
+        ),
+    }
+)
+
+# One row of legacy-alias-parity parity.rows.json; rows are checked one unit at a time.
+# legacyResponseFixture is required by the value_equivalence and structural_diff checks.
+PARITY_ROW = Object.of(
+    {
+        **{
+            key: String()
+            for key in ("legacyAlias", "canonicalTool", "requestFixture", "expectedResponseFixture", "parityCheck")
+        },
+        "legacyResponseFixture": Optional(String()),
+    }
+)
+
+# Members of parity.rows.json besides the rows array, which is streamed.
+PARITY_HEADER = Object.of(
+    {"fixtureVersion": String(message="Top-level key 'fixtureVersion' must be a non-empty string")}
+)
+
+# parity.rows.json held in memory; rows are checked with PARITY_ROW.
+PARITY_ROWS = PARITY_HEADER.extend(
+    {"rows": Array(non_empty=True, message="Top-level key 'rows' must be a non-empty list")}
+)
+
+# One provider entry of tests/contracts/live-smoke/billing-live-smoke.config.json.
+SMOKE_PROVIDER = Object.of(
+    {
+        **{
+            key: String()
+            for key in ("providerId", "adapterId", "fixtureToolName", "credentialRefEnv", "smokeCommandEnv")
+        },
+        "varianceThresholdPct": Optional(Number(message="must be numeric")),
+    }
+)
+
+# billing-live-smoke.config.json header; providers are checked with SMOKE_PROVIDER.
+SMOKE_CONFIG = Object.of(
+    {"providers": Array(non_empty=True, message="Live smoke config must include non-empty providers list")}
+)
+
+# One required provenance warning of a provider baseline: `prefix` or `equals`.
+REQUIRED_WARNING = Object.of({"label": String(), "prefix": Optional(String()), "equals": Optional(String())})
+
+# One provider entry of tests/contracts/live-smoke/billing-provider-baselines.json.
+PROVIDER_BASELINE = Object.of(
+    {
+        **{
+            key: String()
+            for key in ("fixtureToolName", "adapterId", "providerLabel", "providerScopeKey", "sourceVersionPrefix")
+        },
+        "requiredWarnings": Array(items=REQUIRED_WARNING),
+    }
+)
+
+# billing-provider-baselines.json: the provider rule table of the canonical handoff.
+PROVIDER_BASELINES = Object.of(
+    {
+        "version": String(),
+        "providers": Array(
+            items=PROVIDER_BASELINE,
+            non_empty=True,
+            message="Provider baseline table must include non-empty providers list",
+        ),
+    }
+)
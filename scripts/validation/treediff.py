@@ -0,0 +1,180 @@
+"""Hash-first comparison of JSON trees.
+
+`TreeDigests` gives every object and array a 16-byte Merkle digest built from its
+children's digests, computed once per node and memoized by identity, so payloads
+compared for many rows are hashed once. `diff_trees` walks two trees top-down and
+skips any pair of subtrees whose digests match without looking inside them; only
+the paths on which the trees differ are visited.
+
+Two digest kinds cover the parity checks:
+
+- `value_digests()`: equal digests mean equal JSON values. Object key order is
+  ignored and numbers compare by value (`100` equals `100.0`; `true` is not `1`)
+- `type_digests()`: only the structure counts (object keys, array lengths, the JSON
+  type of each leaf), so two payloads with different values can still match
+
+Differences are reported minimally: a key present on one side only is one
+`added`/`removed` entry for its whole subtree, and a leaf or a type mismatch is one
+`changed` entry. Paths are JSON pointers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Callable
+
+DIGEST_SIZE = 16
+
+
+def _number_token(value: int | float) -> bytes:
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2**63:
+        value = int(value)
+    return b"#" + repr(value).encode()
+
+
+def _value_token(value: Any) -> bytes:
+    if value is None:
+        return b"n"
+    if value is True:
+        return b"t"
+    if value is False:
+        return b"f"
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    if isinstance(value, (int, float)):
+        return _number_token(value)
+    raise TypeError(f"not a JSON value: {value!r}")
+
+
+def json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    raise TypeError(f"not a JSON value: {value!r}")
+
+
+def _type_token(value: Any) -> bytes:
+    return json_type(value).encode()
+
+
+class TreeDigests:
+    """Memoized Merkle digests of JSON objects and arrays; `leaf` encodes a scalar.
+
+    Scalars are not digested on their own: their encoding goes straight into the
+    parent's hash, and `same` compares two of them directly.
+    """
+
+    def __init__(self, leaf: Callable[[Any], bytes]) -> None:
+        self._leaf = leaf
+        # id(node) -> (node, digest); holding the node keeps its id from being reused.
+        self._memo: dict[int, tuple[Any, bytes]] = {}
+
+    def of(self, node: dict | list) -> bytes:
+        entry = self._memo.get(id(node))
+        if entry is not None:
+            return entry[1]
+        if isinstance(node, dict):
+            hasher = blake2b(b"{", digest_size=DIGEST_SIZE)
+            for key in sorted(node):
+                encoded = key.encode("utf-8", "surrogatepass")
+                hasher.update(len(encoded).to_bytes(4, "little") + encoded)
+                self._update(hasher, node[key])
+        else:
+            hasher = blake2b(b"[", digest_size=DIGEST_SIZE)
+            for item in node:
+                self._update(hasher, item)
+        digest = hasher.digest()
+        self._memo[id(node)] = (node, digest)
+        return digest
+
+    def _update(self, hasher: Any, value: Any) -> None:
+        # Tagged so a child digest and a scalar encoding can never be confused.
+        if isinstance(value, (dict, list)):
+            hasher.update(b"D" + self.of(value))
+        else:
+            token = self._leaf(value)
+            hasher.update(b"L" + len(token).to_bytes(4, "little") + token)
+
+    def same(self, left: Any, right: Any) -> bool:
+        """Whether two values have equal digests (scalars: equal encodings)."""
+        left_tree = isinstance(left, (dict, list))
+        if left_tree != isinstance(right, (dict, list)):
+            return False
+        if left_tree:
+            return self.of(left) == self.of(right)
+        return self._leaf(left) == self._leaf(right)
+
+
+def value_digests() -> TreeDigests:
+    return TreeDigests(_value_token)
+
+
+def type_digests() -> TreeDigests:
+    return TreeDigests(_type_token)
+
+
+@dataclass(frozen=True)
+class Difference:
+    kind: str  # added | removed | changed
+    pointer: str
+    expected: Any = None
+    actual: Any = None
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def diff_trees(
+    expected: Any,
+    actual: Any,
+    digests: TreeDigests,
+    leaf_equal: Callable[[str, Any, Any], bool] | None = None,
+) -> list[Difference]:
+    """Return the paths on which `actual` differs from `expected`, in document order.
+
+    `added` paths exist only in `actual`, `removed` only in `expected`. For two
+    scalars whose digests differ, `leaf_equal(pointer, expected, actual)` may still
+    accept the pair (a numeric tolerance, say).
+    """
+    differences: list[Difference] = []
+
+    def walk(left: Any, right: Any, pointer: str) -> None:
+        if digests.same(left, right):
+            return
+        if isinstance(left, dict) and isinstance(right, dict):
+            for key, value in left.items():
+                child = f"{pointer}/{_escape(key)}"
+                if key in right:
+                    walk(value, right[key], child)
+                else:
+                    differences.append(Difference("removed", child, expected=value))
+            for key, value in right.items():
+                if key not in left:
+                    differences.append(Difference("added", f"{pointer}/{_escape(key)}", actual=value))
+            return
+        if isinstance(left, list) and isinstance(right, list):
+            for index, (item, other) in enumerate(zip(left, right)):
+                walk(item, other, f"{pointer}/{index}")
+            for index in range(len(right), len(left)):
+                differences.append(Difference("removed", f"{pointer}/{index}", expected=left[index]))
+            for index in range(len(left), len(right)):
+                differences.append(Difference("added", f"{pointer}/{index}", actual=right[index]))
+            return
+        scalars = not isinstance(left, (dict, list)) and not isinstance(right, (dict, list))
+        if scalars and leaf_equal is not None and leaf_equal(pointer, left, right):
+            return
+        differences.append(Difference("changed", pointer, expected=left, actual=right))
+
+    walk(expected, actual, "")
+    return differences
@@ -0,0 +1,123 @@
+"""Semantic version ordering for fixture pack version directories.
+
+Pack versions are directory names such as `1.0`, `0.1.0` or `2.0.0-rc.1`. Sorting them
+as strings puts `10.0` before `2.0`, so `VersionIndex` parses each name as a semantic
+version (missing minor/patch components count as 0, `+build` metadata is ignored) and
+orders them by semver precedence: numeric components, then a release above its
+pre-releases, then pre-release identifiers (numeric below alphanumeric).
+
+The index is built once per pack (see `FixturePack.version_index`) and answers
+`latest` in O(1) and range queries with a binary search. Names that are not semantic
+versions are kept apart in `invalid`; they are never `latest`.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterable
+
+VERSION_PATTERN = re.compile(
+    r"(0|[1-9]\d*)(?:\.(0|[1-9]\d*))?(?:\.(0|[1-9]\d*))?"
+    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?\Z"
+)
+
+_Key = tuple  # (major, minor, patch, pre-release precedence, name)
+
+
+def _prerelease_key(prerelease: str) -> tuple:
+    # A release (no pre-release) sorts above all of its pre-releases.
+    if not prerelease:
+        return (1,)
+    identifiers = tuple(
+        (0, int(identifier), "") if identifier.isdigit() else (1, 0, identifier)
+        for identifier in prerelease.split(".")
+    )
+    return (0, identifiers)
+
+
+@dataclass(frozen=True)
+class Version:
+    name: str
+    major: int
+    minor: int
+    patch: int
+    prerelease: str = ""
+    key: _Key = field(default=(), repr=False, compare=False)
+
+    @property
+    def is_prerelease(self) -> bool:
+        return bool(self.prerelease)
+
+
+def parse_version(name: str) -> Version | None:
+    """Parse a version directory name; None if it is not a semantic version."""
+    match = VERSION_PATTERN.match(name)
+    if match is None:
+        return None
+    major, minor, patch = (int(part) if part else 0 for part in match.group(1, 2, 3))
+    prerelease = match.group(4) or ""
+    # The name breaks ties between equal precedences (`1.0` and `1.0.0`) deterministically.
+    key = (major, minor, patch, _prerelease_key(prerelease), name)
+    return Version(name, major, minor, patch, prerelease, key)
+
+
+def _bound(name: str) -> _Key:
+    version = parse_version(name)
+    if version is None:
+        raise ValueError(f"not a semantic version: {name!r}")
+    # Without the name, the bound sorts before every version of equal precedence.
+    return version.key[:4]
+
+
+class VersionIndex:
+    """Versions of one pack in semver order."""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        versions: list[Version] = []
+        invalid: list[str] = []
+        for name in names:
+            version = parse_version(name)
+            if version is None:
+                invalid.append(name)
+            else:
+                versions.append(version)
+        versions.sort(key=lambda version: version.key)
+        self.versions = versions
+        self.invalid = sorted(invalid)
+        self._keys = [version.key for version in versions]
+        self._by_name = {version.name: version for version in versions}
+        releases = [version for version in versions if not version.is_prerelease]
+        # Highest release; a pack with only pre-releases falls back to the highest of those.
+        self.latest: Version | None = releases[-1] if releases else (versions[-1] if versions else None)
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __iter__(self):
+        return iter(self.versions)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> Version | None:
+        return self._by_name.get(name)
+
+    def names(self) -> list[str]:
+        """All version names, lowest first; names that do not parse come before them."""
+        return [*self.invalid, *(version.name for version in self.versions)]
+
+    def range(
+        self,
+        minimum: str | None = None,
+        below: str | None = None,
+        include_prereleases: bool = False,
+    ) -> list[Version]:
+        """Versions with `minimum <= version < below`, lowest first."""
+        start = bisect_left(self._keys, _bound(minimum)) if minimum is not None else 0
+        end = bisect_left(self._keys, _bound(below)) if below is not None else len(self._keys)
+        selected = self.versions[start:end]
+        if include_prereleases:
+            return selected
+        return [version for version in selected if not version.is_prerelease]
@@ -0,0 +1,198 @@
+"""Single-pass, pruned repository walk.
+
+`walk_files` visits the tree once with `os.scandir` and yields the repository-relative
+paths matching a set of include globs (`docs/**/*.md`, `packages/**/README.md`). It
+prunes before descending:
+
+- `.git` and any directory named in `exclude_dirs`
+- paths ignored by `.gitignore` files, read as the walk reaches their directory
+- directories that no include pattern can match below (`docs/**/*.md` never enters
+  `src/`, `README.md` only looks at the root)
+
+Glob syntax follows git: `*` and `?` do not cross `/`, `**` spans directories, and a
+pattern with a slash is anchored to the root. The `.gitignore` support covers the
+forms used in practice (comments, `!` negation, trailing `/` for directories, leading
+or inner `/` for anchoring, `**`) but not `core.excludesFile` or `.git/info/exclude`.
+Symlinked directories are not followed.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Iterator, Sequence
+
+ALWAYS_EXCLUDED = frozenset({".git"})
+
+
+def _translate(pattern: str) -> str:
+    """Translate a git-style glob to a regex (without anchors)."""
+    out: list[str] = []
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if pattern.startswith("**/", idx):
+            out.append("(?:.*/)?")
+            idx += 3
+            continue
+        if pattern.startswith("**", idx):
+            out.append(".*")
+            idx += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", idx + 2 if pattern[idx + 1 : idx + 2] in {"!", "^"} else idx + 1)
+            if end < 0:
+                out.append(re.escape(char))
+            else:
+                body = pattern[idx + 1 : end]
+                if body[:1] in {"!", "^"}:
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                idx = end
+        elif char == "\\" and idx + 1 < len(pattern):
+            idx += 1
+            out.append(re.escape(pattern[idx]))
+        else:
+            out.append(re.escape(char))
+        idx += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _parse_gitignore(text: str) -> list[_IgnoreRule]:
+    rules: list[_IgnoreRule] = []
+    for line in text.splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        pattern = line.rstrip(" ") if not line.endswith("\\ ") else line
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\"):
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            continue
+        if "/" in pattern:
+            pattern = pattern.lstrip("/")
+        else:
+            pattern = "**/" + pattern
+        rules.append(_IgnoreRule(re.compile(_translate(pattern) + r"\Z"), negate, dir_only))
+    return rules
+
+
+@dataclass(frozen=True)
+class _IgnoreFile:
+    base: str  # directory of the .gitignore, relative to the walk root ("" for the root)
+    rules: list[_IgnoreRule]
+
+
+def _ignored(stack: Sequence[_IgnoreFile], rel: str, is_dir: bool) -> bool:
+    ignored = False
+    for ignore_file in stack:
+        if ignore_file.base:
+            if not rel.startswith(ignore_file.base + "/"):
+                continue
+            local = rel[len(ignore_file.base) + 1 :]
+        else:
+            local = rel
+        for rule in ignore_file.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(local):
+                ignored = not rule.negate
+    return ignored
+
+
+class IncludePatterns:
+    """Include globs compiled into one matcher plus per-segment prefixes for pruning."""
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.patterns = tuple(patterns)
+        self._match = re.compile("|".join(f"(?:{_translate(pattern)})" for pattern in patterns) + r"\Z")
+        self._segments = [
+            [None if segment == "**" else re.compile(_translate(segment) + r"\Z") for segment in pattern.split("/")]
+            for pattern in patterns
+        ]
+
+    def matches(self, rel: str) -> bool:
+        return self._match.match(rel) is not None
+
+    def may_contain(self, dir_parts: Sequence[str]) -> bool:
+        """Return whether any pattern can match a path below the directory `dir_parts`."""
+        for segments in self._segments:
+            # The last segment names the file, so a directory must match a strict
+            # prefix of the pattern, unless the pattern ends in `**`.
+            depth = len(segments) if segments[-1] is None else len(segments) - 1
+            for idx, part in enumerate(dir_parts):
+                if idx >= depth:
+                    break
+                segment = segments[idx]
+                if segment is None:
+                    return True
+                if not segment.match(part):
+                    break
+            else:
+                return True
+        return False
+
+
+def walk_files(
+    root: Path,
+    include: Sequence[str] | IncludePatterns,
+    exclude_dirs: Collection[str] = (),
+    gitignore: bool = True,
+) -> Iterator[str]:
+    """Yield `/`-separated paths under `root` that match `include`.
+
+    Order is deterministic: a directory's files in name order, then its subdirectories.
+    """
+    patterns = include if isinstance(include, IncludePatterns) else IncludePatterns(include)
+    excluded = ALWAYS_EXCLUDED | set(exclude_dirs)
+    root_stack: tuple[_IgnoreFile, ...] = ()
+    pending: list[tuple[str, tuple[str, ...], tuple[_IgnoreFile, ...]]] = [("", (), root_stack)]
+    while pending:
+        rel_dir, parts, stack = pending.pop()
+        directory = os.path.join(root, rel_dir) if rel_dir else str(root)
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        if gitignore and any(entry.name == ".gitignore" for entry in entries):
+            try:
+                with open(os.path.join(directory, ".gitignore"), encoding="utf-8") as handle:
+                    rules = _parse_gitignore(handle.read())
+            except (OSError, UnicodeDecodeError):
+                rules = []
+            if rules:
+                stack = (*stack, _IgnoreFile(rel_dir, rules))
+
+        subdirs: list[tuple[str, tuple[str, ...], tuple[_IgnoreFile, ...]]] = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in excluded:
+                    continue
+                child_parts = (*parts, entry.name)
+                if not patterns.may_contain(child_parts) or _ignored(stack, rel, True):
+                    continue
+                subdirs.append((rel, child_parts, stack))
+            elif patterns.matches(rel) and entry.is_file() and not _ignored(stack, rel, False):
+                yield rel
+        # Reversed so the stack pops subdirectories in name order.
+        pending.extend(reversed(subdirs))
@@ -0,0 +1,480 @@
+"""Watch mode for `scripts/validate.py --watch`.
+
+The daemon keeps validator modules, the fixture index (with parsed fixtures), the
+doc-link path index and the unit caches in memory, then re-runs only the validators
+affected by each batch of file changes, using the same rules as `--changed-since`
+(`validation.changes`). Each batch refreshes the resident state first: the indexes
+rescan around the changed paths, and cached units reading a changed path are
+re-verified; a batch of lost events drops all of it. Changes
+are detected with inotify through ctypes on Linux, or by polling `os.scandir`
+snapshots elsewhere or when inotify is unavailable.
+
+The latest results are served on a Unix domain socket
+(`.cache/ficecal-validate/watch.sock` by default). A client sends one command line and
+gets one JSON document back:
+
+- `status`: results of the last completed run; waits for a run in progress first
+- `rerun`: re-run every watched validator, then return the status
+- `ping`: liveness check
+
+`scripts/validate.py --status` is the client used by editors and pre-commit hooks.
+Editing a validator script or the `validation` package restarts the daemon in place.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import json
+import os
+import queue
+import select
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+from validation.cache import invalidate_resident, keep_resident
+from validation.changes import Change, plan_changes
+from validation.core import ValidatorResult
+from validation.fixtures import FIXTURE_ROOT, fixture_index
+from validation.pathindex import path_index
+from validation.paths import REPO_ROOT
+from validation.report import render_json
+from validation.runner import VALIDATORS, run_named
+
+SOCKET_PATH = REPO_ROOT / ".cache" / "ficecal-validate" / "watch.sock"
+EXCLUDED_DIRS = {".git", "node_modules", ".cache", "__pycache__", ".windsurf", ".pnpm-store"}
+DEBOUNCE_SECONDS = 0.03
+DEFAULT_POLL_INTERVAL = 0.5
+STATUS_TIMEOUT_SECONDS = 60.0
+RERUN = "rerun"
+
+
+def _rel(path: str) -> str:
+    return Path(path).relative_to(REPO_ROOT).as_posix()
+
+
+def _walk_dirs(root: Path) -> Iterator[str]:
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        yield directory
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in EXCLUDED_DIRS:
+                        pending.append(entry.path)
+        except OSError:
+            continue
+
+
+def _walk_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    for directory in _walk_dirs(root):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
+
+class PollingWatcher:
+    """Detect changes by diffing (mtime, size) snapshots of the tree."""
+
+    name = "polling"
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        for entry in _walk_files(self.root):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self) -> list[Change] | None:
+        while True:
+            time.sleep(self.interval)
+            current = self._scan()
+            changes = [
+                Change("M" if path in self._snapshot else "A", _rel(path))
+                for path, state in current.items()
+                if self._snapshot.get(path) != state
+            ]
+            changes.extend(Change("D", _rel(path)) for path in self._snapshot.keys() - current.keys())
+            self._snapshot = current
+            if changes:
+                return sorted(changes, key=lambda change: change.path)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher over ctypes (Linux only)."""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = (
+        IN_MODIFY
+        | IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError(errno.ENOSYS, "libc not found")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.root = root
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dirs: dict[int, str] = {}
+        try:
+            self._add_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, root: Path | str) -> list[str]:
+        """Watch every directory under `root`; return the files already inside."""
+        found: list[str] = []
+        for directory in _walk_dirs(Path(root)):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOENT:
+                    continue
+                # ENOSPC: fs.inotify.max_user_watches exhausted.
+                raise OSError(err, f"inotify_add_watch({directory}): {os.strerror(err)}")
+            self._dirs[wd] = directory
+            try:
+                with os.scandir(directory) as it:
+                    found.extend(entry.path for entry in it if entry.is_file(follow_symlinks=False))
+            except OSError:
+                continue
+        return found
+
+    def _read_events(self) -> list[Change] | None:
+        changes: list[Change] = []
+        while True:
+            try:
+                data = os.read(self.fd, 1 << 16)
+            except BlockingIOError:
+                return changes
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    return None
+                if mask & self.IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, name)
+                if mask & self.IN_ISDIR:
+                    if name in EXCLUDED_DIRS:
+                        continue
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        changes.extend(Change("A", _rel(found)) for found in self._add_tree(path))
+                    elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                        # Files under a removed directory are not reported one by one.
+                        return None
+                    continue
+                if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    changes.append(Change("D", _rel(path)))
+                elif mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changes.append(Change("A", _rel(path)))
+                else:
+                    changes.append(Change("M", _rel(path)))
+
+    def wait(self) -> list[Change] | None:
+        select.select([self.fd], [], [])
+        changes = self._read_events()
+        # Debounce: editors often write a file in several steps.
+        while changes is not None and select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+            more = self._read_events()
+            changes = None if more is None else changes + more
+        if changes is None:
+            return None
+        merged: dict[str, Change] = {}
+        for change in changes:
+            previous = merged.get(change.path)
+            if previous is not None and previous.status == "A" and change.status == "M":
+                continue
+            merged[change.path] = change
+        return [merged[path] for path in sorted(merged)]
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def make_watcher(force_polling: bool, poll_interval: float) -> InotifyWatcher | PollingWatcher:
+    if not force_polling:
+        try:
+            return InotifyWatcher(REPO_ROOT)
+        except OSError as exc:
+            print(f"[validate] inotify unavailable ({exc}); falling back to polling", file=sys.stderr)
+    return PollingWatcher(REPO_ROOT, poll_interval)
+
+
+class WatchState:
+    """Latest results, shared between the watch loop and the socket server."""
+
+    def __init__(self, names: list[str]) -> None:
+        self.names = names
+        self.results: dict[str, ValidatorResult] = {}
+        self.generation = 0
+        self.running = False
+        self.last_wall_ns = 0
+        self.last_changes: list[str] = []
+        self.condition = threading.Condition()
+        # Change batches from the watcher thread and rerun requests from clients. A
+        # batch of None means events were lost and everything must be re-checked.
+        self.events: queue.Queue[list[Change] | str | None] = queue.Queue()
+
+    def request_rerun(self) -> int:
+        """Queue a full re-run and return the generation that will include it."""
+        with self.condition:
+            target = self.generation + (2 if self.running else 1)
+        self.events.put(RERUN)
+        return target
+
+    def snapshot(self, generation: int = 0) -> dict:
+        """Return the latest results once no run is in progress and `generation` is reached."""
+        with self.condition:
+            self.condition.wait_for(
+                lambda: not self.running and self.generation >= generation,
+                timeout=STATUS_TIMEOUT_SECONDS,
+            )
+            results = [self.results[name] for name in self.names if name in self.results]
+            payload = json.loads(render_json(results, self.last_wall_ns))
+            payload.update(
+                {
+                    "generation": self.generation,
+                    "running": self.running,
+                    "lastChanges": self.last_changes,
+                }
+            )
+            return payload
+
+
+class _StatusHandler(socketserver.StreamRequestHandler):
+    server: "_StatusServer"
+
+    def handle(self) -> None:
+        command = self.rfile.readline().decode("utf-8").strip() or "status"
+        state = self.server.state
+        if command == "ping":
+            payload: dict = {"ok": True, "pid": os.getpid()}
+        elif command == "rerun":
+            payload = state.snapshot(state.request_rerun())
+        elif command == "status":
+            payload = state.snapshot()
+        else:
+            payload = {"error": f"unknown command: {command}"}
+        self.wfile.write(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+class _StatusServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, state: WatchState) -> None:
+        self.state = state
+        super().__init__(str(path), _StatusHandler)
+
+
+def _start_server(socket_path: Path, state: WatchState) -> _StatusServer:
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        try:
+            query(socket_path, "ping", timeout=0.5)
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise OSError(errno.EADDRINUSE, f"a watch daemon is already serving {socket_path}")
+    server = _StatusServer(socket_path, state)
+    threading.Thread(target=server.serve_forever, name="validate-status", daemon=True).start()
+    return server
+
+
+def query(socket_path: Path, command: str = "status", timeout: float = STATUS_TIMEOUT_SECONDS) -> dict:
+    """Send one command to a running watch daemon and return its JSON reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(command.encode("utf-8") + b"\n")
+        chunks: list[bytes] = []
+        while True:
+            chunk = client.recv(1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _refresh_resident(changes: list[Change] | None) -> None:
+    if changes is None:
+        fixture_index.cache_clear()
+        path_index.cache_clear()
+        invalidate_resident(None)
+        return
+    fixture_prefix = FIXTURE_ROOT.relative_to(REPO_ROOT).as_posix() + "/"
+    changed = [REPO_ROOT / change.path for change in changes if change.path.startswith(fixture_prefix)]
+    if changed:
+        fixture_index(FIXTURE_ROOT).refresh(changed)
+    path_index(REPO_ROOT).refresh(changes)
+    invalidate_resident(change.path for change in changes)
+
+
+def _sources_changed(changes: list[Change] | None) -> bool:
+    if changes is None:
+        return False
+    scripts = {f"scripts/{script}" for script in VALIDATORS.values()}
+    return any(
+        change.path in scripts or (change.path.startswith("scripts/validation/") and change.path.endswith(".py"))
+        for change in changes
+    )
+
+
+def _run(state: WatchState, names: list[str], changes: list[str]) -> None:
+    with state.condition:
+        state.running = True
+    started = time.perf_counter_ns()
+    results = [run_named(name) for name in names]
+    wall_ns = time.perf_counter_ns() - started
+    with state.condition:
+        for result in results:
+            state.results[result.name] = result
+        state.generation += 1
+        state.running = False
+        state.last_wall_ns = wall_ns
+        state.last_changes = changes
+        state.condition.notify_all()
+
+    failed = [name for name in state.names if name in state.results and not state.results[name].ok]
+    for result in results:
+        if not result.ok:
+            print(result.render())
+    status = f"ERROR ({', '.join(failed)})" if failed else "OK"
+    print(
+        f"[validate] watch #{state.generation}: ran {', '.join(names)} in {wall_ns / 1e6:.1f}ms; suite {status}",
+        flush=True,
+    )
+
+
+def _watch_thread(watcher: InotifyWatcher | PollingWatcher, events: queue.Queue) -> None:
+    while True:
+        try:
+            events.put(watcher.wait())
+        except (OSError, ValueError):
+            # The watcher was closed on shutdown: reading its fd raises OSError, while
+            # select() on the fd it was reset to (-1) raises ValueError.
+            return
+
+
+def _next_batch(events: queue.Queue) -> list[Change] | None:
+    """Block for the next event and merge anything else already queued."""
+    pending = [events.get()]
+    while True:
+        try:
+            pending.append(events.get_nowait())
+        except queue.Empty:
+            break
+    if any(item is None or item == RERUN for item in pending):
+        return None
+    return [change for batch in pending for change in batch]
+
+
+def watch(
+    names: list[str],
+    socket_path: Path = SOCKET_PATH,
+    force_polling: bool = False,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> None:
+    """Run `names`, then re-run affected validators on every change until interrupted."""
+    state = WatchState(names)
+    keep_resident()
+    server = _start_server(socket_path, state)
+    watcher = make_watcher(force_polling, poll_interval)
+    print(f"[validate] watching {REPO_ROOT} ({watcher.name}); status socket {socket_path}", flush=True)
+    threading.Thread(target=_watch_thread, args=(watcher, state.events), name="validate-watch", daemon=True).start()
+
+    restart = False
+    # Let `kill` stop the daemon through the same cleanup as Ctrl-C.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        _run(state, names, [])
+        while True:
+            changes = _next_batch(state.events)
+            if _sources_changed(changes):
+                print("[validate] validator sources changed; restarting watch daemon", flush=True)
+                restart = True
+                return
+            _refresh_resident(changes)
+            if changes is None:
+                _run(state, names, ["*"])
+                continue
+
+            plan = plan_changes(changes, VALIDATORS, tuple(names))
+            affected = [name for name in names if name in plan]
+            if not affected:
+                continue
+            _run(state, affected, [change.path for change in changes])
+    except KeyboardInterrupt:
+        print("[validate] watch stopped")
+    finally:
+        server.shutdown()
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        watcher.close()
+        if restart:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            os.execv(sys.executable, [sys.executable, *sys.argv])